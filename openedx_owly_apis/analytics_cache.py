@@ -0,0 +1,85 @@
+"""
+Per-course cache for analytics results.
+
+Course analytics are cached for a short TTL under a per-course version
+number. Enrollment and discussion configuration signals (see
+``openedx_owly_apis.signals``) bump that version, so every cached result for
+the course is dropped at once without having to know its cache keys.
+"""
+
+import functools
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+ANALYTICS_CACHE_KEY_PREFIX = "openedx_owly_apis:analytics"
+ANALYTICS_CACHE_TIMEOUT_SECONDS = 60
+
+
+def _version_key(course_id):
+    # Signals pass CourseKey objects while views pass strings; both render the same.
+    return "{}:version:{}".format(ANALYTICS_CACHE_KEY_PREFIX, str(course_id))
+
+
+def _result_key(kind, course_id, version, extra=()):
+    parts = [ANALYTICS_CACHE_KEY_PREFIX, kind, str(course_id), "v{}".format(version)]
+    parts.extend(str(part) for part in extra)
+    return ":".join(parts)
+
+
+def get_cache_timeout():
+    """Return the analytics cache TTL in seconds."""
+    return getattr(settings, "OWLY_ANALYTICS_CACHE_TIMEOUT", ANALYTICS_CACHE_TIMEOUT_SECONDS)
+
+
+def get_course_version(course_id):
+    """Return the current analytics cache version for ``course_id``."""
+    version = cache.get(_version_key(course_id))
+    if version is None:
+        cache.add(_version_key(course_id), 1, None)
+        version = cache.get(_version_key(course_id), 1)
+    return version
+
+
+def invalidate_course_analytics(course_id):
+    """Drop every cached analytics result for ``course_id``."""
+    if not course_id:
+        return
+    key = _version_key(course_id)
+    if not cache.add(key, 2, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # The version expired between add() and incr(); start over.
+            cache.set(key, 2, None)
+
+
+def cache_course_analytics(kind):
+    """
+    Cache the result of a course analytics function for a short TTL.
+
+    The wrapped function takes ``course_id`` as its first argument; any
+    keyword arguments become part of the cache key. Results without a
+    ``course_id`` and error results are never cached. Returned results carry
+    ``cached_at``, the time they were computed.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(course_id=None, **kwargs):
+            if not course_id:
+                return func(course_id, **kwargs)
+
+            extra = ["{}={}".format(name, kwargs[name]) for name in sorted(kwargs)]
+            key = _result_key(kind, course_id, get_course_version(course_id), extra)
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+            result = func(course_id, **kwargs)
+            if isinstance(result, dict) and "error" not in result:
+                result["cached_at"] = timezone.now().isoformat()
+                cache.set(key, result, get_cache_timeout())
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,132 @@
+"""
+Precomputed analytics snapshots.
+
+For courses with large enrollments, computing enrollment and detailed
+analytics on a cache miss is expensive. A periodic task
+(``schedule_analytics_snapshots_task``) recomputes those payloads for every
+active course in chunks and stores the latest one per course and kind in
+``OwlyAnalyticsSnapshot``. Analytics endpoints serve the snapshot while it
+is younger than ``OWLY_ANALYTICS_SNAPSHOT_MAX_AGE`` seconds and the course's
+analytics cache version (see ``openedx_owly_apis.analytics_cache``) has not
+changed since it was computed.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from openedx_owly_apis.analytics_cache import get_course_version
+from openedx_owly_apis.models import OwlyAnalyticsSnapshot
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAX_AGE_SECONDS = 60 * 60
+SNAPSHOT_CHUNK_SIZE = 50
+
+
+def get_snapshot_max_age():
+    """Return how many seconds a snapshot may be served for."""
+    return getattr(settings, "OWLY_ANALYTICS_SNAPSHOT_MAX_AGE", SNAPSHOT_MAX_AGE_SECONDS)
+
+
+def get_snapshot_chunk_size():
+    """Return how many courses one snapshot task computes."""
+    return getattr(settings, "OWLY_ANALYTICS_SNAPSHOT_CHUNK_SIZE", SNAPSHOT_CHUNK_SIZE)
+
+
+def get_analytics_snapshot(course_id, kind):
+    """
+    Return the latest ``kind`` snapshot payload for ``course_id``, or ``None``.
+
+    Snapshots older than the configured max age, or computed before the
+    course's analytics were last invalidated, are ignored. The payload
+    carries ``snapshot_at``, the time it was computed.
+    """
+    fresh_after = timezone.now() - timedelta(seconds=get_snapshot_max_age())
+    snapshot = (
+        OwlyAnalyticsSnapshot.objects
+        .filter(
+            course_id=str(course_id),
+            kind=kind,
+            computed_at__gte=fresh_after,
+            cache_version=get_course_version(course_id),
+        )
+        .only("payload", "computed_at")
+        .first()
+    )
+    if snapshot is None:
+        return None
+    return {**snapshot.payload, "snapshot_at": snapshot.computed_at.isoformat()}
+
+
+def store_analytics_snapshot(course_id, kind, payload, cache_version):
+    """
+    Save ``payload`` as the latest ``kind`` snapshot for ``course_id``.
+
+    ``cache_version`` is the course's analytics cache version read before
+    the payload was computed, so a change made meanwhile outdates it.
+    """
+    OwlyAnalyticsSnapshot.objects.update_or_create(
+        course_id=str(course_id),
+        kind=kind,
+        defaults={"payload": payload, "computed_at": timezone.now(), "cache_version": cache_version},
+    )
+
+
+def _snapshot_builders():
+    """Return the uncached logic function computing each snapshot kind."""
+    from openedx_owly_apis.operations import analytics  # pylint: disable=import-outside-toplevel
+
+    builders = {
+        OwlyAnalyticsSnapshot.KIND_ENROLLMENTS: analytics.get_enrollments_analytics_logic,
+        OwlyAnalyticsSnapshot.KIND_DETAILED: analytics.get_detailed_analytics_logic,
+    }
+    # Bypass the short-lived analytics cache; snapshots must be computed live.
+    return {kind: getattr(func, "__wrapped__", func) for kind, func in builders.items()}
+
+
+def active_course_ids():
+    """Return the ids of courses that have not ended yet."""
+    # pylint: disable=import-outside-toplevel,import-error
+    from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+    now = timezone.now()
+    return [
+        str(course_id)
+        for course_id in CourseOverview.objects.filter(Q(end__isnull=True) | Q(end__gte=now))
+        .order_by("id")
+        .values_list("id", flat=True)
+    ]
+
+
+def chunked(items, size):
+    """Split ``items`` into lists of at most ``size`` elements."""
+    return [items[index:index + size] for index in range(0, len(items), size)]
+
+
+def refresh_analytics_snapshots(course_ids):
+    """
+    Recompute and store every snapshot kind for ``course_ids``.
+
+    Returns the number of snapshots stored and the ``course_id:kind`` pairs
+    that failed; one failing course does not stop the others.
+    """
+    builders = _snapshot_builders()
+    stored, failed = 0, []
+    for course_id in course_ids:
+        for kind, build in builders.items():
+            cache_version = get_course_version(course_id)
+            try:
+                payload = build(course_id)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to compute %s analytics snapshot for %s", kind, course_id)
+                payload = None
+            if not isinstance(payload, dict) or "error" in payload:
+                failed.append(f"{course_id}:{kind}")
+                continue
+            store_analytics_snapshot(course_id, kind, payload, cache_version)
+            stored += 1
+    return {"stored": stored, "failed": failed}
@@ -3,7 +3,64 @@ openedx_owly_apis Django application initialization.
 """
 
 from django.apps import AppConfig
-from edx_django_utils.plugins.constants import PluginSettings, PluginURLs
+from edx_django_utils.plugins.constants import PluginSettings, PluginSignals, PluginURLs
+
+_POST_SAVE = 'django.db.models.signals.post_save'
+_POST_DELETE = 'django.db.models.signals.post_delete'
+_COURSE_ENROLLMENT = 'common.djangoapps.student.models.CourseEnrollment'
+_COURSE_OVERVIEW = 'openedx.core.djangoapps.content.course_overviews.models.CourseOverview'
+_COURSE_ACCESS_ROLE = 'common.djangoapps.student.models.CourseAccessRole'
+
+# Keep cached course analytics (openedx_owly_apis.analytics_cache) and the
+# platform counters (openedx_owly_apis.platform_counters) in sync with
+# enrollments, course overviews, course modes and discussion configuration,
+# and cached role checks (openedx_owly_apis.role_cache) with course roles.
+_SIGNAL_RECEIVERS = [
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_enroll_status_change',
+        PluginSignals.SIGNAL_PATH: 'common.djangoapps.student.signals.ENROLL_STATUS_CHANGE',
+    },
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_course_enrollment_saved',
+        PluginSignals.SIGNAL_PATH: _POST_SAVE,
+        PluginSignals.SENDER_PATH: _COURSE_ENROLLMENT,
+    },
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_course_enrollment_deleted',
+        PluginSignals.SIGNAL_PATH: _POST_DELETE,
+        PluginSignals.SENDER_PATH: _COURSE_ENROLLMENT,
+    },
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_course_overview_saved',
+        PluginSignals.SIGNAL_PATH: _POST_SAVE,
+        PluginSignals.SENDER_PATH: _COURSE_OVERVIEW,
+    },
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_course_overview_deleted',
+        PluginSignals.SIGNAL_PATH: _POST_DELETE,
+        PluginSignals.SENDER_PATH: _COURSE_OVERVIEW,
+    },
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_course_mode_saved',
+        PluginSignals.SIGNAL_PATH: _POST_SAVE,
+        PluginSignals.SENDER_PATH: 'common.djangoapps.course_modes.models.CourseMode',
+    },
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_discussions_configuration_saved',
+        PluginSignals.SIGNAL_PATH: _POST_SAVE,
+        PluginSignals.SENDER_PATH: 'openedx.core.djangoapps.discussions.models.DiscussionsConfiguration',
+    },
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_course_access_role_changed',
+        PluginSignals.SIGNAL_PATH: _POST_SAVE,
+        PluginSignals.SENDER_PATH: _COURSE_ACCESS_ROLE,
+    },
+    {
+        PluginSignals.RECEIVER_FUNC_NAME: 'handle_course_access_role_changed',
+        PluginSignals.SIGNAL_PATH: _POST_DELETE,
+        PluginSignals.SENDER_PATH: _COURSE_ACCESS_ROLE,
+    },
+]
 
 
 class OpenedxOwlyApisConfig(AppConfig):
@@ -26,6 +83,14 @@ class OpenedxOwlyApisConfig(AppConfig):
                 PluginURLs.RELATIVE_PATH: 'urls',
             },
         },
+        PluginSignals.CONFIG: {
+            'cms.djangoapp': {
+                PluginSignals.RECEIVERS: _SIGNAL_RECEIVERS,
+            },
+            'lms.djangoapp': {
+                PluginSignals.RECEIVERS: _SIGNAL_RECEIVERS,
+            },
+        },
         PluginSettings.CONFIG: {
             'cms.djangoapp': {
                 'common': {
@@ -34,7 +99,7 @@ class OpenedxOwlyApisConfig(AppConfig):
             },
             'lms.djangoapp': {
                 'common': {
-                    PluginSettings.RELATIVE_PATH: 'settings.common',
+                    PluginSettings.RELATIVE_PATH: 'settings.lms',
                 },
             },
         },
@@ -0,0 +1,43 @@
+"""Job helpers for async bulk cohort assignment."""
+
+from django.conf import settings
+
+from openedx_owly_apis.job_store import create_job, get_job, update_job
+from openedx_owly_apis.models import OwlyAsyncJob
+from openedx_owly_apis.task_routing import route_params
+
+JOB_TYPE = OwlyAsyncJob.TYPE_COHORT_ASSIGNMENT
+
+COHORT_BULK_SYNC_LIMIT = 200
+
+
+def get_cohort_bulk_sync_limit():
+    """Return the largest bulk cohort assignment that runs within the request."""
+    return getattr(settings, "OWLY_COHORT_BULK_SYNC_LIMIT", COHORT_BULK_SYNC_LIMIT)
+
+
+def create_cohort_assignment_job(course_id, cohort_id, user_count, user_identifier=None, route=None):
+    """
+    Create a pending async cohort assignment job entry and return its payload.
+
+    ``route`` is the ``openedx_owly_apis.task_routing`` decision for the job;
+    its lane and size estimate are recorded on the job.
+    """
+    return create_job(
+        JOB_TYPE,
+        course_id=course_id,
+        user_identifier=user_identifier,
+        cohort_id=cohort_id,
+        user_count=user_count,
+        **route_params(route),
+    )
+
+
+def get_cohort_assignment_job(job_id):
+    """Return the async cohort assignment job payload, if present."""
+    return get_job(job_id, job_type=JOB_TYPE)
+
+
+def update_cohort_assignment_job(job_id, **changes):
+    """Update an existing async cohort assignment job and return its payload."""
+    return update_job(job_id, **changes)
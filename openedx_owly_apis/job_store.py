@@ -0,0 +1,393 @@
+"""
+Durable job store for async Owly jobs.
+
+Jobs are persisted in ``OwlyAsyncJob`` so they can be listed and survive cache
+eviction. The Django cache sits in front of the table to serve the hot status
+reads issued by clients polling a running job.
+
+Job results can be large (every block created or published), so they are kept
+out of the status payload: the job row only carries a ``result_summary`` of
+scalar fields and list counts, and the full result is stored zlib-compressed
+in ``OwlyAsyncJobResult`` and read page by page on demand.
+"""
+
+import json
+import logging
+import time
+import zlib
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from openedx_owly_apis.models import OwlyAsyncJob, OwlyAsyncJobResult
+
+logger = logging.getLogger(__name__)
+
+JOB_CACHE_KEY_PREFIX = "openedx_owly_apis:job"
+JOB_CACHE_TIMEOUT_SECONDS = 60 * 60
+# Jobs that can still change are cached briefly so a read that races a write
+# cannot pin a stale status for long.
+ACTIVE_JOB_CACHE_TIMEOUT_SECONDS = 5
+PARAMS_UPDATE_MAX_ATTEMPTS = 5
+
+LONG_POLL_MAX_WAIT_SECONDS = 30
+LONG_POLL_INTERVAL_SECONDS = 0.5
+STREAM_MAX_DURATION_SECONDS = 5 * 60
+STREAM_HEARTBEAT_SECONDS = 15
+
+TERMINAL_STATUSES = (OwlyAsyncJob.STATUS_SUCCESS, OwlyAsyncJob.STATUS_FAILED)
+
+# Statuses only move forward: pending -> running -> success | failed.
+_STATUS_RANK = {
+    OwlyAsyncJob.STATUS_PENDING: 0,
+    OwlyAsyncJob.STATUS_RUNNING: 1,
+    OwlyAsyncJob.STATUS_SUCCESS: 2,
+    OwlyAsyncJob.STATUS_FAILED: 2,
+}
+
+_JOB_FIELDS = (
+    "status",
+    "course_id",
+    "requested_by",
+    "task_id",
+    "progress_message",
+    "error",
+)
+
+# List-valued result keys that can be paged through, in order of preference.
+RESULT_SECTIONS = ("created_structure", "published_items", "results")
+
+
+def _job_cache_key(job_id):
+    return "{}:{}".format(JOB_CACHE_KEY_PREFIX, job_id)
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def serialize_job(job):
+    """Return the public payload for an ``OwlyAsyncJob`` row."""
+    payload = dict(job.params or {})
+    payload.update({
+        "job_id": job.job_id,
+        "job_type": job.job_type,
+        "status": job.status,
+        "course_id": job.course_id,
+        "requested_by": job.requested_by,
+        "task_id": job.task_id,
+        "progress_message": job.progress_message,
+        "error": job.error,
+        "result_summary": job.result_summary,
+        "created_at": _isoformat(job.created_at),
+        "updated_at": _isoformat(job.updated_at),
+        "completed_at": _isoformat(job.completed_at),
+    })
+    return payload
+
+
+def summarize_result(result):
+    """
+    Return a small summary of a job ``result`` for the status payload.
+
+    Scalar fields are kept as-is, lists are replaced by a ``<key>_count``
+    entry and nested objects are dropped.
+    """
+    if not isinstance(result, dict):
+        return {}
+    summary = {}
+    for key, value in result.items():
+        if isinstance(value, (list, tuple)):
+            summary[f"{key}_count"] = len(value)
+        elif not isinstance(value, dict):
+            summary[key] = value
+    return summary
+
+
+def _store_result(job_id, result, now):
+    if result is None:
+        OwlyAsyncJobResult.objects.filter(job_id=job_id).delete()
+        return
+    raw = json.dumps(result, cls=DjangoJSONEncoder).encode("utf-8")
+    OwlyAsyncJobResult.objects.update_or_create(
+        job_id=job_id,
+        defaults={"data": zlib.compress(raw), "size": len(raw), "updated_at": now},
+    )
+
+
+def _cache_job(payload):
+    timeout = (
+        JOB_CACHE_TIMEOUT_SECONDS
+        if payload.get("status") in TERMINAL_STATUSES
+        else ACTIVE_JOB_CACHE_TIMEOUT_SECONDS
+    )
+    cache.set(_job_cache_key(payload["job_id"]), payload, timeout)
+    return payload
+
+
+def allowed_previous_statuses(status):
+    """
+    Return the statuses a job may be in when moving to ``status``.
+
+    A job may repeat its current status (e.g. to report progress while
+    running), but it can never move backwards or leave a terminal status.
+    """
+    rank = _STATUS_RANK[status]
+    return [
+        previous
+        for previous, previous_rank in _STATUS_RANK.items()
+        if previous_rank < rank or previous == status
+    ]
+
+
+def create_job(job_type, course_id=None, user_identifier=None, **params):
+    """Persist a pending job of ``job_type`` and return its payload."""
+    now = timezone.now()
+    job = OwlyAsyncJob.objects.create(
+        job_id=str(uuid4()),
+        job_type=job_type,
+        status=OwlyAsyncJob.STATUS_PENDING,
+        course_id=course_id,
+        requested_by=str(user_identifier) if user_identifier is not None else None,
+        params=params,
+        created_at=now,
+        updated_at=now,
+    )
+    return _cache_job(serialize_job(job))
+
+
+def get_job(job_id, job_type=None):
+    """
+    Return the payload for ``job_id``, or ``None`` if it does not exist.
+
+    When ``job_type`` is given, jobs of any other type are treated as missing.
+    """
+    payload = cache.get(_job_cache_key(job_id))
+    if payload is None:
+        job = OwlyAsyncJob.objects.filter(job_id=job_id).first()
+        if job is None:
+            return None
+        payload = _cache_job(serialize_job(job))
+
+    if job_type and payload.get("job_type") != job_type:
+        return None
+    return payload
+
+
+def update_job(job_id, **changes):
+    """
+    Atomically apply ``changes`` to a stored job and return the updated payload.
+
+    Known job columns are written with a single conditional ``UPDATE`` that
+    only touches the given columns, so concurrent writers of different fields
+    never clobber each other. Any other keys are merged into the job's
+    ``params`` using compare-and-swap on ``version``. A ``result`` is stored
+    compressed in its own table, in the same transaction, and only its
+    summary is written to the job row.
+
+    A status change that would move the job backwards (for example
+    ``success`` -> ``running``) is rejected: nothing is written and the
+    current payload is returned. Returns ``None`` if the job does not exist.
+    """
+    status = changes.get("status")
+    if status is not None and status not in _STATUS_RANK:
+        raise ValueError(f"Unknown async job status: {status}")
+
+    has_result = "result" in changes
+    result = changes.pop("result", None)
+    columns = {field: value for field, value in changes.items() if field in _JOB_FIELDS}
+    extra_params = {field: value for field, value in changes.items() if field not in _JOB_FIELDS}
+
+    now = timezone.now()
+    columns["updated_at"] = now
+    if has_result:
+        columns["result_summary"] = summarize_result(result) if result is not None else None
+    columns["version"] = F("version") + 1
+    if status in TERMINAL_STATUSES:
+        columns["completed_at"] = Coalesce(F("completed_at"), Value(now))
+
+    queryset = OwlyAsyncJob.objects.filter(job_id=job_id)
+    if status is not None:
+        queryset = queryset.filter(status__in=allowed_previous_statuses(status))
+
+    if has_result:
+        with transaction.atomic():
+            updated = _write_job_columns(queryset, job_id, extra_params, columns)
+            if updated:
+                _store_result(job_id, result, now)
+    else:
+        updated = _write_job_columns(queryset, job_id, extra_params, columns)
+
+    cache.delete(_job_cache_key(job_id))
+    job = OwlyAsyncJob.objects.filter(job_id=job_id).first()
+    if job is None:
+        logger.warning("Ignoring update for unknown async job %s", job_id)
+        return None
+    if not updated:
+        logger.warning(
+            "Rejected async job %s update from status '%s' to '%s'",
+            job_id,
+            job.status,
+            status,
+        )
+    return _cache_job(serialize_job(job))
+
+
+def _write_job_columns(queryset, job_id, extra_params, columns):
+    if extra_params:
+        return _update_job_params(queryset, job_id, extra_params, columns)
+    return queryset.update(**columns)
+
+
+def _update_job_params(queryset, job_id, extra_params, columns):
+    """Merge ``extra_params`` into a job's params with compare-and-swap retries."""
+    for _ in range(PARAMS_UPDATE_MAX_ATTEMPTS):
+        current = OwlyAsyncJob.objects.filter(job_id=job_id).values("params", "version").first()
+        if current is None:
+            return 0
+        params = dict(current["params"] or {})
+        params.update(extra_params)
+        updated = queryset.filter(version=current["version"]).update(params=params, **columns)
+        if updated:
+            return updated
+        if not queryset.exists():
+            return 0
+    logger.warning("Gave up merging params into async job %s after concurrent updates", job_id)
+    return 0
+
+
+def list_jobs(course_id=None, status=None, job_type=None, requested_by=None, page=1, page_size=20):
+    """
+    Return a page of jobs matching the given filters, newest first.
+
+    Jobs only carry their result summary; use ``get_job_result_page`` to read
+    a full result.
+    """
+    queryset = OwlyAsyncJob.objects.order_by("-created_at")
+    if course_id:
+        queryset = queryset.filter(course_id=course_id)
+    if status:
+        queryset = queryset.filter(status=status)
+    if job_type:
+        queryset = queryset.filter(job_type=job_type)
+    if requested_by is not None:
+        queryset = queryset.filter(requested_by=str(requested_by))
+
+    paginator = Paginator(queryset, page_size)
+    page_obj = paginator.get_page(page)
+
+    return {
+        "jobs": [serialize_job(job) for job in page_obj],
+        "count": paginator.count,
+        "page": page_obj.number,
+        "page_size": page_size,
+        "num_pages": paginator.num_pages,
+    }
+
+
+def get_job_result(job_id):
+    """Return the full, decompressed result of ``job_id``, or ``None`` if it has none."""
+    data = OwlyAsyncJobResult.objects.filter(job_id=job_id).values_list("data", flat=True).first()
+    if data is None:
+        return None
+    return json.loads(zlib.decompress(bytes(data)).decode("utf-8"))
+
+
+def get_job_result_page(job_id, section=None, page=1, page_size=50):
+    """
+    Return one page of a list section of the result of ``job_id``.
+
+    ``section`` names a list-valued key of the result (``created_structure``,
+    ``published_items`` or ``results``); it defaults to the first one present.
+    The payload also carries the result's scalar fields as ``summary`` and the
+    available ``sections``. Returns ``None`` if the job has no stored result.
+    """
+    result = get_job_result(job_id)
+    if result is None:
+        return None
+    if not isinstance(result, dict):
+        result = {"items": result}
+
+    sections = [key for key in RESULT_SECTIONS if isinstance(result.get(key), list)]
+    sections += sorted(
+        key for key, value in result.items() if isinstance(value, list) and key not in RESULT_SECTIONS
+    )
+    if section is None and sections:
+        section = sections[0]
+
+    paginator = Paginator(result.get(section) or [], page_size)
+    page_obj = paginator.get_page(page)
+
+    return {
+        "job_id": job_id,
+        "summary": summarize_result(result),
+        "sections": sections,
+        "section": section,
+        "items": list(page_obj),
+        "count": paginator.count,
+        "page": page_obj.number,
+        "page_size": page_size,
+        "num_pages": paginator.num_pages,
+    }
+
+
+def wait_for_job_change(job_id, since=None, timeout=0, job_type=None):
+    """
+    Return the job payload once it differs from the ``since`` version.
+
+    ``since`` is the ``updated_at`` value the caller last saw. The call returns
+    immediately when it is missing, when the job has moved on, or when the job
+    has finished; otherwise it polls the cached status until ``timeout``
+    seconds have elapsed and then returns the unchanged payload.
+    """
+    deadline = time.monotonic() + max(0, min(timeout, LONG_POLL_MAX_WAIT_SECONDS))
+    payload = get_job(job_id, job_type=job_type)
+    while (
+        payload is not None
+        and since
+        and payload.get("updated_at") == since
+        and payload.get("status") not in TERMINAL_STATUSES
+    ):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(LONG_POLL_INTERVAL_SECONDS, remaining))
+        payload = get_job(job_id, job_type=job_type)
+    return payload
+
+
+def iter_job_updates(job_id, job_type=None, since=None, max_duration=STREAM_MAX_DURATION_SECONDS):
+    """
+    Yield the job payload every time it changes, until it finishes.
+
+    ``None`` is yielded when nothing changed for ``STREAM_HEARTBEAT_SECONDS``
+    so streaming callers can send a keep-alive. The generator stops when the
+    job reaches a terminal status, disappears, or ``max_duration`` elapses.
+    """
+    deadline = time.monotonic() + max_duration
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        payload = wait_for_job_change(
+            job_id,
+            since=since,
+            timeout=min(STREAM_HEARTBEAT_SECONDS, remaining),
+            job_type=job_type,
+        )
+        if payload is None:
+            return
+        if payload.get("updated_at") != since:
+            since = payload.get("updated_at")
+            yield payload
+        elif payload.get("status") not in TERMINAL_STATUSES:
+            yield None
+        if payload.get("status") in TERMINAL_STATUSES:
+            return
+
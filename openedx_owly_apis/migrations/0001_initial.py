@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OwlyAsyncJob',
+            fields=[
+                ('job_id', models.CharField(max_length=36, primary_key=True, serialize=False)),
+                ('job_type', models.CharField(choices=[('course_structure', 'Course structure'), ('publish_content', 'Publish content')], db_index=True, max_length=32)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('success', 'Success'), ('failed', 'Failed')], db_index=True, default='pending', max_length=16)),
+                ('course_id', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('requested_by', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('task_id', models.CharField(blank=True, max_length=255, null=True)),
+                ('params', models.JSONField(blank=True, default=dict)),
+                ('progress_message', models.TextField(blank=True, null=True)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(db_index=True)),
+                ('updated_at', models.DateTimeField()),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['course_id', 'status', 'created_at'], name='owly_job_course_status_idx'), models.Index(fields=['requested_by', 'status', 'created_at'], name='owly_job_requester_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_owly_apis', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='owlyasyncjob',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:08
+
+import json
+import zlib
+
+import django.db.models.deletion
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import migrations, models
+
+
+def move_results(apps, schema_editor):
+    """Move inline job results into compressed ``OwlyAsyncJobResult`` rows."""
+    OwlyAsyncJob = apps.get_model('openedx_owly_apis', 'OwlyAsyncJob')
+    OwlyAsyncJobResult = apps.get_model('openedx_owly_apis', 'OwlyAsyncJobResult')
+
+    for job in OwlyAsyncJob.objects.exclude(result=None).iterator():
+        raw = json.dumps(job.result, cls=DjangoJSONEncoder).encode('utf-8')
+        OwlyAsyncJobResult.objects.update_or_create(
+            job_id=job.job_id,
+            defaults={'data': zlib.compress(raw), 'size': len(raw), 'updated_at': job.updated_at},
+        )
+        summary = {}
+        if isinstance(job.result, dict):
+            for key, value in job.result.items():
+                if isinstance(value, (list, tuple)):
+                    summary[f'{key}_count'] = len(value)
+                elif not isinstance(value, dict):
+                    summary[key] = value
+        job.result_summary = summary
+        job.save(update_fields=['result_summary'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_owly_apis', '0002_owlyasyncjob_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OwlyAsyncJobResult',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='result_record', serialize=False, to='openedx_owly_apis.owlyasyncjob')),
+                ('data', models.BinaryField()),
+                ('size', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='owlyasyncjob',
+            name='result_summary',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.RunPython(move_results, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='owlyasyncjob',
+            name='result',
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_owly_apis', '0003_async_job_result'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OwlyPlatformCounter',
+            fields=[
+                ('name', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField()),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_owly_apis', '0004_platform_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OwlyAnalyticsSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_id', models.CharField(max_length=255)),
+                ('kind', models.CharField(choices=[('enrollments', 'Enrollments'), ('detailed', 'Detailed')], max_length=32)),
+                ('payload', models.JSONField()),
+                ('computed_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('course_id', 'kind'), name='owly_snapshot_course_kind_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_owly_apis', '0005_analytics_snapshot'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='owlyasyncjob',
+            name='job_type',
+            field=models.CharField(choices=[('course_structure', 'Course structure'), ('publish_content', 'Publish content'), ('cohort_assignment', 'Cohort assignment')], db_index=True, max_length=32),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_owly_apis', '0006_cohort_assignment_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='owlyanalyticssnapshot',
+            name='cache_version',
+            field=models.PositiveIntegerField(null=True),
+        ),
+    ]
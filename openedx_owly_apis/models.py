@@ -1,3 +1,148 @@
 """
 Database models for openedx_owly_apis.
 """
+from django.db import models
+
+
+class OwlyAsyncJob(models.Model):
+    """
+    Durable record of an asynchronous Owly job.
+
+    Course structure, content publish and cohort assignment jobs share this
+    table; the type-specific request parameters live in ``params``. A cache layer in
+    ``openedx_owly_apis.job_store`` sits in front of it for status polling.
+    Only a small ``result_summary`` is kept on the row; the full result is
+    stored compressed in ``OwlyAsyncJobResult``.
+
+    .. no_pii:
+    """
+
+    TYPE_COURSE_STRUCTURE = "course_structure"
+    TYPE_PUBLISH_CONTENT = "publish_content"
+    TYPE_COHORT_ASSIGNMENT = "cohort_assignment"
+    JOB_TYPE_CHOICES = (
+        (TYPE_COURSE_STRUCTURE, "Course structure"),
+        (TYPE_PUBLISH_CONTENT, "Publish content"),
+        (TYPE_COHORT_ASSIGNMENT, "Cohort assignment"),
+    )
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCESS = "success"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCESS, "Success"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    job_id = models.CharField(max_length=36, primary_key=True)
+    job_type = models.CharField(max_length=32, choices=JOB_TYPE_CHOICES, db_index=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True)
+    course_id = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    requested_by = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    task_id = models.CharField(max_length=255, null=True, blank=True)
+    params = models.JSONField(default=dict, blank=True)
+    progress_message = models.TextField(null=True, blank=True)
+    result_summary = models.JSONField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(db_index=True)
+    updated_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+    version = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        app_label = "openedx_owly_apis"
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["course_id", "status", "created_at"], name="owly_job_course_status_idx"),
+            models.Index(fields=["requested_by", "status", "created_at"], name="owly_job_requester_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.job_type}:{self.job_id} ({self.status})"
+
+
+class OwlyAsyncJobResult(models.Model):
+    """
+    Full result of an ``OwlyAsyncJob``, stored as zlib-compressed JSON.
+
+    Kept out of the job row so status polls and progress updates never load
+    or rewrite large result payloads.
+
+    .. no_pii:
+    """
+
+    job = models.OneToOneField(
+        OwlyAsyncJob,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="result_record",
+    )
+    data = models.BinaryField()
+    size = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        app_label = "openedx_owly_apis"
+
+    def __str__(self):
+        return f"result:{self.job_id} ({self.size} bytes)"
+
+
+class OwlyPlatformCounter(models.Model):
+    """
+    Platform-wide counter kept up to date incrementally.
+
+    Enrollment and course overview signals adjust the counters as they
+    change; a periodic task recounts them to correct any drift. See
+    ``openedx_owly_apis.platform_counters``.
+
+    .. no_pii:
+    """
+
+    name = models.CharField(max_length=64, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField()
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        app_label = "openedx_owly_apis"
+
+    def __str__(self):
+        return f"{self.name}={self.value}"
+
+
+class OwlyAnalyticsSnapshot(models.Model):
+    """
+    Latest precomputed analytics payload of one kind for a course.
+
+    Refreshed periodically by ``openedx_owly_apis.tasks`` so analytics
+    endpoints can answer without computing expensive payloads on a miss.
+
+    .. no_pii:
+    """
+
+    KIND_ENROLLMENTS = "enrollments"
+    KIND_DETAILED = "detailed"
+    KIND_CHOICES = (
+        (KIND_ENROLLMENTS, "Enrollments"),
+        (KIND_DETAILED, "Detailed"),
+    )
+
+    course_id = models.CharField(max_length=255)
+    kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+    payload = models.JSONField()
+    computed_at = models.DateTimeField(db_index=True)
+    # Analytics cache version of the course when the payload was computed.
+    cache_version = models.PositiveIntegerField(null=True)
+
+    class Meta:
+        app_label = "openedx_owly_apis"
+        constraints = [
+            models.UniqueConstraint(fields=["course_id", "kind"], name="owly_snapshot_course_kind_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.course_id} ({self.computed_at})"
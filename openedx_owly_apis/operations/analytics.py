@@ -6,22 +6,71 @@ import logging
 from datetime import datetime, timedelta
 
 from common.djangoapps.course_modes.models import CourseMode
-from common.djangoapps.student.models import CourseEnrollment, CourseEnrollmentAttribute
+from common.djangoapps.student.models import CourseAccessRole, CourseEnrollment, CourseEnrollmentAttribute
+from common.djangoapps.student.roles import CourseInstructorRole, CourseStaffRole
 from django.contrib.auth import get_user_model
-from django.db.models import Count
+from django.db.models import Avg, Count, Exists, ExpressionWrapper, F, FloatField, Max, Min, OuterRef, Q, Subquery
+from django.db.models.functions import Mod, TruncDay, TruncWeek
 from django.utils import timezone
+from lms.djangoapps.grades.models import PersistentSubsectionGrade
 from opaque_keys.edx.keys import CourseKey
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
-from openedx.core.djangoapps.discussions.models import DiscussionsConfiguration, DiscussionTopicLink
+from openedx.core.djangoapps.discussions.models import (
+    DiscussionsConfiguration,
+    DiscussionTopicLink,
+    get_default_provider_type,
+)
 from openedx.core.djangoapps.enrollments.data import get_course_enrollment_info
 from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import DuplicateCourseError
 
+from openedx_owly_apis.analytics_cache import cache_course_analytics
+from openedx_owly_apis.platform_counters import TOTAL_ACTIVE_ENROLLMENTS, TOTAL_COURSES, get_platform_counters
+from openedx_owly_apis.utils.concurrency import run_concurrently
+from openedx_owly_apis.utils.distribution import DEFAULT_BINS, bin_bounds, sample_stride, summarize_distribution
+from openedx_owly_apis.utils.timeseries import (
+    INTERVAL_DAY,
+    INTERVAL_WEEK,
+    bucket_dates,
+    range_bounds,
+    resolve_range,
+    series_by_key,
+)
+
 logger = logging.getLogger(__name__)
 
+ENROLLMENT_ATTRIBUTES_TOP_N = 10
+
 User = get_user_model()
 
 
+def _course_overview_payload(course, enrollment_counts, is_course_full, discussions_config):
+    """Construye el resumen de un curso a partir de datos ya cargados"""
+    return {
+        "course_id": str(course.id),
+        "course_name": course.display_name,
+        "course_org": course.org,
+        "enrollment_stats": {
+            "total_enrollments": enrollment_counts.get('total', 0),
+            "enrollment_by_mode": enrollment_counts,
+            "is_course_full": is_course_full,
+        },
+        "course_status": {
+            "has_started": course.has_started(),
+            "has_ended": course.has_ended(),
+            "is_enrollment_open": course.is_enrollment_open(),
+            "visible_to_staff_only": course.visible_to_staff_only,
+        },
+        "discussions": {
+            "enabled": discussions_config.enabled,
+            "provider": discussions_config.provider_type,
+            "in_context_enabled": discussions_config.enable_in_context,
+        }
+    }
+
+
+@cache_course_analytics("overview")
 def get_overview_analytics_logic(course_id: str = None):
     """Estadísticas generales usando CourseOverview y CourseEnrollment"""
     try:
@@ -35,45 +84,126 @@ def get_overview_analytics_logic(course_id: str = None):
             # Configuración de discusiones
             discussions_config = DiscussionsConfiguration.get(course_key)
 
-            return {
-                "course_id": str(course_key),
-                "course_name": course.display_name,
-                "course_org": course.org,
-                "enrollment_stats": {
-                    "total_enrollments": enrollment_counts.get('total', 0),
-                    "enrollment_by_mode": enrollment_counts,
-                    "is_course_full": CourseEnrollment.objects.is_course_full(course),
-                },
-                "course_status": {
-                    "has_started": course.has_started(),
-                    "has_ended": course.has_ended(),
-                    "is_enrollment_open": course.is_enrollment_open(),
-                    "visible_to_staff_only": course.visible_to_staff_only,
-                },
-                "discussions": {
-                    "enabled": discussions_config.enabled,
-                    "provider": discussions_config.provider_type,
-                    "in_context_enabled": discussions_config.enable_in_context,
-                }
-            }
+            return _course_overview_payload(
+                course,
+                enrollment_counts,
+                CourseEnrollment.objects.is_course_full(course),
+                discussions_config,
+            )
         else:
-            # Estadísticas de todos los cursos
-            all_courses = CourseOverview.get_all_courses()
-            total_enrollments = CourseEnrollment.objects.filter(is_active=True).count()
+            # Estadísticas de todos los cursos, mantenidas incrementalmente
+            platform = get_platform_counters()
 
             return {
                 "platform_overview": {
-                    "total_courses": all_courses.count(),
-                    "total_active_enrollments": total_enrollments,
+                    "total_courses": platform["counters"][TOTAL_COURSES],
+                    "total_active_enrollments": platform["counters"][TOTAL_ACTIVE_ENROLLMENTS],
                 },
+                "counters_updated_at": platform["updated_at"],
+                "counters_reconciled_at": platform["reconciled_at"],
                 "timestamp": timezone.now().isoformat(),
             }
     except Exception as e:
         return {"error": f"Error getting overview analytics: {str(e)}"}
 
 
-def get_enrollments_analytics_logic(course_id: str):
-    """Analíticas detalladas de inscripciones usando enrollments.data APIs"""
+def get_batch_overview_analytics_logic(course_ids=None, org: str = None):
+    """
+    Resumen de muchos cursos con consultas agrupadas en lugar de una por curso.
+
+    Acepta una lista de ``course_ids`` y/o una ``org``. Las inscripciones por
+    modo se cuentan con un único GROUP BY; CourseOverview y la configuración
+    de discusiones se cargan en bloque.
+    """
+    try:
+        if not course_ids and not org:
+            return {"error": "course_ids or org is required for batch analytics"}
+
+        requested_keys = [CourseKey.from_string(course_id) for course_id in course_ids or []]
+        courses = CourseOverview.objects.all()
+        if requested_keys and org:
+            courses = courses.filter(id__in=requested_keys, org=org)
+        elif requested_keys:
+            courses = courses.filter(id__in=requested_keys)
+        else:
+            courses = courses.filter(org=org)
+        courses = {course.id: course for course in courses}
+        course_keys = list(courses)
+
+        # Inscripciones activas por curso y modo en una sola consulta
+        enrollment_counts = {course_key: {'total': 0} for course_key in course_keys}
+        rows = (
+            CourseEnrollment.objects
+            .filter(course_id__in=course_keys, is_active=True)
+            .values('course_id', 'mode')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        for row in rows:
+            counts = enrollment_counts[row['course_id']]
+            counts[row['mode']] = row['count']
+            counts['total'] += row['count']
+
+        # Cupo: como is_course_full, sin contar al staff del curso
+        limited_keys = [
+            key for key, course in courses.items() if course.max_student_enrollments_allowed is not None
+        ]
+        learner_counts = {}
+        if limited_keys:
+            staff_roles = CourseAccessRole.objects.filter(
+                user_id=OuterRef('user_id'),
+                course_id=OuterRef('course_id'),
+                role__in=[CourseStaffRole.ROLE, CourseInstructorRole.ROLE],
+            )
+            learner_counts = dict(
+                CourseEnrollment.objects
+                .filter(course_id__in=limited_keys, is_active=True)
+                .exclude(Exists(staff_roles))
+                .values('course_id')
+                .annotate(count=Count('id'))
+                .order_by()
+                .values_list('course_id', 'count')
+            )
+
+        discussions = {
+            config.context_key: config
+            for config in DiscussionsConfiguration.objects.filter(context_key__in=course_keys)
+        }
+        default_provider = get_default_provider_type()
+
+        results = {}
+        for course_key, course in courses.items():
+            max_enrollments = course.max_student_enrollments_allowed
+            discussions_config = discussions.get(course_key) or DiscussionsConfiguration(
+                context_key=course_key,
+                enabled=False,
+                provider_type=default_provider,
+            )
+            results[str(course_key)] = _course_overview_payload(
+                course,
+                enrollment_counts[course_key],
+                max_enrollments is not None and learner_counts.get(course_key, 0) >= max_enrollments,
+                discussions_config,
+            )
+
+        return {
+            "courses": results,
+            "count": len(results),
+            "not_found": [str(key) for key in requested_keys if key not in courses],
+            "timestamp": timezone.now().isoformat(),
+        }
+    except Exception as e:
+        return {"error": f"Error getting batch analytics: {str(e)}"}
+
+
+@cache_course_analytics("enrollments")
+def get_enrollments_analytics_logic(course_id: str, include_attributes: bool = True):
+    """
+    Analíticas detalladas de inscripciones usando enrollments.data APIs
+
+    Con ``include_attributes=False`` se omite el conteo de atributos de
+    inscripción, que en cursos con atributos de socios puede ser enorme.
+    """
     try:
         if not course_id:
             return {"error": "course_id is required for enrollment analytics"}
@@ -94,12 +224,7 @@ def get_enrollments_analytics_logic(course_id: str):
         enrollments = CourseEnrollment.objects.filter(course_id=course_key)
         recent_enrollments = enrollments.filter(created__gte=last_30_days).count()
 
-        # Atributos de inscripción
-        enrollment_attributes = CourseEnrollmentAttribute.objects.filter(
-            enrollment__course_id=course_key
-        ).values('namespace', 'name').annotate(count=Count('id'))
-
-        return {
+        result = {
             "course_id": str(course_key),
             "course_name": course.display_name,
             "enrollment_summary": {
@@ -108,16 +233,276 @@ def get_enrollments_analytics_logic(course_id: str):
                 "enrollment_by_mode": enrollment_counts,
             },
             "course_details": enrollment_info,
-            "enrollment_attributes": list(enrollment_attributes),
             "course_limits": {
                 "max_enrollments": course.max_student_enrollments_allowed,
                 "is_course_full": CourseEnrollment.objects.is_course_full(course),
             },
         }
+        if include_attributes:
+            # Atributos de inscripción
+            result["enrollment_attributes"] = list(
+                _course_enrollment_attributes(course_key).values('namespace', 'name').annotate(count=Count('id'))
+            )
+        return result
     except Exception as e:
         return {"error": f"Error getting enrollment analytics: {str(e)}"}
 
 
+def _course_enrollment_attributes(course_key):
+    """
+    Atributos de inscripción de un curso.
+
+    Filtra por ``enrollment__course_id``: el JOIN parte del índice de
+    ``CourseEnrollment.course_id`` y llega a los atributos por su clave foránea.
+    """
+    return CourseEnrollmentAttribute.objects.filter(enrollment__course_id=course_key)
+
+
+@cache_course_analytics("enrollment_attributes")
+def get_enrollment_attributes_analytics_logic(course_id: str, namespace: str = None, name: str = None,
+                                              limit: int = ENROLLMENT_ATTRIBUTES_TOP_N):
+    """
+    Analíticas de atributos de inscripción con límites por namespace.
+
+    Sin ``name`` devuelve, por namespace, los ``limit`` nombres más frecuentes
+    y cuántos nombres distintos hay. Con ``namespace`` y ``name`` devuelve los
+    ``limit`` valores más frecuentes de ese atributo.
+    """
+    try:
+        if not course_id:
+            return {"error": "course_id is required for enrollment attribute analytics"}
+
+        course_key = CourseKey.from_string(course_id)
+        attributes = _course_enrollment_attributes(course_key)
+        if namespace:
+            attributes = attributes.filter(namespace=namespace)
+
+        result = {"course_id": str(course_key), "limit": limit}
+        if name:
+            result.update(_attribute_value_counts(attributes.filter(name=name), limit))
+            result.update({"namespace": namespace, "name": name})
+            return result
+
+        # Una sola consulta agrupada, ordenada por frecuencia; solo se
+        # conservan los primeros ``limit`` nombres de cada namespace.
+        rows = (
+            attributes.values('namespace', 'name')
+            .annotate(count=Count('id'))
+            .order_by('namespace', '-count', 'name')
+        )
+        namespaces = {}
+        for row in rows.iterator():
+            summary = namespaces.setdefault(row['namespace'], {
+                "namespace": row['namespace'],
+                "total_names": 0,
+                "total_attributes": 0,
+                "names": [],
+            })
+            summary["total_names"] += 1
+            summary["total_attributes"] += row['count']
+            if len(summary["names"]) < limit:
+                summary["names"].append({"name": row['name'], "count": row['count']})
+
+        for summary in namespaces.values():
+            summary["truncated"] = summary["total_names"] > len(summary["names"])
+        result["namespaces"] = list(namespaces.values())
+        return result
+    except Exception as e:
+        return {"error": f"Error getting enrollment attribute analytics: {str(e)}"}
+
+
+def _attribute_value_counts(attributes, limit):
+    """Los ``limit`` valores más frecuentes de un atributo y el total del resto."""
+    totals = attributes.aggregate(total_attributes=Count('id'), total_values=Count('value', distinct=True))
+    values = list(
+        attributes.values('value').annotate(count=Count('id')).order_by('-count', 'value')[:limit]
+    )
+    return {
+        "total_attributes": totals["total_attributes"],
+        "total_values": totals["total_values"],
+        "values": values,
+        "other_count": totals["total_attributes"] - sum(row['count'] for row in values),
+    }
+
+
+@cache_course_analytics("enrollments_timeseries")
+def get_enrollment_timeseries_logic(course_id: str, start=None, end=None, interval: str = INTERVAL_DAY):
+    """
+    Series de inscripciones y desinscripciones por modo, agrupadas en la base de datos.
+
+    Ambas series salen del historial de ``CourseEnrollment``: una inscripción
+    cuenta cuando un registro la deja activa y el anterior no lo estaba (alta
+    nueva o reactivación), y una desinscripción cuando la deja inactiva
+    estando activa. Otros cambios, como un cambio de modo, no cuentan. Cada
+    inscripción cuenta una vez por intervalo.
+    """
+    try:
+        if not course_id:
+            return {"error": "course_id is required for enrollment timeseries"}
+
+        course_key = CourseKey.from_string(course_id)
+        start, end = resolve_range(start, end, interval)
+        lower, upper = range_bounds(start, end)
+        trunc = TruncWeek if interval == INTERVAL_WEEK else TruncDay
+
+        previous_is_active = (
+            CourseEnrollment.history
+            .filter(id=OuterRef("id"), history_id__lt=OuterRef("history_id"))
+            .order_by("-history_id")
+            .values("is_active")[:1]
+        )
+        transitions = (
+            CourseEnrollment.history
+            .filter(course_id=course_key, history_date__gte=lower, history_date__lt=upper)
+            .exclude(history_type="-")
+            .annotate(was_active=Subquery(previous_is_active))
+        )
+
+        def _series_rows(changes):
+            return (
+                changes
+                .annotate(bucket=trunc("history_date"))
+                .values("bucket", "mode")
+                .annotate(count=Count("id", distinct=True))
+                .order_by()
+            )
+
+        enrollment_rows = _series_rows(
+            transitions.filter(Q(was_active=False) | Q(was_active__isnull=True), is_active=True)
+        )
+        unenrollment_rows = _series_rows(transitions.filter(is_active=False, was_active=True))
+
+        buckets = bucket_dates(start, end, interval)
+        return {
+            "course_id": str(course_key),
+            "interval": interval,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "buckets": [bucket.isoformat() for bucket in buckets],
+            "enrollments": series_by_key(buckets, enrollment_rows),
+            "unenrollments": series_by_key(buckets, unenrollment_rows),
+        }
+    except Exception as e:
+        return {"error": f"Error getting enrollment timeseries: {str(e)}"}
+
+
+ENROLLMENT_EXPORT_COLUMNS = ("user_id", "username", "mode", "is_active", "created", "attributes")
+ENROLLMENT_EXPORT_CHUNK_SIZE = 2000
+
+
+def _iter_enrollment_export_rows(course_key, chunk_size):
+    """
+    Genera las filas de exportación por bloques, con paginación por id.
+
+    Cada bloque hace una consulta de inscripciones y otra de sus atributos,
+    así nunca se cargan todas las inscripciones en memoria (MySQL no soporta
+    cursores del lado del servidor con ``iterator()``).
+    """
+    last_id = 0
+    while True:
+        chunk = list(
+            CourseEnrollment.objects
+            .filter(course_id=course_key, id__gt=last_id)
+            .order_by('id')
+            .values_list('id', 'user_id', 'user__username', 'mode', 'is_active', 'created')[:chunk_size]
+        )
+        if not chunk:
+            return
+        last_id = chunk[-1][0]
+
+        attributes = {}
+        attribute_rows = CourseEnrollmentAttribute.objects.filter(
+            enrollment_id__in=[row[0] for row in chunk]
+        ).values_list('enrollment_id', 'namespace', 'name', 'value')
+        for enrollment_id, namespace, name, value in attribute_rows:
+            attributes.setdefault(enrollment_id, {})[f"{namespace}:{name}"] = value
+
+        for enrollment_id, user_id, username, mode, is_active, created in chunk:
+            yield {
+                "user_id": user_id,
+                "username": username,
+                "mode": mode,
+                "is_active": is_active,
+                "created": created,
+                "attributes": attributes.get(enrollment_id, {}),
+            }
+
+
+def get_enrollment_export_logic(course_id: str, chunk_size: int = ENROLLMENT_EXPORT_CHUNK_SIZE):
+    """
+    Prepara la exportación de inscripciones de un curso.
+
+    Devuelve las ``columns`` y un generador perezoso ``rows``; las consultas se
+    ejecutan mientras se transmite la respuesta.
+    """
+    try:
+        if not course_id:
+            return {"error": "course_id is required for enrollment export"}
+
+        course_key = CourseKey.from_string(course_id)
+        if not CourseOverview.objects.filter(id=course_key).exists():
+            return {"error": "course_not_found", "message": f"Course not found: {course_id}"}
+
+        return {
+            "success": True,
+            "course_id": str(course_key),
+            "columns": list(ENROLLMENT_EXPORT_COLUMNS),
+            "rows": _iter_enrollment_export_rows(course_key, chunk_size),
+        }
+    except Exception as e:
+        return {"error": f"Error preparing enrollment export: {str(e)}"}
+
+
+def _block_names(course_key, category, block_ids=None):
+    """
+    Nombres de los bloques ``category`` del curso con una sola consulta al modulestore.
+
+    Con ``block_ids`` solo se cargan los bloques con esos ids.
+    """
+    qualifiers = {'category': category}
+    if block_ids is not None:
+        qualifiers['name'] = sorted(block_ids)
+    try:
+        blocks = modulestore().get_items(course_key, qualifiers=qualifiers)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Could not load %s blocks of %s", category, course_key, exc_info=True)
+        return {}
+    return {str(block.location): block.display_name for block in blocks}
+
+
+def _discussion_topics_breakdown(course_key, discussion_topics):
+    """
+    Detalle por tema de discusión, ordenado como en el curso.
+
+    Los temas se leen con una sola consulta y se cruzan con los nombres
+    actuales de sus unidades (solo se cargan las unidades enlazadas); si la
+    unidad ya no existe se usa el título guardado en el enlace.
+    """
+    links = list(
+        discussion_topics.order_by('ordering', 'id').values(
+            'usage_key', 'title', 'enabled_in_context', 'ordering', 'context', 'external_id',
+        )
+    )
+    unit_ids = {link['usage_key'].block_id for link in links if link['usage_key']}
+    unit_names = _block_names(course_key, 'vertical', unit_ids) if unit_ids else {}
+    topics = []
+    for link in links:
+        usage_key = str(link['usage_key']) if link['usage_key'] else None
+        context = link['context'] or {}
+        topics.append({
+            "usage_key": usage_key,
+            "external_id": link['external_id'],
+            "unit_name": unit_names.get(usage_key, link['title']),
+            "section": context.get('section'),
+            "subsection": context.get('subsection'),
+            "enabled": link['enabled_in_context'],
+            "ordering": link['ordering'],
+            "in_course_structure": usage_key in unit_names,
+        })
+    return topics
+
+
+@cache_course_analytics("discussions")
 def get_discussions_analytics_logic(course_id: str):
     """Analíticas de discusiones usando discussions.models"""
     try:
@@ -130,9 +515,12 @@ def get_discussions_analytics_logic(course_id: str):
         # Configuración de discusiones
         discussions_config = DiscussionsConfiguration.get(course_key)
 
-        # Enlaces de temas de discusión
+        # Enlaces de temas de discusión: totales en un único agregado condicional
         discussion_topics = DiscussionTopicLink.objects.filter(context_key=course_key)
-        enabled_topics = discussion_topics.filter(enabled_in_context=True).count()
+        topic_counts = discussion_topics.aggregate(
+            total=Count('id'),
+            enabled=Count('id', filter=Q(enabled_in_context=True)),
+        )
 
         return {
             "course_id": str(course_key),
@@ -145,29 +533,139 @@ def get_discussions_analytics_logic(course_id: str):
                 "supports_lti": discussions_config.supports_lti(),
             },
             "topics_summary": {
-                "total_topics": discussion_topics.count(),
-                "enabled_topics": enabled_topics,
-                "disabled_topics": discussion_topics.count() - enabled_topics,
+                "total_topics": topic_counts["total"],
+                "enabled_topics": topic_counts["enabled"],
+                "disabled_topics": topic_counts["total"] - topic_counts["enabled"],
             },
+            "topics": _discussion_topics_breakdown(course_key, discussion_topics),
         }
     except Exception as e:
         return {"error": f"Error getting discussions analytics: {str(e)}"}
 
 
-def get_detailed_analytics_logic(course_id: str):
-    """Análisis completo combinando múltiples APIs"""
+def _score_bin_filter(index, bins):
+    """Condición sobre ``position`` (``score * bins``) para el intervalo ``index`` del histograma."""
+    lower, upper = bin_bounds(index, bins)
+    condition = Q()
+    if lower is not None:
+        condition &= Q(position__gte=lower)
+    if upper is not None:
+        condition &= Q(position__lt=upper)
+    return condition
+
+
+@cache_course_analytics("progress")
+def get_progress_distribution_logic(course_id: str, bins: int = DEFAULT_BINS):
+    """
+    Distribución del progreso de los alumnos por subsección calificada.
+
+    Conteo, media, mínimo, máximo e histograma de ``bins`` intervalos de
+    ``earned_graded / possible_graded`` se agregan en la base de datos con una
+    sola consulta agrupada por subsección. Los cuantiles se calculan sobre una
+    muestra acotada de cada subsección (una fila de cada ``sample_stride``).
+    """
     try:
         if not course_id:
-            return {"error": "course_id is required for detailed analytics"}
+            return {"error": "course_id is required for progress analytics"}
 
         course_key = CourseKey.from_string(course_id)
         course = CourseOverview.get_from_id(course_key)
 
-        # Datos de inscripciones usando APIs especializadas
-        enrollment_counts = CourseEnrollment.objects.enrollment_counts(course_key)
+        grades = PersistentSubsectionGrade.objects.filter(
+            course_id=course_key,
+            possible_graded__gt=0,
+        ).annotate(
+            score=ExpressionWrapper(F('earned_graded') / F('possible_graded'), output_field=FloatField()),
+        )
+        histogram = {
+            f'bin_{index}': Count('id', filter=_score_bin_filter(index, bins) or None)
+            for index in range(bins)
+        }
+        stats = {
+            str(row['usage_key']): row
+            for row in grades
+            .annotate(position=F('score') * bins)
+            .values('usage_key')
+            .annotate(count=Count('id'), mean=Avg('score'), min=Min('score'), max=Max('score'), **histogram)
+            .order_by('usage_key')
+        }
+
+        # Muestra acotada para los cuantiles; una consulta por paso de muestreo
+        samples = {usage_key: [] for usage_key in stats}
+        strides = {}
+        for usage_key, row in stats.items():
+            strides.setdefault(sample_stride(row['count']), []).append(row['usage_key'])
+        for stride, usage_keys in strides.items():
+            rows = grades.filter(usage_key__in=usage_keys)
+            if stride > 1:
+                rows = rows.annotate(slot=Mod('id', stride)).filter(slot=0)
+            for usage_key, score in rows.values_list('usage_key', 'score'):
+                samples[str(usage_key)].append(score)
+
+        names = _block_names(course_key, 'sequential') if stats else {}
+        subsections = [
+            {
+                "usage_key": usage_key,
+                "display_name": names.get(usage_key),
+                **summarize_distribution(
+                    row['count'], row['mean'], row['min'], row['max'],
+                    [row[f'bin_{index}'] for index in range(bins)],
+                    samples[usage_key],
+                ),
+            }
+            for usage_key, row in stats.items()
+        ]
+
+        return {
+            "course_id": str(course_key),
+            "course_name": course.display_name,
+            "bins": bins,
+            "subsections": subsections,
+            "timestamp": timezone.now().isoformat(),
+        }
+    except Exception as e:
+        return {"error": f"Error getting progress analytics: {str(e)}"}
+
+
+@cache_course_analytics("detailed")
+def _overview_with_learner_count(course_key):
+    """
+    Devuelve ``(course_overview, learner_count)``.
+
+    Los alumnos (sin staff) solo se cuentan si el curso tiene cupo; sin cupo
+    ``learner_count`` es ``None``.
+    """
+    course = CourseOverview.get_from_id(course_key)
+    if course.max_student_enrollments_allowed is None:
+        return course, None
+    return course, CourseEnrollment.objects.num_enrolled_in_exclude_admins(course_key)
+
+
+def get_detailed_analytics_logic(course_id: str, include_timing: bool = False):
+    """
+    Análisis completo combinando múltiples APIs.
+
+    Las consultas independientes se ejecutan en paralelo; con
+    ``include_timing`` la respuesta incluye los milisegundos de cada una.
+    """
+    try:
+        if not course_id:
+            return {"error": "course_id is required for detailed analytics"}
+
+        course_key = CourseKey.from_string(course_id)
+
+        # Consultas independientes en paralelo
+        parts, timing = run_concurrently({
+            "course_overview": lambda: _overview_with_learner_count(course_key),
+            "enrollment_counts": lambda: CourseEnrollment.objects.enrollment_counts(course_key),
+            "course_modes": lambda: CourseMode.modes_for_course(course_key),
+            "discussions_configuration": lambda: DiscussionsConfiguration.get(course_key),
+        })
+        course, learner_count = parts["course_overview"]
+        enrollment_counts = parts["enrollment_counts"]
+        discussions_config = parts["discussions_configuration"]
+        is_full = learner_count is not None and learner_count >= course.max_student_enrollments_allowed
 
-        # Modos de curso usando CourseMode API
-        available_modes = CourseMode.modes_for_course(course_key)
         modes_info = [
             {
                 "slug": mode.slug,
@@ -175,13 +673,10 @@ def get_detailed_analytics_logic(course_id: str):
                 "min_price": mode.min_price,
                 "currency": mode.currency,
             }
-            for mode in available_modes
+            for mode in parts["course_modes"]
         ]
 
-        # Configuración de discusiones
-        discussions_config = DiscussionsConfiguration.get(course_key)
-
-        return {
+        result = {
             "course_id": str(course_key),
             "course_name": course.display_name,
             "comprehensive_summary": {
@@ -206,10 +701,13 @@ def get_detailed_analytics_logic(course_id: str):
                     "enrollment_open": course.is_enrollment_open(),
                     "course_started": course.has_started(),
                     "course_ended": course.has_ended(),
-                    "is_full": CourseEnrollment.objects.is_course_full(course),
+                    "is_full": is_full,
                 },
             },
             "timestamp": timezone.now().isoformat(),
         }
+        if include_timing:
+            result["timing"] = timing
+        return result
     except Exception as e:
         return {"error": f"Error getting detailed analytics: {str(e)}"}
@@ -6,14 +6,18 @@ import logging
 import re
 import textwrap
 from datetime import datetime, timedelta
+from functools import reduce
+from operator import or_
 
 from asgiref.sync import sync_to_async
 from common.djangoapps.course_modes.models import CourseMode
-from common.djangoapps.student.models import CourseEnrollment, CourseEnrollmentAttribute
+from common.djangoapps.student.models import CourseAccessRole, CourseEnrollment, CourseEnrollmentAttribute
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Count
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
 from django.utils import timezone
+from edx_django_utils.cache import RequestCache
 from opaque_keys.edx.keys import CourseKey
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.discussions.models import DiscussionsConfiguration, DiscussionTopicLink
@@ -33,6 +37,21 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+COHORT_MEMBERS_PAGE_SIZE = 100
+COURSE_STAFF_PAGE_SIZE = 100
+USER_ROLES_PAGE_SIZE = 100
+COHORT_BULK_CHUNK_SIZE = 100
+# Upper bound for the number of values in one ``__in`` lookup
+BULK_LOOKUP_BATCH_SIZE = 1000
+# Emails are matched case-insensitively with one OR-ed condition per email
+EMAIL_LOOKUP_BATCH_SIZE = 100
+
+# Users resolved during a request are memoized here; the id of the superuser
+# used as acting-user fallback is shared across requests for a few minutes.
+_USER_REQUEST_CACHE_NAMESPACE = "openedx_owly_apis:users"
+FALLBACK_SUPERUSER_CACHE_KEY = "openedx_owly_apis:fallback_superuser_id"
+FALLBACK_SUPERUSER_CACHE_TIMEOUT = 5 * 60
+
 
 def _resolve_content_branch_sequence(selection: str):
     if selection == "draft":
@@ -97,7 +116,7 @@ def get_course_tree_logic(
             search_type,
             search_name,
             content_branch,
-            str(user_identifier),
+            _user_ref(user_identifier),
         )
 
         User = get_user_model()
@@ -266,7 +285,7 @@ def get_course_tree_logic(
                 "source": "modulestore",
                 "branch_used": None,
                 "transformers_used": [],
-                "acting_user": getattr(_get_acting_user(user_identifier), 'username', None),
+                "acting_user": acting_user.username,
             }
 
             tree = None
@@ -506,35 +525,119 @@ def get_course_tree_logic(
             "error": str(e),
             "error_type": type(e).__name__,
             "course_id": course_id,
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
+def _user_lookup(user_identifier):
+    """Return the ``(field, value)`` lookup ``_resolve_user`` uses for an identifier."""
+    # Numeric id
+    if isinstance(user_identifier, int) or (isinstance(user_identifier, str) and user_identifier.isdigit()):
+        return "id", int(user_identifier)
+    # Email
+    if isinstance(user_identifier, str) and "@" in user_identifier:
+        return "email__iexact", user_identifier.lower()
+    # Username
+    return "username", user_identifier
+
+
 def _resolve_user(user_identifier):
-    """Resolve a user by id, username, or email. Returns User or None."""
+    """
+    Resolve a user by id, username, or email. Returns User or None.
+
+    ``User`` instances (such as ``request.user`` handed down by the views) are
+    returned as they are. Lookups are memoized for the current request.
+    """
+    if isinstance(user_identifier, User):
+        RequestCache(_USER_REQUEST_CACHE_NAMESPACE).set(("id", user_identifier.id), user_identifier)
+        return user_identifier
     try:
         if user_identifier is None:
             return None
-        # Numeric id
-        if isinstance(user_identifier, int) or (isinstance(user_identifier, str) and user_identifier.isdigit()):
-            return User.objects.filter(id=int(user_identifier)).first()
-        # Email
-        if isinstance(user_identifier, str) and "@" in user_identifier:
-            return User.objects.filter(email__iexact=user_identifier).first()
-        # Username
-        return User.objects.filter(username=user_identifier).first()
+        lookup = _user_lookup(user_identifier)
+        request_cache = RequestCache(_USER_REQUEST_CACHE_NAMESPACE)
+        cached = request_cache.get_cached_response(lookup)
+        if cached.is_found:
+            return cached.value
+        user = User.objects.filter(**dict([lookup])).first()
+        request_cache.set(lookup, user)
+        return user
     except Exception:  # pragma: no cover - best effort
         logger.exception("_resolve_user failed")
         return None
 
 
+def _user_ref(user_identifier):
+    """Return ``user_identifier`` as reported in results: the id of a ``User``, else the identifier."""
+    return str(user_identifier.id if isinstance(user_identifier, User) else user_identifier)
+
+
+def _batched(items, size):
+    """Split ``items`` into lists of at most ``size`` elements."""
+    items = list(items)
+    return [items[index:index + size] for index in range(0, len(items), size)]
+
+
+def _resolve_users_bulk(user_identifiers):
+    """
+    Resolve many user identifiers at once, like ``_resolve_user`` does for one.
+
+    Identifiers are split into ids, emails (case-insensitive) and usernames and
+    looked up with one query per kind and batch. Returns a dict mapping each
+    identifier that matched to a ``{"id", "username", "email"}`` dict.
+    """
+    by_kind = {"id": {}, "email": {}, "username": {}}
+    for identifier in user_identifiers:
+        text = str(identifier).strip()
+        if text.isdigit():
+            by_kind["id"].setdefault(int(text), []).append(identifier)
+        elif "@" in text:
+            by_kind["email"].setdefault(text.lower(), []).append(identifier)
+        elif text:
+            by_kind["username"].setdefault(text, []).append(identifier)
+
+    lookups = (
+        ("id", BULK_LOOKUP_BATCH_SIZE, lambda batch: Q(id__in=batch)),
+        # OR-ed exact matches keep the email index usable, unlike LOWER(email) IN (...).
+        ("email", EMAIL_LOOKUP_BATCH_SIZE, lambda batch: reduce(or_, (Q(email__iexact=email) for email in batch))),
+        ("username", BULK_LOOKUP_BATCH_SIZE, lambda batch: Q(username__in=batch)),
+    )
+    resolved = {}
+    for kind, batch_size, condition in lookups:
+        for batch in _batched(by_kind[kind], batch_size):
+            for row in User.objects.filter(condition(batch)).values("id", "username", "email"):
+                key = row["email"].lower() if kind == "email" else row[kind]
+                for identifier in by_kind[kind].get(key, ()):
+                    resolved.setdefault(identifier, row)
+    return resolved
+
+
+def _fallback_superuser():
+    """Return the superuser acting users fall back to, caching its id across requests."""
+    request_cache = RequestCache(_USER_REQUEST_CACHE_NAMESPACE)
+    cached = request_cache.get_cached_response("fallback_superuser")
+    if cached.is_found:
+        return cached.value
+
+    fallback = None
+    fallback_id = cache.get(FALLBACK_SUPERUSER_CACHE_KEY)
+    if fallback_id is not None:
+        fallback = User.objects.filter(id=fallback_id, is_superuser=True).first()
+    if fallback is None:
+        fallback = User.objects.filter(is_superuser=True).first()
+        if fallback is not None:
+            cache.set(FALLBACK_SUPERUSER_CACHE_KEY, fallback.id, FALLBACK_SUPERUSER_CACHE_TIMEOUT)
+    request_cache.set("fallback_superuser", fallback)
+    return fallback
+
+
 def _get_acting_user(user_identifier):
     """Get acting user. Prefer provided identifier; fallback to superuser with warning."""
     user = _resolve_user(user_identifier)
     if user:
         return user
     # Fallback for backward compatibility
-    fallback = User.objects.filter(is_superuser=True).first()
+    fallback = _fallback_superuser()
     if not fallback:
         return None
     logger.warning(
@@ -709,7 +812,7 @@ def create_course_logic(org: str, course_number: str, run: str,
                 "check_settings": "Ensure Django settings match CMS",
                 "check_permissions": "Verify admin user permissions"
             },
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
@@ -825,7 +928,7 @@ def rerun_course_logic(
             "error": "rerun_failed",
             "message": str(e),
             "source_course_id": source_course_id,
-            "requested_by": str(user_identifier),
+            "requested_by": _user_ref(user_identifier),
         }
 
 
@@ -1083,7 +1186,7 @@ def create_course_structure_logic(course_id: str, units_config: dict, edit: bool
             "success": False,
             "error": str(e),
             "course_id": course_id,
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
@@ -1097,7 +1200,7 @@ def add_discussion_content_logic(vertical_id: str, discussion_config: dict, user
     try:
         logger.info(
             "add_discussion_content start vertical_id=%s requested_by=%s payload_keys=%s",
-            vertical_id, str(user_identifier), list((discussion_config or {}).keys())
+            vertical_id, _user_ref(user_identifier), list((discussion_config or {}).keys())
         )
         User = get_user_model()
         acting_user = _get_acting_user(user_identifier)
@@ -1138,7 +1241,9 @@ def add_discussion_content_logic(vertical_id: str, discussion_config: dict, user
 
     except Exception as e:
         logger.exception(f"Error creating discussion content: {e}")
-        return {"success": False, "error": str(e), "vertical_id": vertical_id, "requested_by": str(user_identifier)}
+        return {
+            "success": False, "error": str(e), "vertical_id": vertical_id, "requested_by": _user_ref(user_identifier)
+        }
 
 
 def add_problem_content_logic(vertical_id: str, problem_config: dict, user_identifier=None):
@@ -1151,7 +1256,7 @@ def add_problem_content_logic(vertical_id: str, problem_config: dict, user_ident
     try:
         logger.info(
             "add_problem_content start vertical_id=%s requested_by=%s payload_keys=%s",
-            vertical_id, str(user_identifier), list((problem_config or {}).keys())
+            vertical_id, _user_ref(user_identifier), list((problem_config or {}).keys())
         )
         User = get_user_model()
         acting_user = _get_acting_user(user_identifier)
@@ -1232,7 +1337,9 @@ def add_problem_content_logic(vertical_id: str, problem_config: dict, user_ident
 
     except Exception as e:
         logger.exception(f"Error creating problem content: {e}")
-        return {"success": False, "error": str(e), "vertical_id": vertical_id, "requested_by": str(user_identifier)}
+        return {
+            "success": False, "error": str(e), "vertical_id": vertical_id, "requested_by": _user_ref(user_identifier)
+        }
 
 
 def add_video_content_logic(vertical_id: str, video_config: dict, user_identifier=None):
@@ -1245,7 +1352,7 @@ def add_video_content_logic(vertical_id: str, video_config: dict, user_identifie
     try:
         logger.info(
             "add_video_content start vertical_id=%s requested_by=%s payload_keys=%s",
-            vertical_id, str(user_identifier), list((video_config or {}).keys())
+            vertical_id, _user_ref(user_identifier), list((video_config or {}).keys())
         )
         User = get_user_model()
         acting_user = _get_acting_user(user_identifier)
@@ -1301,7 +1408,9 @@ def add_video_content_logic(vertical_id: str, video_config: dict, user_identifie
 
     except Exception as e:
         logger.exception(f"Error creating video content: {e}")
-        return {"success": False, "error": str(e), "vertical_id": vertical_id, "requested_by": str(user_identifier)}
+        return {
+            "success": False, "error": str(e), "vertical_id": vertical_id, "requested_by": _user_ref(user_identifier)
+        }
 
 
 def add_html_content_logic(vertical_id: str, html_config: dict, user_identifier=None):
@@ -1313,7 +1422,7 @@ def add_html_content_logic(vertical_id: str, html_config: dict, user_identifier=
     try:
         logger.info(
             "add_html_content start vertical_id=%s requested_by=%s payload_keys=%s",
-            vertical_id, str(user_identifier), list((html_config or {}).keys())
+            vertical_id, _user_ref(user_identifier), list((html_config or {}).keys())
         )
         User = get_user_model()
         acting_user = _get_acting_user(user_identifier)
@@ -1349,7 +1458,9 @@ def add_html_content_logic(vertical_id: str, html_config: dict, user_identifier=
 
     except Exception as e:
         logger.exception(f"Error creating HTML content: {e}")
-        return {"success": False, "error": str(e), "vertical_id": vertical_id, "requested_by": str(user_identifier)}
+        return {
+            "success": False, "error": str(e), "vertical_id": vertical_id, "requested_by": _user_ref(user_identifier)
+        }
 
 
 def update_course_settings_logic(course_id: str, settings_data: dict, user_identifier=None) -> dict:
@@ -1364,7 +1475,7 @@ def update_course_settings_logic(course_id: str, settings_data: dict, user_ident
     try:
         logger.info(
             "update_course_settings start course_id=%s requested_by=%s settings_keys=%s",
-            course_id, str(user_identifier), list((settings_data or {}).keys())
+            course_id, _user_ref(user_identifier), list((settings_data or {}).keys())
         )
 
         User = get_user_model()
@@ -1518,7 +1629,7 @@ def update_course_settings_logic(course_id: str, settings_data: dict, user_ident
             "error": "update_failed",
             "message": str(e),
             "course_id": course_id,
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
@@ -1532,7 +1643,7 @@ def update_advanced_settings_logic(course_id: str, advanced_settings: dict, user
     try:
         logger.info(
             "update_advanced_settings start course_id=%s requested_by=%s settings_keys=%s",
-            course_id, str(user_identifier), list((advanced_settings or {}).keys())
+            course_id, _user_ref(user_identifier), list((advanced_settings or {}).keys())
         )
 
         User = get_user_model()
@@ -1625,7 +1736,7 @@ def update_advanced_settings_logic(course_id: str, advanced_settings: dict, user
             "error": "update_failed",
             "message": str(e),
             "course_id": course_id,
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
@@ -1641,7 +1752,7 @@ def enable_configure_certificates_logic(course_id: str, certificate_config: dict
     try:
         logger.info(
             "enable_configure_certificates start course_id=%s requested_by=%s config_keys=%s",
-            course_id, str(user_identifier), list((certificate_config or {}).keys())
+            course_id, _user_ref(user_identifier), list((certificate_config or {}).keys())
         )
 
         User = get_user_model()
@@ -1791,7 +1902,7 @@ def enable_configure_certificates_logic(course_id: str, certificate_config: dict
             "error": "configuration_failed",
             "message": str(e),
             "course_id": course_id,
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
@@ -1807,7 +1918,7 @@ def control_unit_availability_logic(unit_id: str, availability_config: dict, use
     try:
         logger.info(
             "control_unit_availability start unit_id=%s requested_by=%s config_keys=%s",
-            unit_id, str(user_identifier), list((availability_config or {}).keys())
+            unit_id, _user_ref(user_identifier), list((availability_config or {}).keys())
         )
 
         User = get_user_model()
@@ -1968,7 +2079,7 @@ def control_unit_availability_logic(unit_id: str, availability_config: dict, use
             "error": "control_failed",
             "message": str(e),
             "unit_id": unit_id,
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
@@ -1989,7 +2100,7 @@ def create_openedx_problem_logic(
     try:
         logger.info(
             "create_openedx_problem start unit_locator=%s problem_type=%s requested_by=%s",
-            unit_locator, problem_type, str(user_identifier)
+            unit_locator, problem_type, _user_ref(user_identifier)
         )
 
         User = get_user_model()
@@ -2082,7 +2193,7 @@ def create_openedx_problem_logic(
             "error": "creation_failed",
             "message": str(e),
             "unit_locator": unit_locator,
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
@@ -2523,7 +2634,7 @@ def publish_content_logic(content_id: str, publish_type: str = "auto", user_iden
     try:
         logger.info(
             "publish_content start content_id=%s publish_type=%s requested_by=%s",
-            content_id, publish_type, str(user_identifier)
+            content_id, publish_type, _user_ref(user_identifier)
         )
 
         User = get_user_model()
@@ -2850,7 +2961,7 @@ def toggle_certificate_logic(course_id: str, certificate_id: str, is_active: boo
     try:
         logger.info(
             "toggle_certificate start course_id=%s certificate_id=%s is_active=%s requested_by=%s",
-            course_id, certificate_id, is_active, str(user_identifier)
+            course_id, certificate_id, is_active, _user_ref(user_identifier)
         )
 
         User = get_user_model()
@@ -2982,7 +3093,7 @@ def toggle_certificate_simple_logic(course_id: str, is_active: bool, user_identi
     try:
         logger.info(
             "toggle_certificate_simple start course_id=%s is_active=%s requested_by=%s",
-            course_id, is_active, str(user_identifier)
+            course_id, is_active, _user_ref(user_identifier)
         )
 
         User = get_user_model()
@@ -3342,23 +3453,226 @@ def manage_course_staff_logic(course_id, user_identifier, action, role_type="sta
         }
 
 
-def list_course_staff_logic(course_id, role_type=None, acting_user_identifier=None):
+BULK_STAFF_STATUSES = (
+    "added", "removed", "already_has_role", "does_not_have_role", "user_not_found",
+    "course_not_found", "invalid_course_id", "duplicate", "conflict", "failed",
+)
+
+
+def _role_change_key(course_key, role_type, user_id):
+    """
+    Return what a role change targets, to find duplicate and conflicting changes.
+
+    Staff roles belong to a course. Course creator roles are the global role
+    plus one per organization, so they are shared by every course of an org.
+    """
+    if role_type == "course_creator":
+        return ("org", course_key.org, role_type, user_id)
+    return ("course", str(course_key), role_type, user_id)
+
+
+def _apply_course_role_changes(course_key, entries, users):
+    """
+    Apply the staff and course creator changes of one course.
+
+    ``entries`` are result rows of ``bulk_manage_course_staff_logic`` for
+    ``course_key``. Current staff and course creator membership is read with
+    one query, so changes that would not change anything are reported as
+    ``already_has_role`` or ``does_not_have_role``. The rest are grouped by
+    role and action so each group is a single multi-user
+    ``add_users``/``remove_users`` call.
+    """
+    from common.djangoapps.student.auth import CourseCreatorRole, OrgContentCreatorRole
+    from common.djangoapps.student.roles import CourseStaffRole
+
+    # Creators hold both the global and the organization role; adding grants
+    # both and removing revokes both.
+    role_names = {
+        "staff": {CourseStaffRole.ROLE},
+        "course_creator": {CourseCreatorRole.ROLE, OrgContentCreatorRole.ROLE},
+    }
+    held = {}
+    for user_id, role in CourseAccessRole.objects.filter(
+        Q(role=CourseStaffRole.ROLE, course_id=course_key)
+        | Q(role=CourseCreatorRole.ROLE, org="")
+        | Q(role=OrgContentCreatorRole.ROLE, org=course_key.org),
+        user_id__in=[entry["user_id"] for entry in entries],
+    ).values_list("user_id", "role"):
+        held.setdefault(user_id, set()).add(role)
+
+    groups = {}
+    for entry in entries:
+        user_roles = held.get(entry["user_id"], set()) & role_names[entry["role_type"]]
+        if entry["action"] == "add" and user_roles == role_names[entry["role_type"]]:
+            entry["status"] = "already_has_role"
+        elif entry["action"] == "remove" and not user_roles:
+            entry["status"] = "does_not_have_role"
+        else:
+            groups.setdefault((entry["role_type"], entry["action"]), []).append(entry)
+
+    for (role_type, change), group in groups.items():
+        if role_type == "staff":
+            roles = [CourseStaffRole(course_key)]
+        else:
+            roles = [CourseCreatorRole(), OrgContentCreatorRole(org=course_key.org)]
+        group_users = [users[entry["user_id"]] for entry in group]
+        for role in roles:
+            if change == "add":
+                role.add_users(*group_users)
+            else:
+                role.remove_users(*group_users)
+        for entry in group:
+            entry["status"] = "added" if change == "add" else "removed"
+
+
+def bulk_manage_course_staff_logic(changes, acting_user_identifier=None):
+    """
+    Add or remove course staff and course creator roles for many users and courses.
+
+    Every change is a dict with ``course_id``, ``user_identifier``, ``action``
+    ("add" or "remove") and ``role_type`` ("staff" or "course_creator"), as
+    taken by ``manage_course_staff_logic``. Users are resolved in batched
+    lookups and courses are checked with one query. A change repeating an
+    earlier one is reported as ``duplicate``; course creator roles are shared
+    by the courses of an organization, so changes on two of them count as
+    the same. Adding and removing the same role for a user is reported as
+    ``conflict`` and neither is applied. The changes of each course are
+    applied in one transaction, grouped by role and action; if a course
+    fails, none of its changes are kept and the other courses are unaffected.
+
+    Args:
+        changes (list): Role changes to apply
+        acting_user_identifier: User performing the action
+
+    Returns:
+        dict: Success/error response with one result row per change and status counts
+    """
+    acting_user = _get_acting_user(acting_user_identifier)
+    if not acting_user:
+        return {
+            "success": False,
+            "error": "acting_user_not_found",
+            "message": f"Acting user not found: {acting_user_identifier}"
+        }
+
+    try:
+        resolved = _resolve_users_bulk([change["user_identifier"] for change in changes])
+
+        course_keys = {}
+        for course_id in {_normalize_course_id(change["course_id"]) for change in changes}:
+            try:
+                course_keys[course_id] = CourseKey.from_string(course_id)
+            except Exception:  # pylint: disable=broad-except
+                course_keys[course_id] = None
+        existing_courses = set(
+            str(course_key) for course_key in CourseOverview.objects.filter(
+                id__in=[course_key for course_key in course_keys.values() if course_key]
+            ).values_list("id", flat=True)
+        )
+
+        results, by_course, seen = [], {}, {}
+        for change in changes:
+            course_id = _normalize_course_id(change["course_id"])
+            course_key = course_keys[course_id]
+            user = resolved.get(change["user_identifier"])
+            entry = {
+                "course_id": course_id,
+                "user_identifier": change["user_identifier"],
+                "action": change["action"],
+                "role_type": change.get("role_type", "staff"),
+            }
+            results.append(entry)
+            if course_key is None:
+                entry["status"] = "invalid_course_id"
+            elif str(course_key) not in existing_courses:
+                entry["status"] = "course_not_found"
+            elif not user:
+                entry["status"] = "user_not_found"
+            else:
+                entry.update(user_id=user["id"], username=user["username"])
+                change_key = _role_change_key(course_key, entry["role_type"], user["id"])
+                first = seen.setdefault(change_key, entry)
+                if first is entry:
+                    by_course.setdefault(course_key, []).append(entry)
+                elif first["action"] == entry["action"] and first.get("status") != "conflict":
+                    entry["status"] = "duplicate"
+                else:
+                    # Adding and removing the same role in one request is
+                    # ambiguous; neither change is applied.
+                    first["status"] = entry["status"] = "conflict"
+
+        for course_key in list(by_course):
+            by_course[course_key] = [entry for entry in by_course[course_key] if "status" not in entry]
+            if not by_course[course_key]:
+                del by_course[course_key]
+
+        users = User.objects.in_bulk(
+            [entry["user_id"] for entries in by_course.values() for entry in entries]
+        )
+        for course_key, entries in by_course.items():
+            try:
+                with transaction.atomic():
+                    _apply_course_role_changes(course_key, entries, users)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.exception(f"Error managing staff roles in course {course_key}: {e}")
+                for entry in entries:
+                    entry.update(status="failed", error=str(e))
+
+        counts = _status_counts(results, BULK_STAFF_STATUSES)
+        logger.info(
+            f"Applied {len(results)} staff role changes across {len(by_course)} courses "
+            f"by {acting_user.username}: {counts}"
+        )
+
+        return {
+            "success": True,
+            "total": len(results),
+            **counts,
+            "results": results,
+            "acting_user": acting_user.username
+        }
+
+    except Exception as e:
+        logger.exception(f"Error managing course staff in bulk: {e}")
+        return {
+            "success": False,
+            "error": "operation_failed",
+            "message": f"Failed to apply staff role changes: {str(e)}"
+        }
+
+
+def list_course_staff_logic(
+    course_id,
+    role_type=None,
+    acting_user_identifier=None,
+    page=1,
+    page_size=COURSE_STAFF_PAGE_SIZE,
+):
     """
-    List users with course staff roles.
+    List users with course staff roles, one page at a time.
+
+    Only the requested roles are considered: course staff of the course,
+    global course creators and course creators of the course organization.
+    Users are paged in the database, each page with a single query over
+    ``auth_user`` filtered and annotated by ``CourseAccessRole`` subqueries.
+    Users holding several roles are listed once, as staff when they are
+    course staff.
 
     Args:
         course_id (str): Course identifier (e.g., course-v1:ORG+NUM+RUN)
         role_type (str, optional): Filter by role type - "staff", "course_creator", or None for all
         acting_user_identifier: User performing the query
+        page (int): Page number, starting at 1
+        page_size (int): Number of users per page
 
     Returns:
-        dict: Success response with list of users and their roles
+        dict: Success response with a page of users and their roles
     """
     import logging
 
     from common.djangoapps.student.auth import CourseCreatorRole, OrgContentCreatorRole
     from common.djangoapps.student.roles import CourseStaffRole
-    from django.contrib.auth import get_user_model
+    from django.core.paginator import Paginator
     from opaque_keys.edx.keys import CourseKey
 
     logger = logging.getLogger(__name__)
@@ -3408,62 +3722,52 @@ def list_course_staff_logic(course_id, role_type=None, acting_user_identifier=No
                 ).format(course_id=course_id, error=str(e))
             }
 
-        User = get_user_model()
-        users_data = []
-
-        # Get course staff users
+        role_filter = Q()
         if not role_type or role_type == "staff":
-            staff_role = CourseStaffRole(course_key)
-            staff_users = staff_role.users_with_role()
-
-            for user in staff_users:
-                users_data.append({
-                    "user_id": user.id,
-                    "username": user.username,
-                    "email": user.email,
-                    "first_name": user.first_name,
-                    "last_name": user.last_name,
-                    "role": "staff",
-                    "role_description": "Course staff (can edit course content)"
-                })
-
-        # Get course creator users
+            role_filter |= Q(role=CourseStaffRole.ROLE, course_id=course_key)
         if not role_type or role_type == "course_creator":
-            # Global course creators
-            global_creator_role = CourseCreatorRole()
-            global_creators = global_creator_role.users_with_role()
-
-            # Organization-specific course creators
-            org = course_key.org
-            org_creator_role = OrgContentCreatorRole(org)
-            org_creators = org_creator_role.users_with_role()
-
-            # Combine and deduplicate
-            all_creators = set(global_creators) | set(org_creators)
-
-            for user in all_creators:
-                # Check if user already added as staff
-                if not any(u["user_id"] == user.id for u in users_data):
-                    users_data.append({
-                        "user_id": user.id,
-                        "username": user.username,
-                        "email": user.email,
-                        "first_name": user.first_name,
-                        "last_name": user.last_name,
-                        "role": "course_creator",
-                        "role_description": "Course creator (can create new courses)"
-                    })
+            role_filter |= Q(role=CourseCreatorRole.ROLE, org="")
+            role_filter |= Q(role=OrgContentCreatorRole.ROLE, org=course_key.org)
+
+        # Page over users in the database; users holding several roles are
+        # listed once, and staff takes precedence over creator.
+        roles = CourseAccessRole.objects.filter(role_filter)
+        user_rows = (
+            User.objects
+            .filter(id__in=roles.values("user_id"))
+            .annotate(has_staff_role=Exists(roles.filter(user_id=OuterRef("id"), role=CourseStaffRole.ROLE)))
+            .values("id", "username", "email", "first_name", "last_name", "has_staff_role")
+            .order_by("username", "id")
+        )
+        paginator = Paginator(user_rows, page_size)
+        page_obj = paginator.get_page(page)
 
-        # Sort by username for consistent results
-        users_data.sort(key=lambda x: x["username"])
+        users_data = []
+        for row in page_obj:
+            if row["has_staff_role"]:
+                role, role_description = "staff", "Course staff (can edit course content)"
+            else:
+                role, role_description = "course_creator", "Course creator (can create new courses)"
+            users_data.append({
+                "user_id": row["id"],
+                "username": row["username"],
+                "email": row["email"],
+                "first_name": row["first_name"],
+                "last_name": row["last_name"],
+                "role": role,
+                "role_description": role_description,
+            })
 
         return {
             "success": True,
             "course_id": course_id,
             "role_type_filter": role_type,
-            "total_users": len(users_data),
+            "total_users": paginator.count,
+            "page": page_obj.number,
+            "page_size": page_size,
+            "num_pages": paginator.num_pages,
             "users": users_data,
-            "acting_user": acting_user_identifier
+            "acting_user": getattr(acting_user_identifier, "username", acting_user_identifier)
         }
 
     except Exception as e:
@@ -3476,6 +3780,82 @@ def list_course_staff_logic(course_id, role_type=None, acting_user_identifier=No
         }
 
 
+def list_user_course_roles_logic(
+    user_identifiers,
+    page=1,
+    page_size=USER_ROLES_PAGE_SIZE,
+    acting_user_identifier=None,
+):
+    """
+    List every course, organization and global role held by one or more users.
+
+    Roles are read from ``CourseAccessRole`` with a single query filtered on
+    the (indexed) user column; the course display name comes from a
+    ``CourseOverview`` subquery in that same query. Results are ordered by
+    username, organization and course, and paginated.
+
+    Args:
+        user_identifiers (list): Usernames, emails, or user ids
+        page (int): Page number, starting at 1
+        page_size (int): Number of roles per page
+        acting_user_identifier: User performing the query
+
+    Returns:
+        dict: Success response with the resolved users and a page of their roles
+    """
+    from django.core.paginator import Paginator
+
+    try:
+        resolved = _resolve_users_bulk(user_identifiers)
+        users = {}
+        for row in resolved.values():
+            users.setdefault(row["id"], row)
+
+        course_names = CourseOverview.objects.filter(id=OuterRef("course_id")).values("display_name")[:1]
+        roles = (
+            CourseAccessRole.objects
+            .filter(user_id__in=list(users))
+            .annotate(course_name=Subquery(course_names))
+            .values("user_id", "user__username", "role", "org", "course_id", "course_name")
+            .order_by("user__username", "org", "course_id", "role")
+        )
+        paginator = Paginator(roles, page_size)
+        page_obj = paginator.get_page(page)
+
+        roles_data = []
+        for row in page_obj:
+            course_key = row["course_id"]
+            roles_data.append({
+                "user_id": row["user_id"],
+                "username": row["user__username"],
+                "role": row["role"],
+                "scope": "course" if course_key else "org" if row["org"] else "global",
+                "org": row["org"] or None,
+                "course_id": str(course_key) if course_key else None,
+                "course_name": row["course_name"],
+            })
+
+        return {
+            "success": True,
+            "users": list(users.values()),
+            "not_found": [identifier for identifier in user_identifiers if identifier not in resolved],
+            "total_roles": paginator.count,
+            "page": page_obj.number,
+            "page_size": page_size,
+            "num_pages": paginator.num_pages,
+            "roles": roles_data,
+            "acting_user": getattr(acting_user_identifier, "username", acting_user_identifier)
+        }
+
+    except Exception as e:
+        logger.exception(f"Error listing user course roles: {e}")
+        return {
+            "success": False,
+            "error": "query_failed",
+            "message": f"Failed to list user course roles: {str(e)}"
+        }
+
+
 def add_ora_content_logic(vertical_id: str, ora_config: dict, user_identifier=None) -> dict:
     """
     Add Open Response Assessment (ORA) content component to a vertical in OpenEdX.
@@ -3541,7 +3921,7 @@ def add_ora_content_logic(vertical_id: str, ora_config: dict, user_identifier=No
     try:
         logger.info(
             "add_ora_content start vertical_id=%s requested_by=%s config_keys=%s",
-            vertical_id, str(user_identifier), list((ora_config or {}).keys())
+            vertical_id, _user_ref(user_identifier), list((ora_config or {}).keys())
         )
 
         User = get_user_model()
@@ -3635,7 +4015,7 @@ def add_ora_content_logic(vertical_id: str, ora_config: dict, user_identifier=No
             "success": False,
             "error": str(e),
             "vertical_id": vertical_id,
-            "requested_by": str(user_identifier)
+            "requested_by": _user_ref(user_identifier)
         }
 
 
@@ -4742,11 +5122,10 @@ def list_cohorts_logic(course_id: str, user_identifier=None) -> dict:
                 "message": f"Invalid course_id format: {str(e)}"
             }
 
-        # Import cohorts module and course functions
+        # Import cohorts module and models
         try:
-            from openedx.core.djangoapps.course_groups.cohorts import get_course_cohorts
-            from openedx.core.djangoapps.course_groups.models import CourseCohort
-            from openedx.core.lib.courses import get_course_by_id
+            from openedx.core.djangoapps.course_groups.cohorts import get_course_cohort_settings
+            from openedx.core.djangoapps.course_groups.models import CourseUserGroup
         except ImportError:
             return {
                 "success": False,
@@ -4754,38 +5133,48 @@ def list_cohorts_logic(course_id: str, user_identifier=None) -> dict:
                 "message": "Cohorts functionality not available"
             }
 
-        # Get the course object (required by get_course_cohorts)
+        # Like get_course_cohorts, migrate the course's cohort settings first:
+        # the first time, this creates the settings and the CourseCohort rows
+        # of existing groups. The course is only loaded from the modulestore
+        # then, and a missing course raises ValueError.
         try:
-            course = get_course_by_id(course_key)
-        except Exception as e:
+            get_course_cohort_settings(course_key)
+        except ValueError:
             return {
                 "success": False,
                 "error": "course_not_found",
-                "message": f"Course not found: {str(e)}"
+                "message": f"Course not found: {course_id}"
             }
 
-        # Get cohorts for the course
-        cohorts = get_course_cohorts(course)
-
-        cohorts_data = []
-        for cohort in cohorts:
-            # Get member count
-            member_count = cohort.users.count()
-
-            # Get correct assignment_type from CourseCohort model
-            try:
-                course_cohort = CourseCohort.objects.get(course_user_group=cohort)
-                assignment_type = course_cohort.assignment_type
-            except CourseCohort.DoesNotExist:
-                assignment_type = 'manual'  # Default
+        # Same cohorts as get_course_cohorts(course_id=...), but in a single
+        # query: member counts are annotated and assignment_type comes from the
+        # joined CourseCohort row.
+        cohorts = (
+            CourseUserGroup.objects
+            .filter(course_id=course_key, group_type=CourseUserGroup.COHORT)
+            .annotate(member_count=Count('users'))
+            .values('id', 'name', 'cohort__assignment_type', 'member_count')
+            .order_by('id')
+        )
 
-            cohorts_data.append({
-                "id": cohort.id,
-                "name": cohort.name,
+        cohorts_data = [
+            {
+                "id": cohort['id'],
+                "name": cohort['name'],
                 "course_id": str(course_key),
-                "assignment_type": assignment_type,
-                "member_count": member_count
-            })
+                "assignment_type": cohort['cohort__assignment_type'] or 'manual',
+                "member_count": cohort['member_count']
+            }
+            for cohort in cohorts
+        ]
+
+        # Only an empty listing needs to tell a missing course apart
+        if not cohorts_data and not CourseOverview.objects.filter(id=course_key).exists():
+            return {
+                "success": False,
+                "error": "course_not_found",
+                "message": f"Course not found: {course_id}"
+            }
 
         logger.info(
             f"Listed {len(cohorts_data)} cohorts for course {course_id} "
@@ -5090,17 +5479,29 @@ def remove_user_from_cohort_logic(
         }
 
 
-def list_cohort_members_logic(course_id: str, cohort_id: int, user_identifier=None) -> dict:
+def list_cohort_members_logic(
+    course_id: str,
+    cohort_id: int,
+    user_identifier=None,
+    cursor: int = None,
+    page_size: int = COHORT_MEMBERS_PAGE_SIZE,
+) -> dict:
     """
-    List all members of a specific cohort.
+    List the members of a specific cohort, one page at a time.
+
+    Members are ordered by user id. ``cursor`` is the ``next_cursor`` of the
+    previous page (the last user id it returned); the enrollment status of a
+    page is resolved with a single ``CourseEnrollment`` query.
 
     Args:
         course_id (str): Course identifier (e.g., course-v1:ORG+NUM+RUN)
         cohort_id (int): ID of the cohort to list members for
         user_identifier: User requesting the information
+        cursor (int): Return members after this user id
+        page_size (int): Maximum number of members to return
 
     Returns:
-        dict: Success/error response with list of cohort members
+        dict: Success/error response with a page of cohort members
     """
     from django.contrib.auth import get_user_model
     from opaque_keys.edx.keys import CourseKey
@@ -5165,33 +5566,26 @@ def list_cohort_members_logic(course_id: str, cohort_id: int, user_identifier=No
                 "message": f"Cohort with ID {cohort_id} is missing from course {course_id}"
             }
 
-        # Import enrollment model
-        try:
-            from common.djangoapps.student.models import CourseEnrollment
-        except ImportError:
-            pass  # Continue without enrollment info
-
-        # Get cohort members
-        members = cohort.users.all()
+        # Get one page of cohort members (one extra row tells if there are more)
+        members = cohort.users.order_by('id')
+        if cursor:
+            members = members.filter(id__gt=cursor)
+        members_data = list(
+            members.values('id', 'username', 'email', 'first_name', 'last_name', 'is_active')[:page_size + 1]
+        )
+        has_more = len(members_data) > page_size
+        members_data = members_data[:page_size]
 
-        members_data = []
-        for user in members:
-            # Check enrollment status
-            is_enrolled = False
-            try:
-                is_enrolled = CourseEnrollment.is_enrolled(user, course_key)
-            except Exception:
-                pass  # Continue without enrollment status
-
-            members_data.append({
-                "id": user.id,
-                "username": user.username,
-                "email": user.email,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "is_active": user.is_active,
-                "is_enrolled": is_enrolled
-            })
+        # Enrollment status for the whole page in one query
+        enrolled_ids = set(
+            CourseEnrollment.objects.filter(
+                course_id=course_key,
+                user_id__in=[member['id'] for member in members_data],
+                is_active=True,
+            ).values_list('user_id', flat=True)
+        ) if members_data else set()
+        for member in members_data:
+            member['is_enrolled'] = member['id'] in enrolled_ids
 
         logger.info(
             f"Listed {len(members_data)} members for cohort '{cohort.name}' "
@@ -5206,7 +5600,9 @@ def list_cohort_members_logic(course_id: str, cohort_id: int, user_identifier=No
                 "course_id": str(course_key)
             },
             "members": members_data,
-            "total_members": len(members_data)
+            "total_members": cohort.users.count(),
+            "page_size": page_size,
+            "next_cursor": members_data[-1]['id'] if has_more else None
         }
 
     except Exception as e:
@@ -5334,6 +5730,327 @@ def delete_cohort_logic(course_id: str, cohort_id: int, user_identifier=None) ->
         }
 
 
+def _resolve_roster(user_identifiers):
+    """
+    Return one result row per distinct identifier of a bulk cohort request.
+
+    Rows carry the ``identifier`` and, when it matched a user, its
+    ``user_id`` and ``username`` (both ``None`` otherwise).
+    """
+    identifiers = list(dict.fromkeys(str(identifier).strip() for identifier in user_identifiers))
+    identifiers = [identifier for identifier in identifiers if identifier]
+    resolved = _resolve_users_bulk(identifiers)
+
+    results = []
+    for identifier in identifiers:
+        row = resolved.get(identifier) or {}
+        results.append({"identifier": identifier, "user_id": row.get("id"), "username": row.get("username")})
+    return results
+
+
+def _cohort_member_ids(cohort, user_ids):
+    """Return which of ``user_ids`` are members of ``cohort``, in batched queries."""
+    member_ids = set()
+    for batch in _batched(user_ids, BULK_LOOKUP_BATCH_SIZE):
+        member_ids.update(cohort.users.filter(id__in=batch).values_list('id', flat=True))
+    return member_ids
+
+
+def _apply_cohort_changes(pending, apply, progress_callback=None):
+    """
+    Call ``apply(user)`` for every pending result row, in transactional chunks.
+
+    Each chunk loads its users with one query and commits in one transaction;
+    a savepoint per row keeps one failure from undoing the rest of the chunk.
+    ``apply`` returns the fields to record on the row.
+    """
+    processed = 0
+    for chunk in _batched(pending, COHORT_BULK_CHUNK_SIZE):
+        users = User.objects.in_bulk([entry["user_id"] for entry in chunk])
+        with transaction.atomic():
+            for entry in chunk:
+                try:
+                    with transaction.atomic():
+                        entry.update(apply(users[entry["user_id"]]))
+                except Exception as e:  # pylint: disable=broad-except
+                    entry.update({"status": "failed", "error": str(e)})
+        processed += len(chunk)
+        if progress_callback:
+            progress_callback(processed, len(pending))
+
+
+def _status_counts(results, statuses):
+    """Count result rows per status."""
+    counts = dict.fromkeys(statuses, 0)
+    for entry in results:
+        counts[entry["status"]] += 1
+    return counts
+
+
+def bulk_add_users_to_cohort_logic(
+    course_id: str,
+    cohort_id: int,
+    user_identifiers: list,
+    user_identifier=None,
+    progress_callback=None,
+) -> dict:
+    """
+    Add many users to a cohort in one operation.
+
+    The course and cohort are validated once, all identifiers are resolved
+    with a few batched queries and enrollment is checked with one set query
+    per batch. Assignments are applied in transactional chunks of
+    ``COHORT_BULK_CHUNK_SIZE`` users through the platform's
+    ``add_user_to_cohort``, so membership signals and events still fire.
+
+    Args:
+        course_id (str): Course identifier (e.g., course-v1:ORG+NUM+RUN)
+        cohort_id (int): ID of the cohort to add users to
+        user_identifiers (list): Users to add (usernames, emails, or user ids)
+        user_identifier: User performing the action
+        progress_callback (callable): Called with ``(processed, total)`` after each chunk
+
+    Returns:
+        dict: Success/error response with per-row ``results`` and status counts
+    """
+    try:
+        if not course_id:
+            return {"success": False, "error": "missing_course_id", "message": "course_id is required"}
+        if not cohort_id:
+            return {"success": False, "error": "missing_cohort_id", "message": "cohort_id is required"}
+        if not user_identifiers:
+            return {
+                "success": False,
+                "error": "missing_user_identifiers",
+                "message": "user_identifiers must list at least one user"
+            }
+
+        course_id = _normalize_course_id(course_id)
+
+        acting_user = _get_acting_user(user_identifier)
+        if not acting_user:
+            return {"success": False, "error": "acting_user_not_found", "message": "Acting user not found"}
+
+        try:
+            course_key = CourseKey.from_string(course_id)
+        except Exception as e:
+            return {"success": False, "error": "invalid_course_id", "message": f"Invalid course_id format: {str(e)}"}
+
+        try:
+            from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort, get_cohort_by_id
+        except ImportError:
+            return {
+                "success": False,
+                "error": "cohorts_not_available",
+                "message": "Cohorts functionality not available"
+            }
+
+        try:
+            cohort = get_cohort_by_id(course_key, cohort_id)
+        except Exception:
+            return {
+                "success": False,
+                "error": "cohort_not_found",
+                "message": f"Cohort with ID {cohort_id} is missing from course {course_id}"
+            }
+
+        results = _resolve_roster(user_identifiers)
+        user_ids = {entry["user_id"] for entry in results if entry["user_id"]}
+        enrolled_ids, member_ids = set(), _cohort_member_ids(cohort, user_ids)
+        for batch in _batched(user_ids, BULK_LOOKUP_BATCH_SIZE):
+            enrolled_ids.update(
+                CourseEnrollment.objects.filter(
+                    course_id=course_key, user_id__in=batch, is_active=True
+                ).values_list('user_id', flat=True)
+            )
+
+        pending, seen_ids = [], set()
+        for entry in results:
+            if not entry["user_id"]:
+                entry["status"] = "not_found"
+            elif entry["user_id"] in seen_ids:
+                # The same user listed under two identifiers is only handled once
+                entry["status"] = "duplicate"
+            elif entry["user_id"] not in enrolled_ids:
+                entry["status"] = "not_enrolled"
+            elif entry["user_id"] in member_ids:
+                entry["status"] = "already_member"
+            else:
+                pending.append(entry)
+            seen_ids.add(entry["user_id"])
+
+        def _add(user):
+            _user, previous_cohort, _preassigned = add_user_to_cohort(cohort, user)
+            return {"status": "moved" if previous_cohort else "added", "previous_cohort": previous_cohort}
+
+        _apply_cohort_changes(pending, _add, progress_callback)
+        counts = _status_counts(
+            results, ("added", "moved", "already_member", "duplicate", "not_found", "not_enrolled", "failed")
+        )
+
+        logger.info(
+            f"Bulk cohort assignment to '{cohort.name}' in course {course_id} by {acting_user.username}: {counts}"
+        )
+
+        return {
+            "success": True,
+            "action": "bulk_add_users_to_cohort",
+            "cohort": {
+                "id": cohort.id,
+                "name": cohort.name,
+                "course_id": str(course_key)
+            },
+            "total": len(results),
+            **counts,
+            "results": results,
+            "performed_by": acting_user.username,
+        }
+
+    except Exception as e:
+        logger.exception(f"Failed bulk cohort assignment: {str(e)}")
+        return {
+            "success": False,
+            "error": "operation_failed",
+            "message": f"Failed to add users to cohort: {str(e)}"
+        }
+
+
+def bulk_move_cohort_members_logic(
+    course_id: str,
+    source_cohort_id: int,
+    user_identifiers: list,
+    target_cohort_id: int = None,
+    user_identifier=None,
+) -> dict:
+    """
+    Move many users from one cohort to another, or remove them from it.
+
+    The course and both cohorts are validated once and users are resolved
+    with batched queries. Users that are not in the source cohort are
+    skipped and reported. Memberships are updated in transactional chunks
+    through the platform's cohort API.
+
+    Args:
+        course_id (str): Course identifier (e.g., course-v1:ORG+NUM+RUN)
+        source_cohort_id (int): ID of the cohort the users are taken from
+        user_identifiers (list): Users to move (usernames, emails, or user ids)
+        target_cohort_id (int): ID of the cohort to move them to; ``None`` removes them
+        user_identifier: User performing the action
+
+    Returns:
+        dict: Success/error response with per-row ``results``, status counts
+        and the ``skipped`` identifiers
+    """
+    try:
+        if not course_id:
+            return {"success": False, "error": "missing_course_id", "message": "course_id is required"}
+        if not source_cohort_id:
+            return {"success": False, "error": "missing_cohort_id", "message": "source_cohort_id is required"}
+        if not user_identifiers:
+            return {
+                "success": False,
+                "error": "missing_user_identifiers",
+                "message": "user_identifiers must list at least one user"
+            }
+        if target_cohort_id == source_cohort_id:
+            return {
+                "success": False,
+                "error": "same_cohort",
+                "message": "target_cohort_id must differ from source_cohort_id"
+            }
+
+        course_id = _normalize_course_id(course_id)
+
+        acting_user = _get_acting_user(user_identifier)
+        if not acting_user:
+            return {"success": False, "error": "acting_user_not_found", "message": "Acting user not found"}
+
+        try:
+            course_key = CourseKey.from_string(course_id)
+        except Exception as e:
+            return {"success": False, "error": "invalid_course_id", "message": f"Invalid course_id format: {str(e)}"}
+
+        try:
+            from openedx.core.djangoapps.course_groups.cohorts import (
+                add_user_to_cohort,
+                get_cohort_by_id,
+                remove_user_from_cohort,
+            )
+        except ImportError:
+            return {
+                "success": False,
+                "error": "cohorts_not_available",
+                "message": "Cohorts functionality not available"
+            }
+
+        cohorts = {}
+        for cohort_id in filter(None, (source_cohort_id, target_cohort_id)):
+            try:
+                cohorts[cohort_id] = get_cohort_by_id(course_key, cohort_id)
+            except Exception:
+                return {
+                    "success": False,
+                    "error": "cohort_not_found",
+                    "message": f"Cohort with ID {cohort_id} is missing from course {course_id}"
+                }
+        source = cohorts[source_cohort_id]
+        target = cohorts.get(target_cohort_id)
+
+        results = _resolve_roster(user_identifiers)
+        member_ids = _cohort_member_ids(source, {entry["user_id"] for entry in results if entry["user_id"]})
+
+        pending, seen_ids = [], set()
+        for entry in results:
+            if not entry["user_id"]:
+                entry["status"] = "not_found"
+            elif entry["user_id"] in seen_ids:
+                # The same user listed under two identifiers is only handled once
+                entry["status"] = "duplicate"
+            elif entry["user_id"] not in member_ids:
+                entry["status"] = "not_in_source"
+            else:
+                pending.append(entry)
+            seen_ids.add(entry["user_id"])
+
+        if target is not None:
+            def _change(user):
+                add_user_to_cohort(target, user)
+                return {"status": "moved"}
+        else:
+            def _change(user):
+                remove_user_from_cohort(source, user.username)
+                return {"status": "removed"}
+
+        _apply_cohort_changes(pending, _change)
+        counts = _status_counts(results, ("moved", "removed", "not_in_source", "duplicate", "not_found", "failed"))
+
+        logger.info(
+            f"Bulk cohort {'move' if target else 'removal'} from '{source.name}' in course {course_id} "
+            f"by {acting_user.username}: {counts}"
+        )
+
+        return {
+            "success": True,
+            "action": "bulk_move_cohort_members" if target else "bulk_remove_cohort_members",
+            "source_cohort": {"id": source.id, "name": source.name},
+            "target_cohort": {"id": target.id, "name": target.name} if target else None,
+            "course_id": str(course_key),
+            "total": len(results),
+            **counts,
+            "skipped": [entry["identifier"] for entry in results if entry["status"] == "not_in_source"],
+            "results": results,
+            "performed_by": acting_user.username,
+        }
+
+    except Exception as e:
+        logger.exception(f"Failed bulk cohort move: {str(e)}")
+        return {
+            "success": False,
+            "error": "operation_failed",
+            "message": f"Failed to move cohort members: {str(e)}"
+        }
+
+
 def get_vertical_contents_logic(
     course_id: str,
     vertical_id: str,
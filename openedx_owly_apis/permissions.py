@@ -5,15 +5,27 @@ Custom DRF permissions for Open edX roles.
 - IsCourseStaff: requires the user to be course staff for the relevant course
 
 The permission helpers infer course and organization context from query parameters
-or the request body when possible.
+or the request body when possible. Role checks are cached per request and for a
+short TTL across requests (see ``openedx_owly_apis.role_cache``).
 """
 from typing import Optional
 
 from common.djangoapps.student.auth import CourseCreatorRole, OrgContentCreatorRole, user_has_role
-from common.djangoapps.student.roles import CourseStaffRole
+from common.djangoapps.student.roles import CourseInstructorRole, CourseLimitedStaffRole, CourseStaffRole
+from django.conf import settings
+from django.db.models import Q
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from rest_framework.permissions import BasePermission
 
+from openedx_owly_apis.role_cache import cached_role_check, cached_role_checks
+
+# Role check kinds resolved together by ``get_course_roles``. They also name
+# the cached answers, so single checks must use the same kinds and scopes.
+COURSE_TEAM = "course_team"
+COURSE_STAFF = "course_staff"
+COURSE_CREATOR = "course_creator"
+ORG_COURSE_CREATOR = "org_course_creator"
+
 
 def _get_course_key_from_request(request) -> Optional[CourseKey]:
     """Extract a ``CourseKey`` from ``course_id`` or block identifiers in the request."""
@@ -66,11 +78,13 @@ def is_course_creator_user(user, org: Optional[str] = None) -> bool:
     if not getattr(user, "is_authenticated", False):
         return False
 
-    if user_has_role(user, CourseCreatorRole()):
+    if cached_role_check(user, COURSE_CREATOR, "", lambda: user_has_role(user, CourseCreatorRole())):
         return True
 
     if org:
-        return user_has_role(user, OrgContentCreatorRole(org=org))
+        return cached_role_check(
+            user, ORG_COURSE_CREATOR, org, lambda: user_has_role(user, OrgContentCreatorRole(org=org))
+        )
 
     return False
 
@@ -79,7 +93,83 @@ def is_course_staff_user(user, course_key: Optional[CourseKey]) -> bool:
     """Return whether the user is course staff for the given course."""
     if not getattr(user, "is_authenticated", False) or course_key is None:
         return False
-    return CourseStaffRole(course_key).has_user(user)
+    return cached_role_check(
+        user, COURSE_STAFF, str(course_key), lambda: CourseStaffRole(course_key).has_user(user)
+    )
+
+
+def _query_course_roles(user, checks):
+    """Resolve ``get_course_roles`` checks with a single ``CourseAccessRole`` query."""
+    # pylint: disable=import-outside-toplevel
+    from common.djangoapps.student.models import CourseAccessRole
+
+    results = dict.fromkeys(checks, False)
+    if not getattr(user, "is_active", False):
+        return results
+
+    # Same rules as user_has_role: global staff hold every creator role, and
+    # DISABLE_COURSE_CREATION / ENABLE_CREATOR_GROUP decide the global one.
+    is_global_staff = bool(getattr(user, "is_staff", False))
+    features = getattr(settings, "FEATURES", {})
+    if features.get("DISABLE_COURSE_CREATION", False):
+        global_creator = is_global_staff
+    elif not features.get("ENABLE_CREATOR_GROUP", False):
+        global_creator = True
+    else:
+        global_creator = is_global_staff or None
+
+    course_keys = [scope for kind, scope in checks if kind == COURSE_TEAM]
+    staff_course_keys = [scope for kind, scope in checks if kind == COURSE_STAFF]
+    orgs = [scope for kind, scope in checks if kind == ORG_COURSE_CREATOR]
+    team_roles = [CourseInstructorRole.ROLE, CourseStaffRole.ROLE, CourseLimitedStaffRole.ROLE]
+    role_filter = Q()
+    if course_keys:
+        role_filter |= Q(course_id__in=course_keys, role__in=team_roles)
+    if staff_course_keys:
+        role_filter |= Q(course_id__in=staff_course_keys, role=CourseStaffRole.ROLE)
+    if orgs:
+        role_filter |= Q(org__in=orgs, role=OrgContentCreatorRole.ROLE)
+    if global_creator is None and (COURSE_CREATOR, "") in results:
+        role_filter |= Q(org="", role=CourseCreatorRole.ROLE)
+
+    held = set()
+    if role_filter:
+        rows = CourseAccessRole.objects.filter(role_filter, user_id=user.id).values_list("role", "org", "course_id")
+        for role, org, course_id in rows:
+            if role == CourseCreatorRole.ROLE:
+                held.add((COURSE_CREATOR, ""))
+            elif role == OrgContentCreatorRole.ROLE:
+                held.add((ORG_COURSE_CREATOR, org))
+            else:
+                held.add((COURSE_TEAM, str(course_id)))
+                if role == CourseStaffRole.ROLE:
+                    held.add((COURSE_STAFF, str(course_id)))
+
+    for check in checks:
+        kind = check[0]
+        if kind == COURSE_CREATOR and global_creator is not None:
+            results[check] = global_creator
+        else:
+            results[check] = check in held or (kind == ORG_COURSE_CREATOR and is_global_staff)
+    return results
+
+
+def get_course_roles(user, checks) -> dict:
+    """
+    Resolve several role checks for ``user`` at once.
+
+    ``checks`` lists ``(kind, scope)`` pairs: ``(COURSE_TEAM, course_id)`` for
+    instructor, staff or limited staff of a course, ``(COURSE_STAFF,
+    course_id)`` for course staff only (as ``is_course_staff_user``),
+    ``(COURSE_CREATOR, "")`` for the global course creator role and
+    ``(ORG_COURSE_CREATOR, org)``.
+    Cached answers are reused and the rest are resolved with one query.
+    Returns a dict keyed by the pairs.
+    """
+    checks = [(kind, str(scope)) for kind, scope in checks]
+    if not getattr(user, "is_authenticated", False):
+        return dict.fromkeys(checks, False)
+    return cached_role_checks(user, checks, lambda missing: _query_course_roles(user, missing))
 
 
 class IsCourseCreator(BasePermission):
@@ -92,15 +182,8 @@ class IsCourseCreator(BasePermission):
             return False
 
         course_key = _get_course_key_from_request(request)
-        org = _get_org_from_request(request, course_key)
-
-        # CourseCreator global
-        if user_has_role(user, CourseCreatorRole()):
-            return True
-        # Por organización (si se proporciona o se puede inferir)
-        if org:
-            return user_has_role(user, OrgContentCreatorRole(org=org))
-        return False
+        # CourseCreator global o por organización (si se proporciona o se puede inferir)
+        return is_course_creator_user(user, _get_org_from_request(request, course_key))
 
 
 class IsCourseStaff(BasePermission):
@@ -117,7 +200,7 @@ class IsCourseStaff(BasePermission):
             # No hay forma de validar staff de curso sin contexto del curso
             return False
 
-        return CourseStaffRole(course_key).has_user(user)
+        return is_course_staff_user(user, course_key)
 
 
 class IsAdminOrCourseCreator(BasePermission):
@@ -0,0 +1,87 @@
+"""
+Incrementally maintained platform-wide counters.
+
+Counting every course overview and active enrollment on each platform
+overview request means a full scan of the enrollment table. Instead the
+totals live in ``OwlyPlatformCounter`` rows: signal receivers adjust them as
+enrollments and course overviews change, and
+``reconcile_platform_counters`` recounts them periodically to correct any
+drift (e.g. from bulk updates that bypass signals).
+"""
+
+import logging
+
+from django.db.models import F
+from django.utils import timezone
+
+from openedx_owly_apis.models import OwlyPlatformCounter
+
+logger = logging.getLogger(__name__)
+
+TOTAL_COURSES = "total_courses"
+TOTAL_ACTIVE_ENROLLMENTS = "total_active_enrollments"
+PLATFORM_COUNTERS = (TOTAL_COURSES, TOTAL_ACTIVE_ENROLLMENTS)
+
+
+def adjust_counter(name, delta):
+    """
+    Add ``delta`` to the counter ``name``.
+
+    Counters that were never reconciled are left alone; they are seeded with
+    a full count on first read instead.
+    """
+    if not delta:
+        return
+    OwlyPlatformCounter.objects.filter(name=name).update(value=F("value") + delta, updated_at=timezone.now())
+
+
+def compute_platform_counts():
+    """Count platform totals from the source tables."""
+    # pylint: disable=import-outside-toplevel,import-error
+    from common.djangoapps.student.models import CourseEnrollment
+    from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+    return {
+        TOTAL_COURSES: CourseOverview.get_all_courses().count(),
+        TOTAL_ACTIVE_ENROLLMENTS: CourseEnrollment.objects.filter(is_active=True).count(),
+    }
+
+
+def reconcile_platform_counters():
+    """
+    Recount every platform counter and store the exact values.
+
+    Returns a dict mapping each counter to the drift that was corrected.
+    """
+    counts = compute_platform_counts()
+    now = timezone.now()
+    previous = dict(OwlyPlatformCounter.objects.filter(name__in=counts).values_list("name", "value"))
+    for name, value in counts.items():
+        OwlyPlatformCounter.objects.update_or_create(
+            name=name,
+            defaults={"value": value, "updated_at": now, "reconciled_at": now},
+        )
+
+    drift = {name: value - previous[name] for name, value in counts.items() if name in previous}
+    if any(drift.values()):
+        logger.info("Reconciled platform counters with drift %s", drift)
+    return drift
+
+
+def get_platform_counters():
+    """
+    Return the platform counters with their last update and reconcile times.
+
+    Missing counters are seeded with a full recount, so only the very first
+    read pays for counting the source tables.
+    """
+    rows = {row.name: row for row in OwlyPlatformCounter.objects.filter(name__in=PLATFORM_COUNTERS)}
+    if len(rows) < len(PLATFORM_COUNTERS):
+        reconcile_platform_counters()
+        rows = {row.name: row for row in OwlyPlatformCounter.objects.filter(name__in=PLATFORM_COUNTERS)}
+
+    return {
+        "counters": {name: rows[name].value for name in PLATFORM_COUNTERS},
+        "updated_at": max(row.updated_at for row in rows.values()).isoformat(),
+        "reconciled_at": min(row.reconciled_at for row in rows.values()).isoformat(),
+    }
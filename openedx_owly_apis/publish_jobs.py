@@ -1,48 +1,34 @@
-"""Cache-backed job helpers for async content publishing."""
+"""Job helpers for async content publishing."""
 
-from uuid import uuid4
+from openedx_owly_apis.job_store import create_job, get_job, update_job
+from openedx_owly_apis.models import OwlyAsyncJob
+from openedx_owly_apis.task_routing import route_params
 
-from django.core.cache import cache
-from django.utils import timezone
+JOB_TYPE = OwlyAsyncJob.TYPE_PUBLISH_CONTENT
 
-JOB_CACHE_KEY_PREFIX = "openedx_owly_apis:publish_job"
-JOB_CACHE_TIMEOUT_SECONDS = 60 * 60
 
+def create_publish_content_job(content_id, publish_type="auto", user_identifier=None, course_id=None, route=None):
+    """
+    Create a pending async publish job entry and return its payload.
 
-def _job_cache_key(job_id):
-    return "{}:{}".format(JOB_CACHE_KEY_PREFIX, job_id)
-
-
-def _timestamp():
-    return timezone.now().isoformat()
-
-
-def create_publish_content_job(content_id, publish_type="auto", user_identifier=None, course_id=None):
-    """Create a pending async publish job entry and return its payload."""
-    job_id = str(uuid4())
-    payload = {
-        "job_id": job_id,
-        "status": "pending",
-        "content_id": content_id,
-        "publish_type": publish_type,
-        "course_id": course_id,
-        "requested_by": str(user_identifier) if user_identifier is not None else None,
-        "created_at": _timestamp(),
-        "updated_at": _timestamp(),
-    }
-    cache.set(_job_cache_key(job_id), payload, JOB_CACHE_TIMEOUT_SECONDS)
-    return payload
+    ``route`` is the ``openedx_owly_apis.task_routing`` decision for the job;
+    its lane and block estimate are recorded on the job.
+    """
+    return create_job(
+        JOB_TYPE,
+        course_id=course_id,
+        user_identifier=user_identifier,
+        content_id=content_id,
+        publish_type=publish_type,
+        **route_params(route),
+    )
 
 
 def get_publish_content_job(job_id):
-    """Return the cached async publish job payload, if present."""
-    return cache.get(_job_cache_key(job_id))
+    """Return the async publish job payload, if present."""
+    return get_job(job_id, job_type=JOB_TYPE)
 
 
 def update_publish_content_job(job_id, **changes):
-    """Update an existing async publish job payload and persist it back to cache."""
-    payload = get_publish_content_job(job_id) or {"job_id": job_id}
-    payload.update(changes)
-    payload["updated_at"] = _timestamp()
-    cache.set(_job_cache_key(job_id), payload, JOB_CACHE_TIMEOUT_SECONDS)
-    return payload
+    """Update an existing async publish job and return its payload."""
+    return update_job(job_id, **changes)
@@ -0,0 +1,111 @@
+"""
+Cache for course role checks.
+
+Permission classes, job access checks and the roles endpoint ask the same
+"is this user staff / a course creator here?" questions many times per
+request. Answers are memoized for the request in a ``RequestCache`` and
+shared across requests for a short TTL under a per-user version number.
+``CourseAccessRole`` signals (see ``openedx_owly_apis.signals``) bump that
+version, so a role change drops every cached answer for the user at once.
+"""
+
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.cache import cache
+from edx_django_utils.cache import RequestCache
+
+ROLE_CACHE_KEY_PREFIX = "openedx_owly_apis:roles"
+ROLE_CACHE_TIMEOUT_SECONDS = 60
+_REQUEST_CACHE_NAMESPACE = ROLE_CACHE_KEY_PREFIX
+
+
+def _version_key(user_id):
+    return "{}:version:{}".format(ROLE_CACHE_KEY_PREFIX, user_id)
+
+
+def get_role_cache_timeout():
+    """Return the role cache TTL in seconds."""
+    return getattr(settings, "OWLY_ROLE_CACHE_TIMEOUT", ROLE_CACHE_TIMEOUT_SECONDS)
+
+
+def get_user_role_version(user_id):
+    """Return the current role cache version for ``user_id``."""
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        cache.add(_version_key(user_id), 1, None)
+        version = cache.get(_version_key(user_id), 1)
+    return version
+
+
+def invalidate_user_roles(user_id):
+    """Drop every cached role check for ``user_id``."""
+    if user_id is None:
+        return
+    RequestCache(_REQUEST_CACHE_NAMESPACE).clear()
+    key = _version_key(user_id)
+    if not cache.add(key, 2, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # The version expired between add() and incr(); start over.
+            cache.set(key, 2, None)
+
+
+def _request_key(user_id, kind, scope):
+    return "{}:{}:{}".format(user_id, kind, scope)
+
+
+def _result_key(user_id, version, kind, scope):
+    # Organizations and course keys may hold characters memcached rejects.
+    return "{}:{}:v{}:{}:{}".format(ROLE_CACHE_KEY_PREFIX, user_id, version, kind, quote(str(scope), safe=""))
+
+
+def cached_role_checks(user, checks, check_many):
+    """
+    Return the results of several role checks for ``user``, cached.
+
+    ``checks`` lists ``(kind, scope)`` pairs, where ``kind`` names the check
+    and ``scope`` is the course key or organization it applies to (empty for
+    global roles). ``check_many(missing)`` resolves the pairs that are not
+    cached yet, all at once, and returns a dict keyed by pair. Users without
+    an id are never cached.
+    """
+    checks = list(dict.fromkeys(checks))
+    user_id = getattr(user, "id", None)
+    if user_id is None:
+        return {check: bool(value) for check, value in check_many(checks).items()}
+
+    request_cache = RequestCache(_REQUEST_CACHE_NAMESPACE)
+    results, missing = {}, []
+    for check in checks:
+        cached = request_cache.get_cached_response(_request_key(user_id, *check))
+        if cached.is_found:
+            results[check] = cached.value
+        else:
+            missing.append(check)
+    if not missing:
+        return results
+
+    version = get_user_role_version(user_id)
+    keys = {check: _result_key(user_id, version, *check) for check in missing}
+    shared = cache.get_many(list(keys.values()))
+    unresolved = [check for check in missing if keys[check] not in shared]
+    if unresolved:
+        resolved = {keys[check]: bool(value) for check, value in check_many(unresolved).items()}
+        cache.set_many(resolved, get_role_cache_timeout())
+        shared.update(resolved)
+
+    for check in missing:
+        results[check] = shared[keys[check]]
+        request_cache.set(_request_key(user_id, *check), results[check])
+    return results
+
+
+def cached_role_check(user, kind, scope, check):
+    """
+    Return the result of the role check ``check()`` for ``user``, cached.
+
+    ``kind`` and ``scope`` identify the check as in ``cached_role_checks``.
+    """
+    return cached_role_checks(user, [(kind, scope)], lambda missing: {(kind, scope): check()})[(kind, scope)]
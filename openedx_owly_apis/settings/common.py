@@ -8,5 +8,32 @@ def plugin_settings(settings):
     """
     Inject local settings into django settings.
     """
-    # settings.EXAMPLE = value
-    del settings  # used for side-effect documentation; no-op to satisfy lint
+    # Seconds course analytics results stay cached; enrollment and discussion
+    # configuration changes invalidate them earlier.
+    settings.OWLY_ANALYTICS_CACHE_TIMEOUT = getattr(settings, 'OWLY_ANALYTICS_CACHE_TIMEOUT', 60)
+
+    # Seconds course role checks stay cached; role changes invalidate them earlier.
+    settings.OWLY_ROLE_CACHE_TIMEOUT = getattr(settings, 'OWLY_ROLE_CACHE_TIMEOUT', 60)
+
+    # Async jobs touching fewer blocks than BULK_BLOCK_THRESHOLD (cohort
+    # assignments: fewer users than BULK_USER_THRESHOLD) go to the
+    # interactive queue, larger ones to the bulk queue. CONCURRENCY caps how
+    # many jobs of each lane may run at once; a job waiting longer than
+    # CONCURRENCY_MAX_WAIT_SECONDS for a slot runs anyway. Slots are counted
+    # in the shared cache and expire after RUNNING_JOB_STALE_SECONDS, so jobs
+    # running longer than that can make a lane overshoot its cap. A queue of
+    # None keeps Celery's default routing.
+    settings.OWLY_TASK_ROUTING = {
+        'INTERACTIVE_QUEUE': getattr(settings, 'HIGH_PRIORITY_QUEUE', None),
+        'BULK_QUEUE': getattr(settings, 'LOW_PRIORITY_QUEUE', None),
+        'BULK_BLOCK_THRESHOLD': 500,
+        'BULK_USER_THRESHOLD': 1000,
+        'CONCURRENCY': {
+            'interactive': 8,
+            'bulk': 2,
+        },
+        'CONCURRENCY_RETRY_SECONDS': 30,
+        'CONCURRENCY_MAX_WAIT_SECONDS': 30 * 60,
+        'RUNNING_JOB_STALE_SECONDS': 60 * 60,
+        **getattr(settings, 'OWLY_TASK_ROUTING', {}),
+    }
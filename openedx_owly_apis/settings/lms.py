@@ -0,0 +1,31 @@
+# coding=utf-8
+"""
+LMS Pluggable Django App settings.
+"""
+
+from openedx_owly_apis.settings import common
+
+
+def plugin_settings(settings):
+    """
+    Inject local settings into the LMS django settings.
+
+    Periodic tasks are only scheduled here, so they do not run twice when
+    Celery beat runs for both the LMS and Studio.
+    """
+    common.plugin_settings(settings)
+
+    # Platform overview counters are maintained from signals and recounted
+    # periodically to correct drift; enrollment and detailed analytics of
+    # active courses are precomputed into snapshots.
+    settings.CELERY_BEAT_SCHEDULE = {
+        **getattr(settings, 'CELERY_BEAT_SCHEDULE', {}),
+        'openedx_owly_apis.reconcile_platform_counters': {
+            'task': 'openedx_owly_apis.reconcile_platform_counters',
+            'schedule': getattr(settings, 'OWLY_PLATFORM_COUNTERS_RECONCILE_SECONDS', 60 * 60),
+        },
+        'openedx_owly_apis.schedule_analytics_snapshots': {
+            'task': 'openedx_owly_apis.schedule_analytics_snapshots',
+            'schedule': getattr(settings, 'OWLY_ANALYTICS_SNAPSHOT_INTERVAL_SECONDS', 30 * 60),
+        },
+    }
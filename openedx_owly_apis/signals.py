@@ -0,0 +1,61 @@
+"""
+Signal receivers for openedx_owly_apis.
+
+They are connected through the ``PluginSignals`` configuration in
+``openedx_owly_apis.apps``.
+"""
+
+from openedx_owly_apis.analytics_cache import invalidate_course_analytics
+from openedx_owly_apis.platform_counters import TOTAL_ACTIVE_ENROLLMENTS, TOTAL_COURSES, adjust_counter
+from openedx_owly_apis.role_cache import invalidate_user_roles
+
+# Values of common.djangoapps.student.models.EnrollStatusChange that change
+# whether an enrollment is active.
+_ENROLLMENT_DELTAS = {
+    "enroll": 1,
+    "unenroll": -1,
+}
+
+
+def handle_enroll_status_change(sender, event=None, course_id=None, **kwargs):  # pylint: disable=unused-argument
+    """Track enrollment activation and invalidate course analytics on enrollment changes."""
+    adjust_counter(TOTAL_ACTIVE_ENROLLMENTS, _ENROLLMENT_DELTAS.get(str(event), 0))
+    invalidate_course_analytics(course_id)
+
+
+def handle_course_enrollment_saved(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate course analytics when a ``CourseEnrollment`` row changes."""
+    invalidate_course_analytics(getattr(instance, "course_id", None))
+
+
+def handle_course_enrollment_deleted(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Update platform counters and course analytics when a ``CourseEnrollment`` row is deleted."""
+    if getattr(instance, "is_active", False):
+        adjust_counter(TOTAL_ACTIVE_ENROLLMENTS, -1)
+    invalidate_course_analytics(getattr(instance, "course_id", None))
+
+
+def handle_course_overview_saved(sender, instance, created=False, **kwargs):  # pylint: disable=unused-argument
+    """Count newly created course overviews."""
+    if created:
+        adjust_counter(TOTAL_COURSES, 1)
+
+
+def handle_course_overview_deleted(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Stop counting deleted course overviews."""
+    adjust_counter(TOTAL_COURSES, -1)
+
+
+def handle_course_mode_saved(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate course analytics when a ``CourseMode`` of the course changes."""
+    invalidate_course_analytics(getattr(instance, "course_id", None))
+
+
+def handle_discussions_configuration_saved(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate course analytics when the course discussion configuration changes."""
+    invalidate_course_analytics(getattr(instance, "context_key", None))
+
+
+def handle_course_access_role_changed(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate cached role checks of the user whose ``CourseAccessRole`` changed."""
+    invalidate_user_roles(getattr(instance, "user_id", None))
@@ -0,0 +1,240 @@
+"""
+Queue routing for async Owly Celery tasks.
+
+Jobs are sent to an ``interactive`` or a ``bulk`` lane depending on how many
+blocks they are expected to touch, so a large course publish cannot starve
+small jobs queued behind it. Queue names, the block threshold and the
+per-lane concurrency caps come from ``settings.OWLY_TASK_ROUTING`` (see
+``openedx_owly_apis.settings.common``).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+DEFAULT_TASK_ROUTING = {
+    "INTERACTIVE_QUEUE": None,
+    "BULK_QUEUE": None,
+    "BULK_BLOCK_THRESHOLD": 500,
+    "BULK_USER_THRESHOLD": 1000,
+    "CONCURRENCY": {INTERACTIVE: 8, BULK: 2},
+    "CONCURRENCY_RETRY_SECONDS": 30,
+    "CONCURRENCY_MAX_WAIT_SECONDS": 30 * 60,
+    "RUNNING_JOB_STALE_SECONDS": 60 * 60,
+}
+
+LANE_SLOT_KEY_PREFIX = "openedx_owly_apis:lane_slots"
+
+# Defaults used by create_course_structure_logic when a unit does not list
+# its subsections or verticals explicitly.
+_DEFAULT_SUBSECTIONS = 1
+_DEFAULT_VERTICALS_PER_SUBSECTION = 2
+
+# Typical number of blocks published with a block of each type; unlisted
+# types are single components.
+PUBLISH_BLOCK_ESTIMATES = {
+    "sequential": 60,
+    "vertical": 10,
+}
+
+
+def get_routing_settings():
+    """Return ``OWLY_TASK_ROUTING`` merged over the defaults."""
+    configured = getattr(settings, "OWLY_TASK_ROUTING", None) or {}
+    routing = {**DEFAULT_TASK_ROUTING, **configured}
+    routing["CONCURRENCY"] = {
+        **DEFAULT_TASK_ROUTING["CONCURRENCY"],
+        **(configured.get("CONCURRENCY") or {}),
+    }
+    return routing
+
+
+def estimate_structure_blocks(units_config):
+    """Return the number of blocks a course structure request will create or sync."""
+    total = 0
+    for unit in (units_config or {}).get("units") or []:
+        total += 1
+        if "subsections_list" in unit:
+            for subsection in unit.get("subsections_list") or []:
+                total += 1 + len(subsection.get("verticals_list") or [])
+        else:
+            subsections = unit.get("subsections", _DEFAULT_SUBSECTIONS)
+            verticals = unit.get("verticals_per_subsection", _DEFAULT_VERTICALS_PER_SUBSECTION)
+            total += subsections * (1 + verticals)
+    return total
+
+
+def _cached_block_structure(course_key):
+    """Return the course's block structure from the block structure cache, or ``None`` on a miss."""
+    # pylint: disable=import-outside-toplevel,import-error
+    from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
+
+    manager = get_block_structure_manager(course_key)
+    # Read the store directly: get_collected() would load the course from
+    # the modulestore on a cache miss.
+    return manager.store.get(manager.root_block_usage_key)
+
+
+def _estimate_from_block_type(usage_key):
+    """Guess the blocks published with ``usage_key`` from its type; courses and sections are unknown."""
+    if usage_key is None or usage_key.block_type in ("course", "chapter"):
+        return None
+    return PUBLISH_BLOCK_ESTIMATES.get(usage_key.block_type, 1)
+
+
+def estimate_publish_blocks(content_id):
+    """
+    Return the number of blocks published for ``content_id``, or ``None`` if unknown.
+
+    Blocks are counted in the course's cached block structure, so routing
+    never loads course content from the modulestore in the request. When the
+    structure is not cached, or does not hold the block yet, the estimate
+    falls back to ``PUBLISH_BLOCK_ESTIMATES`` for the block type; courses
+    and sections of unknown size go to the bulk lane.
+    """
+    from opaque_keys.edx.keys import CourseKey, UsageKey  # pylint: disable=import-outside-toplevel
+
+    try:
+        usage_key = UsageKey.from_string(content_id)
+        course_key = usage_key.course_key
+    except Exception:  # pylint: disable=broad-except
+        usage_key = None
+        try:
+            course_key = CourseKey.from_string(content_id)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    try:
+        structure = _cached_block_structure(course_key)
+    except Exception:  # pylint: disable=broad-except
+        structure = None
+    if structure is None:
+        return _estimate_from_block_type(usage_key)
+    if usage_key is None:
+        return sum(1 for _ in structure)
+    if usage_key not in structure:
+        return _estimate_from_block_type(usage_key)
+
+    total = 0
+    pending = [usage_key]
+    while pending:
+        total += 1
+        pending.extend(structure.get_children(pending.pop()))
+    return total
+
+
+def route_for_blocks(block_count):
+    """
+    Return the routing decision for a job touching ``block_count`` blocks.
+
+    Jobs of unknown size go to the bulk lane. The result holds the ``lane``,
+    the Celery ``queue`` (``None`` keeps Celery's default routing) and the
+    ``estimated_blocks`` it was based on.
+    """
+    return _route_by_size(block_count, "BULK_BLOCK_THRESHOLD")
+
+
+def _route_by_size(size, threshold_setting):
+    routing = get_routing_settings()
+    if size is not None and size < routing[threshold_setting]:
+        lane, queue = INTERACTIVE, routing["INTERACTIVE_QUEUE"]
+    else:
+        lane, queue = BULK, routing["BULK_QUEUE"]
+    return {"lane": lane, "queue": queue, "estimated_blocks": size}
+
+
+def route_course_structure_job(units_config):
+    """Route a course structure job by the size of its ``units_config``."""
+    return route_for_blocks(estimate_structure_blocks(units_config))
+
+
+def route_publish_content_job(content_id, publish_type="auto", course_id=None):
+    """Route a publish job by the number of blocks it will publish."""
+    if publish_type == "course" and course_id:
+        content_id = course_id
+    return route_for_blocks(estimate_publish_blocks(content_id))
+
+
+def route_cohort_assignment_job(user_count):
+    """
+    Route a bulk cohort assignment job by the number of users it assigns.
+
+    Users are compared with ``BULK_USER_THRESHOLD`` rather than the block
+    threshold; the count is recorded as ``estimated_blocks``.
+    """
+    return _route_by_size(user_count, "BULK_USER_THRESHOLD")
+
+
+def route_params(route):
+    """Return the job params recording a routing decision (empty without one)."""
+    if not route:
+        return {}
+    return {"queue": route["lane"], "estimated_blocks": route["estimated_blocks"]}
+
+
+def apply_async_options(route):
+    """Return the ``apply_async`` keyword arguments for a routing decision."""
+    return {"queue": route["queue"]} if route["queue"] else {}
+
+
+def bulk_apply_async_options():
+    """Return the ``apply_async`` keyword arguments for background bulk work."""
+    return apply_async_options(route_for_blocks(None))
+
+
+def _lane_slot_key(lane):
+    return "{}:{}".format(LANE_SLOT_KEY_PREFIX, lane)
+
+
+def acquire_lane_slot(lane):
+    """
+    Take one of ``lane``'s concurrency slots and return whether one was free.
+
+    Slots are counted atomically in the shared cache with ``add``/``incr``,
+    so concurrent workers cannot all pass a full lane. The counter expires
+    ``RUNNING_JOB_STALE_SECONDS`` after it was created, which frees slots
+    leaked by a crashed worker; jobs still running past that can make the
+    lane overshoot its cap. Release the slot with ``release_lane_slot``.
+    """
+    routing = get_routing_settings()
+    limit = routing["CONCURRENCY"].get(lane)
+    if not limit:
+        return True
+    key = _lane_slot_key(lane)
+    cache.add(key, 0, routing["RUNNING_JOB_STALE_SECONDS"])
+    try:
+        taken = cache.incr(key)
+    except ValueError:
+        # The counter expired between add() and incr(); start a new one.
+        cache.add(key, 1, routing["RUNNING_JOB_STALE_SECONDS"])
+        return True
+    if taken > limit:
+        release_lane_slot(lane)
+        return False
+    return True
+
+
+def release_lane_slot(lane):
+    """Give back a slot taken with ``acquire_lane_slot``."""
+    if not get_routing_settings()["CONCURRENCY"].get(lane):
+        return
+    try:
+        if cache.decr(_lane_slot_key(lane)) < 0:
+            # The counter expired and restarted while the slot was held.
+            cache.incr(_lane_slot_key(lane))
+    except ValueError:
+        pass
+
+
+def lane_wait_expired(retries):
+    """
+    Return whether a job has waited ``CONCURRENCY_MAX_WAIT_SECONDS`` for a lane slot.
+
+    ``retries`` is how many times the task was already retried. Past the
+    deadline the job runs regardless, so a lane count stuck on jobs that will
+    never finish cannot hold it back forever.
+    """
+    routing = get_routing_settings()
+    return retries * routing["CONCURRENCY_RETRY_SECONDS"] >= routing["CONCURRENCY_MAX_WAIT_SECONDS"]
@@ -1,93 +1,205 @@
 """Celery tasks for openedx_owly_apis."""
 
+import logging
+from contextlib import contextmanager
+
 from celery import shared_task  # pylint: disable=import-error
 
-from openedx_owly_apis.course_structure_jobs import update_course_structure_job
-from openedx_owly_apis.operations.courses import create_course_structure_logic, publish_content_logic
-from openedx_owly_apis.publish_jobs import update_publish_content_job
+from openedx_owly_apis.analytics_snapshots import (
+    active_course_ids,
+    chunked,
+    get_snapshot_chunk_size,
+    refresh_analytics_snapshots,
+)
+from openedx_owly_apis.cohort_jobs import get_cohort_assignment_job, update_cohort_assignment_job
+from openedx_owly_apis.course_structure_jobs import get_course_structure_job, update_course_structure_job
+from openedx_owly_apis.operations.courses import (
+    bulk_add_users_to_cohort_logic,
+    create_course_structure_logic,
+    publish_content_logic,
+)
+from openedx_owly_apis.platform_counters import reconcile_platform_counters
+from openedx_owly_apis.publish_jobs import get_publish_content_job, update_publish_content_job
+from openedx_owly_apis.task_routing import (
+    acquire_lane_slot,
+    bulk_apply_async_options,
+    get_routing_settings,
+    lane_wait_expired,
+    release_lane_slot,
+)
+
+logger = logging.getLogger(__name__)
 
 
-@shared_task(name="openedx_owly_apis.create_course_structure")
-def create_course_structure_task(job_id, course_id, units_config, edit=False, user_identifier=None):
-    """Run course structure creation asynchronously and store progress in cache."""
-    update_course_structure_job(
-        job_id,
-        status="running",
-        progress_message="Creating course structure",
-    )
+@contextmanager
+def _lane_slot(task, job, update_job):
+    """
+    Hold a concurrency slot of the job's lane while the task body runs.
 
+    Retries ``task`` later when the lane is full; once the job has waited
+    ``CONCURRENCY_MAX_WAIT_SECONDS`` it runs anyway without a slot.
+    """
+    lane = (job or {}).get("queue")
+    if lane and not acquire_lane_slot(lane):
+        if not lane_wait_expired(task.request.retries):
+            update_job(job["job_id"], progress_message=f"Waiting for a free {lane} worker slot")
+            raise task.retry(countdown=get_routing_settings()["CONCURRENCY_RETRY_SECONDS"])
+        logger.warning("Lane %s still full for job %s; running it anyway", lane, job["job_id"])
+        lane = None
     try:
-        result = create_course_structure_logic(
-            course_id=course_id,
-            units_config=units_config,
-            edit=edit,
-            user_identifier=user_identifier,
+        yield
+    finally:
+        if lane:
+            release_lane_slot(lane)
+
+
+@shared_task(bind=True, max_retries=None, name="openedx_owly_apis.create_course_structure")
+def create_course_structure_task(self, job_id, course_id, units_config, edit=False, user_identifier=None):
+    """Run course structure creation asynchronously and record progress in the job store."""
+    with _lane_slot(self, get_course_structure_job(job_id), update_course_structure_job):
+        update_course_structure_job(
+            job_id,
+            status="running",
+            progress_message="Creating course structure",
         )
-    except Exception as exc:  # pylint: disable=broad-exception-caught  # pragma: no cover
-        result = {
-            "success": False,
-            "error": str(exc),
-            "course_id": course_id,
-            "requested_by": str(user_identifier),
-        }
-
-    if result.get("success"):
+
+        try:
+            result = create_course_structure_logic(
+                course_id=course_id,
+                units_config=units_config,
+                edit=edit,
+                user_identifier=user_identifier,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught  # pragma: no cover
+            result = {
+                "success": False,
+                "error": str(exc),
+                "course_id": course_id,
+                "requested_by": str(user_identifier),
+            }
+
+        if result.get("success"):
+            return update_course_structure_job(
+                job_id,
+                status="success",
+                progress_message="Course structure created",
+                result=result,
+            )
+
         return update_course_structure_job(
             job_id,
-            status="success",
-            progress_message="Course structure created",
+            status="failed",
+            progress_message="Course structure creation failed",
             result=result,
-            completed_at=result.get("completed_at"),
+            error=result.get("error"),
         )
 
-    return update_course_structure_job(
-        job_id,
-        status="failed",
-        progress_message="Course structure creation failed",
-        result=result,
-        error=result.get("error"),
-        completed_at=result.get("completed_at"),
-    )
-
-
-@shared_task(name="openedx_owly_apis.publish_content")
-def publish_content_task(job_id, content_id, publish_type="auto", user_identifier=None):
-    """Run content publishing asynchronously and store progress in cache."""
-    update_publish_content_job(
-        job_id,
-        status="running",
-        progress_message="Publishing content",
-    )
 
-    try:
-        result = publish_content_logic(
-            content_id=content_id,
-            publish_type=publish_type,
-            user_identifier=user_identifier,
+@shared_task(bind=True, max_retries=None, name="openedx_owly_apis.publish_content")
+def publish_content_task(self, job_id, content_id, publish_type="auto", user_identifier=None):
+    """Run content publishing asynchronously and record progress in the job store."""
+    with _lane_slot(self, get_publish_content_job(job_id), update_publish_content_job):
+        update_publish_content_job(
+            job_id,
+            status="running",
+            progress_message="Publishing content",
         )
-    except Exception as exc:  # pylint: disable=broad-exception-caught  # pragma: no cover
-        result = {
-            "success": False,
-            "error": str(exc),
-            "content_id": content_id,
-            "publish_type": publish_type,
-            "requested_by": str(user_identifier),
-        }
-
-    if result.get("success"):
+
+        try:
+            result = publish_content_logic(
+                content_id=content_id,
+                publish_type=publish_type,
+                user_identifier=user_identifier,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught  # pragma: no cover
+            result = {
+                "success": False,
+                "error": str(exc),
+                "content_id": content_id,
+                "publish_type": publish_type,
+                "requested_by": str(user_identifier),
+            }
+
+        if result.get("success"):
+            return update_publish_content_job(
+                job_id,
+                status="success",
+                progress_message="Content published",
+                result=result,
+            )
+
         return update_publish_content_job(
             job_id,
-            status="success",
-            progress_message="Content published",
+            status="failed",
+            progress_message="Content publishing failed",
             result=result,
-            completed_at=result.get("completed_at"),
+            error=result.get("error"),
         )
 
-    return update_publish_content_job(
-        job_id,
-        status="failed",
-        progress_message="Content publishing failed",
-        result=result,
-        error=result.get("error"),
-        completed_at=result.get("completed_at"),
-    )
+
+@shared_task(bind=True, max_retries=None, name="openedx_owly_apis.bulk_add_users_to_cohort")
+def bulk_add_users_to_cohort_task(self, job_id, course_id, cohort_id, user_identifiers, user_identifier=None):
+    """Run a bulk cohort assignment asynchronously and record progress in the job store."""
+    with _lane_slot(self, get_cohort_assignment_job(job_id), update_cohort_assignment_job):
+        update_cohort_assignment_job(
+            job_id,
+            status="running",
+            progress_message="Assigning users to cohort",
+        )
+
+        def _report_progress(processed, total):
+            update_cohort_assignment_job(job_id, progress_message=f"Assigned {processed} of {total} users")
+
+        try:
+            result = bulk_add_users_to_cohort_logic(
+                course_id=course_id,
+                cohort_id=cohort_id,
+                user_identifiers=user_identifiers,
+                user_identifier=user_identifier,
+                progress_callback=_report_progress,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught  # pragma: no cover
+            result = {
+                "success": False,
+                "error": str(exc),
+                "course_id": course_id,
+                "cohort_id": cohort_id,
+                "requested_by": str(user_identifier),
+            }
+
+        if result.get("success"):
+            return update_cohort_assignment_job(
+                job_id,
+                status="success",
+                progress_message="Cohort assignment finished",
+                result=result,
+            )
+
+        return update_cohort_assignment_job(
+            job_id,
+            status="failed",
+            progress_message="Cohort assignment failed",
+            result=result,
+            error=result.get("error"),
+        )
+
+
+@shared_task(name="openedx_owly_apis.reconcile_platform_counters")
+def reconcile_platform_counters_task():
+    """Recount the platform overview counters to correct drift from missed signals."""
+    return reconcile_platform_counters()
+
+
+@shared_task(name="openedx_owly_apis.schedule_analytics_snapshots")
+def schedule_analytics_snapshots_task():
+    """Fan out snapshot computation for all active courses in chunks on the bulk queue."""
+    course_ids = active_course_ids()
+    for chunk in chunked(course_ids, get_snapshot_chunk_size()):
+        compute_analytics_snapshots_task.apply_async(args=(chunk,), **bulk_apply_async_options())
+    return len(course_ids)
+
+
+@shared_task(name="openedx_owly_apis.compute_analytics_snapshots")
+def compute_analytics_snapshots_task(course_ids):
+    """Recompute the analytics snapshots of one chunk of courses."""
+    return refresh_analytics_snapshots(course_ids)
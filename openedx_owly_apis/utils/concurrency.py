@@ -0,0 +1,68 @@
+"""
+Run independent pieces of work concurrently on a shared, bounded thread pool.
+
+Used by analytics that combine several unrelated queries, so their latency
+is the slowest query rather than the sum of all of them.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+from edx_django_utils.cache import RequestCache
+
+DEFAULT_MAX_WORKERS = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "OWLY_ANALYTICS_MAX_WORKERS", DEFAULT_MAX_WORKERS),
+                thread_name_prefix="owly-analytics",
+            )
+        return _executor
+
+
+def _timed(func):
+    started = time.perf_counter()
+    try:
+        return func(), (time.perf_counter() - started) * 1000
+    finally:
+        # Pool threads outlive the request; never leave their connections open
+        # or their request cache (thread-local) filled for the next request.
+        connections.close_all()
+        RequestCache.clear_all_namespaces()
+
+
+def run_concurrently(parts):
+    """
+    Run every callable in ``parts`` concurrently and wait for all of them.
+
+    ``parts`` maps a name to a zero-argument callable. Returns
+    ``(results, timings)``: both dicts keyed by part name, with timings in
+    milliseconds plus a ``total`` entry for the wall-clock time. If any part
+    raises, the first exception (in ``parts`` order) is re-raised once all
+    parts have finished.
+    """
+    started = time.perf_counter()
+    executor = _get_executor()
+    futures = {name: executor.submit(_timed, func) for name, func in parts.items()}
+
+    results, timings, errors = {}, {}, []
+    for name, future in futures.items():
+        try:
+            results[name], timings[name] = future.result()
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+    if errors:
+        raise errors[0]
+
+    timings["total"] = (time.perf_counter() - started) * 1000
+    return results, {name: round(value, 2) for name, value in timings.items()}
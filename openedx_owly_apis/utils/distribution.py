@@ -0,0 +1,73 @@
+"""
+Summary statistics for score distributions.
+
+Scores are floats between 0 and 1 (e.g. earned/possible ratios). Count,
+mean, min, max and histogram counts are aggregated by the database; only the
+quantiles need individual scores, and those are read from a bounded sample
+(see ``sample_stride``). Quantiles use linear interpolation between the
+closest ranks, matching NumPy's default method.
+"""
+
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+DEFAULT_BINS = 10
+QUANTILE_SAMPLE_SIZE = 2000
+
+
+def quantile(sorted_values, q):
+    """Return the ``q`` quantile (0..1) of an ascending, non-empty list."""
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def sample_stride(count, sample_size=QUANTILE_SAMPLE_SIZE):
+    """
+    Return ``k`` such that keeping every ``k``-th of ``count`` scores leaves about ``sample_size``.
+
+    A stride of 1 keeps every score, so small distributions get exact quantiles.
+    """
+    return max(1, -(-count // sample_size))
+
+
+def bin_bounds(index, bins=DEFAULT_BINS):
+    """
+    Return the ``(lower, upper)`` bounds of ``score * bins`` for histogram bin ``index``.
+
+    Bins are equal-width over ``[0, 1]``. The first and last bins are open
+    ended (``None``), so a perfect score of 1.0 falls in the last bin and
+    out-of-range scores are clamped into the first or last one.
+    """
+    return (index if index > 0 else None, index + 1 if index < bins - 1 else None)
+
+
+def summarize_distribution(count, mean, minimum, maximum, bin_counts, sample):
+    """
+    Describe a score distribution from its aggregates.
+
+    ``bin_counts`` lists the histogram counts in bin order and ``sample``
+    holds the scores (all of them or a sample) the quantiles are computed
+    from. Returns the count, mean, min, max, the ``QUANTILES`` keyed as
+    ``pNN``, the size of the quantile sample and a histogram with the lower
+    edge of each bin.
+    """
+    if not count:
+        return {
+            "count": 0, "mean": None, "min": None, "max": None,
+            "quantiles": {}, "quantile_sample_size": 0, "histogram": [],
+        }
+
+    ordered = sorted(sample)
+    bins = len(bin_counts)
+    return {
+        "count": count,
+        "mean": round(mean, 4),
+        "min": round(minimum, 4),
+        "max": round(maximum, 4),
+        "quantiles": {f"p{round(q * 100)}": round(quantile(ordered, q), 4) for q in QUANTILES} if ordered else {},
+        "quantile_sample_size": len(ordered),
+        "histogram": [
+            {"lower": round(index / bins, 4), "count": bin_count}
+            for index, bin_count in enumerate(bin_counts)
+        ],
+    }
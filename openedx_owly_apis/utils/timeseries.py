@@ -0,0 +1,87 @@
+"""
+Helpers for date-bucketed analytics time series.
+
+Aggregation happens in the database (``TruncDay``/``TruncWeek`` grouped
+rows); these helpers pick the date range, list the bucket dates and spread
+the grouped rows into compact, zero-filled arrays.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+
+INTERVAL_DAY = "day"
+INTERVAL_WEEK = "week"
+INTERVALS = (INTERVAL_DAY, INTERVAL_WEEK)
+
+DEFAULT_BUCKETS = {INTERVAL_DAY: 30, INTERVAL_WEEK: 12}
+MAX_BUCKETS = 400
+
+_STEPS = {INTERVAL_DAY: timedelta(days=1), INTERVAL_WEEK: timedelta(weeks=1)}
+
+
+def _align(day, interval):
+    # TruncWeek buckets start on Monday.
+    return day - timedelta(days=day.weekday()) if interval == INTERVAL_WEEK else day
+
+
+def resolve_range(start=None, end=None, interval=INTERVAL_DAY):
+    """
+    Return the ``(start, end)`` dates of a series, both inclusive.
+
+    ``end`` defaults to today and ``start`` to ``DEFAULT_BUCKETS`` intervals
+    before it. ``start`` is moved back to the first day of its bucket.
+    """
+    end = end or timezone.localdate()
+    start = start or end - _STEPS[interval] * (DEFAULT_BUCKETS[interval] - 1)
+    return _align(start, interval), end
+
+
+def bucket_count(start, end, interval=INTERVAL_DAY):
+    """Return how many buckets the inclusive ``start``..``end`` range spans."""
+    start, end = resolve_range(start, end, interval)
+    return (end - start) // _STEPS[interval] + 1
+
+
+def range_bounds(start, end):
+    """Return aware datetimes for filtering ``[start, end]`` as ``>= lower`` and ``< upper``."""
+    lower = timezone.make_aware(datetime.combine(start, time.min))
+    upper = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min))
+    return lower, upper
+
+
+def bucket_dates(start, end, interval=INTERVAL_DAY):
+    """Return the first day of every bucket between ``start`` and ``end``."""
+    step = _STEPS[interval]
+    current = _align(start, interval)
+    buckets = []
+    while current <= end:
+        buckets.append(current)
+        current += step
+    return buckets
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def series_by_key(buckets, rows, key="mode", bucket="bucket", count="count"):
+    """
+    Spread grouped ``rows`` into one zero-filled array per ``key`` value.
+
+    Each row is a dict with the bucket date, the grouping key and a count;
+    the arrays line up with ``buckets``.
+    """
+    index = {day: position for position, day in enumerate(buckets)}
+    series = {}
+    for row in rows:
+        position = index.get(_as_date(row[bucket]))
+        if position is None:
+            continue
+        values = series.setdefault(row[key], [0] * len(buckets))
+        values[position] += row[count]
+    return series
@@ -5,21 +5,45 @@ from rest_framework.authentication import SessionAuthentication
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 
+from openedx_owly_apis.analytics_snapshots import get_analytics_snapshot
+from openedx_owly_apis.models import OwlyAnalyticsSnapshot
 # Importar funciones lógicas de analytics
 from openedx_owly_apis.operations.analytics import (
+    get_batch_overview_analytics_logic,
     get_detailed_analytics_logic,
     get_discussions_analytics_logic,
+    get_enrollment_attributes_analytics_logic,
+    get_enrollment_export_logic,
+    get_enrollment_timeseries_logic,
     get_enrollments_analytics_logic,
     get_overview_analytics_logic,
+    get_progress_distribution_logic,
+)
+from openedx_owly_apis.permissions import IsAdminOrCourseStaff, IsAdminUser
+from openedx_owly_apis.views.v1.response_utils import (
+    csv_stream_response,
+    logic_result_response,
+    ndjson_stream_response,
+    serializer_error_response,
 )
-from openedx_owly_apis.permissions import IsAdminOrCourseStaff
-from openedx_owly_apis.views.v1.response_utils import logic_result_response, serializer_error_response
 from openedx_owly_apis.views.v1.serializers import (
+    BatchAnalyticsQuerySerializer,
     CourseScopedAnalyticsQuerySerializer,
+    DetailedAnalyticsQuerySerializer,
+    EnrollmentAttributesQuerySerializer,
+    EnrollmentExportQuerySerializer,
+    EnrollmentsAnalyticsQuerySerializer,
+    EnrollmentTimeseriesQuerySerializer,
     OverviewAnalyticsQuerySerializer,
+    ProgressAnalyticsQuerySerializer,
 )
 
 
+def _uncached(logic):
+    """Return ``logic`` without its analytics cache, for results that must be computed live."""
+    return getattr(logic, '__wrapped__', logic)
+
+
 class OpenedXAnalyticsViewSet(viewsets.ViewSet):
     """
     Analytics endpoints for Open edX courses.
@@ -50,15 +74,136 @@ class OpenedXAnalyticsViewSet(viewsets.ViewSet):
         result = get_overview_analytics_logic(data.get('course_id'))
         return logic_result_response(result)
 
+    @action(
+        detail=False,
+        methods=['get', 'post'],
+        url_path='overview/batch',
+        permission_classes=[IsAuthenticated, IsAdminUser],
+    )
+    def analytics_overview_batch(self, request):
+        """
+        Return overview analytics for many courses at once, keyed by course id.
+
+        Pass ``course_ids`` (repeated or comma-separated in the query string, or
+        a JSON list on POST) and/or ``org``. Requires a site admin.
+        """
+        if request.method == 'POST':
+            payload = request.data
+        else:
+            payload = {
+                key: request.query_params.get(key)
+                for key in ('org',)
+                if request.query_params.get(key)
+            }
+            course_ids = [
+                course_id.strip()
+                for value in request.query_params.getlist('course_ids')
+                for course_id in value.split(',')
+                if course_id.strip()
+            ]
+            if course_ids:
+                payload['course_ids'] = course_ids
+        data, error = self._validated(BatchAnalyticsQuerySerializer, payload)
+        if error:
+            return error
+        result = get_batch_overview_analytics_logic(course_ids=data.get('course_ids'), org=data.get('org'))
+        return logic_result_response(result)
+
     @action(detail=False, methods=['get'], url_path='enrollments')
     def analytics_enrollments(self, request):
-        """Return enrollment analytics for a specific course."""
-        data, error = self._validated(CourseScopedAnalyticsQuerySerializer, request.query_params)
+        """
+        Return enrollment analytics for a specific course.
+
+        Serves the latest precomputed snapshot when there is one; pass
+        ``fresh=true`` to compute the analytics live, bypassing both the
+        snapshot and the analytics cache. Pass
+        ``include_attributes=false`` to leave out the enrollment attribute counts.
+        """
+        data, error = self._validated(EnrollmentsAnalyticsQuerySerializer, request.query_params)
         if error:
             return error
-        result = get_enrollments_analytics_logic(data.get('course_id'))
+        include_attributes = data['include_attributes']
+        snapshot = None if data['fresh'] else get_analytics_snapshot(
+            data['course_id'], OwlyAnalyticsSnapshot.KIND_ENROLLMENTS
+        )
+        if snapshot and not include_attributes:
+            snapshot.pop('enrollment_attributes', None)
+        logic = _uncached(get_enrollments_analytics_logic) if data['fresh'] else get_enrollments_analytics_logic
+        result = snapshot or logic(data.get('course_id'), include_attributes=include_attributes)
         return logic_result_response(result)
 
+    @action(detail=False, methods=['get'], url_path='enrollments/attributes')
+    def analytics_enrollment_attributes(self, request):
+        """
+        Return enrollment attribute counts for a course, limited per namespace.
+
+        Query parameters:
+            course_id (str): Course identifier
+            namespace (str, optional): Only report this namespace
+            name (str, optional): Report value-level counts for this attribute
+                (requires ``namespace``)
+            limit (int, optional): Top entries to return, 1-100 (default 10)
+        """
+        data, error = self._validated(EnrollmentAttributesQuerySerializer, request.query_params)
+        if error:
+            return error
+        result = get_enrollment_attributes_analytics_logic(
+            data['course_id'],
+            namespace=data.get('namespace'),
+            name=data.get('name'),
+            limit=data['limit'],
+        )
+        return logic_result_response(result)
+
+    @action(detail=False, methods=['get'], url_path='enrollments/timeseries')
+    def analytics_enrollments_timeseries(self, request):
+        """
+        Return daily or weekly enrollment and unenrollment counts per mode for a course.
+
+        Query parameters:
+            course_id (str): Course identifier
+            start (date, optional): First day of the series (default: 30 days or 12 weeks before ``end``)
+            end (date, optional): Last day of the series (default: today)
+            interval (str, optional): ``day`` (default) or ``week``
+        """
+        data, error = self._validated(EnrollmentTimeseriesQuerySerializer, request.query_params)
+        if error:
+            return error
+        result = get_enrollment_timeseries_logic(
+            data['course_id'],
+            start=data.get('start'),
+            end=data.get('end'),
+            interval=data['interval'],
+        )
+        return logic_result_response(result)
+
+    @action(detail=False, methods=['get'], url_path='enrollments/export')
+    def analytics_enrollments_export(self, request):
+        """
+        Stream every enrollment of a course as CSV (default) or NDJSON.
+
+        Query parameters:
+            course_id (str): Course identifier
+            export_format (str, optional): ``csv`` or ``ndjson``
+
+        Each row has the learner's user id and username, the enrollment mode,
+        ``is_active``, ``created`` and its ``CourseEnrollmentAttribute`` values.
+        """
+        data, error = self._validated(EnrollmentExportQuerySerializer, request.query_params)
+        if error:
+            return error
+        result = get_enrollment_export_logic(data['course_id'])
+        if "rows" not in result:
+            return logic_result_response(result)
+
+        filename = "enrollments-{}.{}".format(
+            result['course_id'].replace(':', '_').replace('+', '_'),
+            data['export_format'],
+        )
+        if data['export_format'] == 'ndjson':
+            return ndjson_stream_response(result['rows'], filename)
+        return csv_stream_response(result['rows'], result['columns'], filename)
+
     @action(detail=False, methods=['get'], url_path='discussions')
     def analytics_discussions(self, request):
         """Return discussion analytics and configuration for a specific course."""
@@ -68,11 +213,38 @@ class OpenedXAnalyticsViewSet(viewsets.ViewSet):
         result = get_discussions_analytics_logic(data.get('course_id'))
         return logic_result_response(result)
 
+    @action(detail=False, methods=['get'], url_path='progress')
+    def analytics_progress(self, request):
+        """
+        Return the distribution of learner scores per graded subsection.
+
+        Query parameters:
+            course_id (str): Course identifier
+            bins (int, optional): Number of histogram bins, 1-100 (default 10)
+
+        Each subsection reports the count, mean, min, max, quantiles and a
+        histogram of ``earned_graded / possible_graded`` across learners.
+        """
+        data, error = self._validated(ProgressAnalyticsQuerySerializer, request.query_params)
+        if error:
+            return error
+        result = get_progress_distribution_logic(data['course_id'], bins=data['bins'])
+        return logic_result_response(result)
+
     @action(detail=False, methods=['get'], url_path='detailed')
     def analytics_detailed(self, request):
-        """Return a combined detailed analytics view for a specific course."""
-        data, error = self._validated(CourseScopedAnalyticsQuerySerializer, request.query_params)
+        """
+        Return a combined detailed analytics view for a specific course.
+
+        Serves the latest precomputed snapshot unless ``fresh=true`` is passed.
+        Pass ``timing=true`` to compute live and include per-query timings in
+        milliseconds. Live results bypass the analytics cache as well.
+        """
+        data, error = self._validated(DetailedAnalyticsQuerySerializer, request.query_params)
         if error:
             return error
-        result = get_detailed_analytics_logic(data.get('course_id'))
+        live = data['fresh'] or data['timing']
+        snapshot = None if live else get_analytics_snapshot(data['course_id'], OwlyAnalyticsSnapshot.KIND_DETAILED)
+        logic = _uncached(get_detailed_analytics_logic) if live else get_detailed_analytics_logic
+        result = snapshot or logic(data.get('course_id'), include_timing=data['timing'])
         return logic_result_response(result)
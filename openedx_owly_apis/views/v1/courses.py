@@ -1,6 +1,7 @@
 """OpenedX course management v1 APIs with explicit request contracts."""
 
 from django.db import transaction
+from django.urls import NoReverseMatch
 from django.utils.decorators import method_decorator
 from edx_rest_framework_extensions.auth.jwt.authentication import JwtAuthentication
 from opaque_keys.edx.keys import CourseKey, UsageKey
@@ -9,12 +10,21 @@ from rest_framework import status, viewsets
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 
+from openedx_owly_apis.cohort_jobs import (
+    create_cohort_assignment_job,
+    get_cohort_assignment_job,
+    get_cohort_bulk_sync_limit,
+    update_cohort_assignment_job,
+)
 from openedx_owly_apis.course_structure_jobs import (
     create_course_structure_job,
     get_course_structure_job,
     update_course_structure_job,
 )
+from openedx_owly_apis.job_store import get_job_result_page, iter_job_updates, list_jobs, wait_for_job_change
+from openedx_owly_apis.models import OwlyAsyncJob
 # Importar funciones lógicas originales
 from openedx_owly_apis.operations.courses import (
     add_discussion_content_logic,
@@ -49,15 +59,33 @@ from openedx_owly_apis.publish_jobs import (
     get_publish_content_job,
     update_publish_content_job,
 )
-from openedx_owly_apis.tasks import create_course_structure_task, publish_content_task
+from openedx_owly_apis.task_routing import (
+    apply_async_options,
+    route_cohort_assignment_job,
+    route_course_structure_job,
+    route_publish_content_job,
+)
+from openedx_owly_apis.tasks import (
+    bulk_add_users_to_cohort_task,
+    create_course_structure_task,
+    publish_content_task,
+)
 from openedx_owly_apis.views.v1.response_utils import (
+    EventStreamRenderer,
     error_response,
+    event_stream_response,
     logic_result_response,
     serializer_error_response,
     success_response,
 )
 from openedx_owly_apis.views.v1.serializers import (
+    AsyncJobListQuerySerializer,
+    AsyncJobResultQuerySerializer,
+    AsyncJobStatusQuerySerializer,
+    BulkCohortAssignmentRequestSerializer,
+    BulkCohortMoveRequestSerializer,
     BulkEmailRequestSerializer,
+    BulkManageCourseStaffRequestSerializer,
     CohortMemberActionRequestSerializer,
     CohortMembersQuerySerializer,
     ConfigureCertificatesRequestSerializer,
@@ -83,6 +111,7 @@ from openedx_owly_apis.views.v1.serializers import (
     UnitContentsQuerySerializer,
     UpdateAdvancedSettingsRequestSerializer,
     UpdateCourseSettingsRequestSerializer,
+    UserCourseRolesQuerySerializer,
     VideoContentRequestSerializer,
 )
 
@@ -132,6 +161,24 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             or is_course_creator_user(user, getattr(course_key, "org", None))
         )
 
+    @staticmethod
+    def _can_access_cohort_job(user, job):
+        # Cohort job results list learner usernames and emails, so unlike
+        # structure jobs they are not open to org course creators.
+        if is_admin_user(user):
+            return True
+
+        requested_by = str(job.get("requested_by")) if job.get("requested_by") is not None else None
+        if requested_by and requested_by == str(user.id):
+            return True
+
+        try:
+            course_key = CourseKey.from_string(job.get("course_id"))
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+        return is_course_staff_user(user, course_key)
+
     @staticmethod
     def _course_id_from_content_id(content_id):
         if isinstance(content_id, str) and ("+type@" in content_id or content_id.startswith("block-v1:")):
@@ -174,6 +221,123 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             or is_course_creator_user(user, getattr(course_key, "org", None))
         )
 
+    _STRUCTURE_JOB_FIELDS = (
+        "status",
+        "course_id",
+        "edit_mode",
+        "requested_by",
+        "task_id",
+        "created_at",
+        "updated_at",
+        "progress_message",
+        "queue",
+        "estimated_blocks",
+        "result_summary",
+        "error",
+        "completed_at",
+    )
+    _PUBLISH_JOB_FIELDS = (
+        "status",
+        "content_id",
+        "publish_type",
+        "course_id",
+        "requested_by",
+        "task_id",
+        "created_at",
+        "updated_at",
+        "progress_message",
+        "queue",
+        "estimated_blocks",
+        "result_summary",
+        "error",
+        "completed_at",
+    )
+
+    _COHORT_JOB_FIELDS = (
+        "status",
+        "course_id",
+        "cohort_id",
+        "user_count",
+        "requested_by",
+        "task_id",
+        "created_at",
+        "updated_at",
+        "progress_message",
+        "queue",
+        "estimated_blocks",
+        "result_summary",
+        "error",
+        "completed_at",
+    )
+
+    _JOB_RESULT_URL_NAMES = {
+        OwlyAsyncJob.TYPE_COURSE_STRUCTURE: "get-structure-job-result",
+        OwlyAsyncJob.TYPE_PUBLISH_CONTENT: "get-publish-content-job-result",
+        OwlyAsyncJob.TYPE_COHORT_ASSIGNMENT: "get-cohort-assignment-job-result",
+    }
+
+    def _job_result_url(self, job):
+        if job.get("result_summary") is None:
+            return None
+        url_name = self._JOB_RESULT_URL_NAMES.get(job.get("job_type"))
+        if not url_name or not self.basename:
+            return None
+        try:
+            return self.reverse_action(url_name, kwargs={"job_id": job["job_id"]})
+        except NoReverseMatch:
+            return None
+
+    def _job_status_data(self, job, fields):
+        data = {"job_id": job["job_id"]}
+        data.update({field: job.get(field) for field in fields})
+        data["result_url"] = self._job_result_url(job)
+        return data
+
+    def _job_result_response(self, request, job_id, loader, can_access, label):
+        params, error = self._validated(AsyncJobResultQuerySerializer, data=request.query_params)
+        if error:
+            return error
+
+        _job, error = self._load_accessible_job(request, job_id, loader, can_access, label)
+        if error:
+            return error
+
+        result = get_job_result_page(
+            job_id,
+            section=params.get("section"),
+            page=params["page"],
+            page_size=params["page_size"],
+        )
+        if result is None:
+            return error_response(
+                f"{label} has no result yet",
+                "job_result_not_found",
+                details={"job_id": job_id},
+                http_status=status.HTTP_404_NOT_FOUND,
+            )
+        return success_response(result)
+
+    @staticmethod
+    def _load_accessible_job(request, job_id, loader, can_access, label):
+        job = loader(job_id)
+        if not job:
+            return None, error_response(
+                f"{label} not found",
+                "job_not_found",
+                details={"job_id": job_id},
+                http_status=status.HTTP_404_NOT_FOUND,
+            )
+
+        if not can_access(request.user, job):
+            return None, error_response(
+                f"You do not have access to this {label.lower()}",
+                "job_access_denied",
+                details={"job_id": job_id},
+                http_status=status.HTTP_403_FORBIDDEN,
+            )
+
+        return job, None
+
     @action(
         detail=False,
         methods=['post'],
@@ -190,7 +354,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             run=data.get('run'),
             display_name=data.get('display_name'),
             start_date=data.get('start_date'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result, success_status=status.HTTP_201_CREATED)
 
@@ -213,7 +377,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             org=data.get('org'),
             course_number=data.get('course_number'),
             background=data.get('background', True),
-            user_identifier=request.user.id,
+            user_identifier=request.user,
         )
         return logic_result_response(result, success_status=status.HTTP_201_CREATED)
 
@@ -231,7 +395,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             course_id=data.get('course_id'),
             units_config=data.get('units_config'),
             edit=data.get('edit', False),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -242,7 +406,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         permission_classes=[IsAuthenticated, IsAdminOrCourseCreatorOrCourseStaff],
     )
     def create_structure_async(self, request):
-        """Enqueue course structure creation and return a cache-backed job id."""
+        """Enqueue course structure creation and return the async job id."""
         data, error = self._validated(CourseStructureRequestSerializer, data=request.data)
         if error:
             return error
@@ -251,18 +415,17 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         units_config = data["units_config"]
         edit = data["edit"]
 
+        route = route_course_structure_job(units_config)
         job = create_course_structure_job(
             course_id=course_id,
             edit=edit,
             user_identifier=request.user.id,
+            route=route,
         )
 
-        async_result = create_course_structure_task.delay(
-            job["job_id"],
-            course_id,
-            units_config,
-            edit,
-            request.user.id,
+        async_result = create_course_structure_task.apply_async(
+            args=(job["job_id"], course_id, units_config, edit, request.user.id),
+            **apply_async_options(route),
         )
         update_course_structure_job(job["job_id"], task_id=async_result.id)
 
@@ -272,6 +435,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
                 "status": "pending",
                 "course_id": course_id,
                 "edit_mode": bool(edit),
+                "queue": route["lane"],
             },
             http_status=status.HTTP_202_ACCEPTED,
         )
@@ -283,41 +447,109 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         permission_classes=[IsAuthenticated, IsAdminOrCourseCreatorOrCourseStaff],
     )
     def get_structure_job(self, request, job_id=None):
-        """Return the current status for an async course structure job."""
-        job = get_course_structure_job(job_id)
-        if not job:
-            return error_response(
-                "Async course structure job not found",
-                "job_not_found",
-                details={"job_id": job_id},
-                http_status=status.HTTP_404_NOT_FOUND,
-            )
+        """
+        Return the current status for an async course structure job.
 
-        if not self._can_access_structure_job(request.user, job):
-            return error_response(
-                "You do not have access to this async course structure job",
-                "job_access_denied",
-                details={"job_id": job_id},
-                http_status=status.HTTP_403_FORBIDDEN,
-            )
+        Pass ``wait=<seconds>`` (up to 30) and ``since=<updated_at>`` to long-poll:
+        the response is held until the job changes or the wait expires.
+        """
+        params, error = self._validated(AsyncJobStatusQuerySerializer, data=request.query_params)
+        if error:
+            return error
 
-        return success_response(
-            {
-                "job_id": job["job_id"],
-                "status": job.get("status"),
-                "course_id": job.get("course_id"),
-                "edit_mode": job.get("edit_mode"),
-                "requested_by": job.get("requested_by"),
-                "task_id": job.get("task_id"),
-                "created_at": job.get("created_at"),
-                "updated_at": job.get("updated_at"),
-                "progress_message": job.get("progress_message"),
-                "result": job.get("result"),
-                "error": job.get("error"),
-                "completed_at": job.get("completed_at"),
-            }
+        job, error = self._load_accessible_job(
+            request, job_id, get_course_structure_job, self._can_access_structure_job, "Async course structure job"
+        )
+        if error:
+            return error
+
+        if params["wait"]:
+            job = wait_for_job_change(
+                job_id,
+                since=params.get("since"),
+                timeout=params["wait"],
+                job_type=OwlyAsyncJob.TYPE_COURSE_STRUCTURE,
+            ) or job
+
+        return success_response(self._job_status_data(job, self._STRUCTURE_JOB_FIELDS))
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=r'structure/jobs/(?P<job_id>[^/.]+)/stream',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseCreatorOrCourseStaff],
+        renderer_classes=[JSONRenderer, EventStreamRenderer],
+    )
+    def stream_structure_job(self, request, job_id=None):
+        """Stream status changes for an async course structure job as server-sent events."""
+        _job, error = self._load_accessible_job(
+            request, job_id, get_course_structure_job, self._can_access_structure_job, "Async course structure job"
+        )
+        if error:
+            return error
+
+        return event_stream_response(
+            self._job_status_data(job, self._STRUCTURE_JOB_FIELDS) if job else None
+            for job in iter_job_updates(job_id, job_type=OwlyAsyncJob.TYPE_COURSE_STRUCTURE)
         )
 
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=r'structure/jobs/(?P<job_id>[^/.]+)/result',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseCreatorOrCourseStaff],
+    )
+    def get_structure_job_result(self, request, job_id=None):
+        """
+        Return the full result of an async course structure job, one page at a time.
+
+        Query parameters:
+            section (str, optional): Result list to page through (default ``created_structure``)
+            page (int, optional): Page number (default 1)
+            page_size (int, optional): Items per page, up to 500 (default 50)
+        """
+        return self._job_result_response(
+            request, job_id, get_course_structure_job, self._can_access_structure_job, "Async course structure job"
+        )
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='jobs',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseCreatorOrCourseStaff],
+    )
+    def list_async_jobs(self, request):
+        """
+        List async course structure, publish and cohort assignment jobs, newest first.
+
+        Query parameters:
+            course_id (str, optional): Only return jobs for this course
+            status (str, optional): ``pending``, ``running``, ``success`` or ``failed``
+            job_type (str, optional): ``course_structure``, ``publish_content`` or ``cohort_assignment``
+            page (int, optional): Page number (default 1)
+            page_size (int, optional): Jobs per page, up to 100 (default 20)
+
+        Admins see every job. Without ``course_id``, other users only see the
+        jobs they requested themselves.
+        """
+        data, error = self._validated(AsyncJobListQuerySerializer, data=request.query_params)
+        if error:
+            return error
+
+        requested_by = None
+        if not is_admin_user(request.user) and not data.get('course_id'):
+            requested_by = request.user.id
+
+        result = list_jobs(
+            course_id=data.get('course_id'),
+            status=data.get('status'),
+            job_type=data.get('job_type'),
+            requested_by=requested_by,
+            page=data['page'],
+            page_size=data['page_size'],
+        )
+        return success_response(result)
+
     @action(
         detail=False,
         methods=['get'],
@@ -408,7 +640,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             search_type=data.get('search_type'),
             search_name=data.get('search_name'),
             content_branch=data.get('content_branch'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
 
         return logic_result_response(result)
@@ -438,7 +670,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             course_id=data.get('course_id'),
             vertical_id=data.get('vertical_id'),
             content_branch=data.get('content_branch'),
-            user_identifier=request.user.id,
+            user_identifier=request.user,
         )
 
         return logic_result_response(result)
@@ -459,7 +691,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = add_html_content_logic(
             vertical_id=data.get('vertical_id'),
             html_config=data.get('html_config'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -479,7 +711,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = add_video_content_logic(
             vertical_id=data.get('vertical_id'),
             video_config=data.get('video_config'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -499,7 +731,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = add_problem_content_logic(
             vertical_id=data.get('vertical_id'),
             problem_config=data.get('problem_config'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -519,7 +751,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = add_discussion_content_logic(
             vertical_id=data.get('vertical_id'),
             discussion_config=data.get('discussion_config'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -539,7 +771,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = update_course_settings_logic(
             course_id=data.get('course_id'),
             settings_data=data.get('settings_data', {}),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -559,7 +791,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = update_advanced_settings_logic(
             course_id=data.get('course_id'),
             advanced_settings=data.get('advanced_settings', {}),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -586,14 +818,14 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             result = toggle_certificate_simple_logic(
                 course_id=data.get('course_id'),
                 is_active=data.get('is_active', True),
-                user_identifier=request.user.id
+                user_identifier=request.user
             )
         else:
             # Configuración avanzada
             result = enable_configure_certificates_logic(
                 course_id=data.get('course_id'),
                 certificate_config=data.get('certificate_config', {}),
-                user_identifier=request.user.id
+                user_identifier=request.user
             )
         return logic_result_response(result)
 
@@ -611,7 +843,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = control_unit_availability_logic(
             unit_id=data.get('unit_id'),
             availability_config=data.get('availability_config', {}),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -631,7 +863,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             problem_type=data.get('problem_type', 'multiplechoiceresponse'),
             display_name=data.get('display_name', 'New Problem'),
             problem_data=data.get('problem_data', {}),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result, success_status=status.HTTP_201_CREATED)
 
@@ -649,7 +881,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = publish_content_logic(
             content_id=data.get('content_id'),
             publish_type=data.get('publish_type', 'auto'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -660,7 +892,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         permission_classes=[IsAuthenticated, IsAdminOrCourseStaff],
     )
     def publish_content_async(self, request):
-        """Enqueue content publishing and return a cache-backed job id."""
+        """Enqueue content publishing and return the async job id."""
         data, error = self._validated(PublishContentRequestSerializer, data=request.data)
         if error:
             return error
@@ -669,18 +901,18 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         publish_type = data["publish_type"]
         course_id = self._course_id_from_content_id(content_id)
 
+        route = route_publish_content_job(content_id, publish_type=publish_type, course_id=course_id)
         job = create_publish_content_job(
             content_id=content_id,
             publish_type=publish_type,
             user_identifier=request.user.id,
             course_id=course_id,
+            route=route,
         )
 
-        async_result = publish_content_task.delay(
-            job["job_id"],
-            content_id,
-            publish_type,
-            request.user.id,
+        async_result = publish_content_task.apply_async(
+            args=(job["job_id"], content_id, publish_type, request.user.id),
+            **apply_async_options(route),
         )
         update_publish_content_job(job["job_id"], task_id=async_result.id)
 
@@ -691,6 +923,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
                 "content_id": content_id,
                 "publish_type": publish_type,
                 "course_id": course_id,
+                "queue": route["lane"],
             },
             http_status=status.HTTP_202_ACCEPTED,
         )
@@ -702,40 +935,68 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         permission_classes=[IsAuthenticated, IsAdminOrCourseStaff],
     )
     def get_publish_content_job(self, request, job_id=None):
-        """Return the current status for an async content publish job."""
-        job = get_publish_content_job(job_id)
-        if not job:
-            return error_response(
-                "Async publish job not found",
-                "job_not_found",
-                details={"job_id": job_id},
-                http_status=status.HTTP_404_NOT_FOUND,
-            )
+        """
+        Return the current status for an async content publish job.
 
-        if not self._can_access_publish_job(request.user, job):
-            return error_response(
-                "You do not have access to this async publish job",
-                "job_access_denied",
-                details={"job_id": job_id},
-                http_status=status.HTTP_403_FORBIDDEN,
-            )
+        Supports the same ``wait``/``since`` long-poll parameters as the
+        course structure job endpoint.
+        """
+        params, error = self._validated(AsyncJobStatusQuerySerializer, data=request.query_params)
+        if error:
+            return error
 
-        return success_response(
-            {
-                "job_id": job["job_id"],
-                "status": job.get("status"),
-                "content_id": job.get("content_id"),
-                "publish_type": job.get("publish_type"),
-                "course_id": job.get("course_id"),
-                "requested_by": job.get("requested_by"),
-                "task_id": job.get("task_id"),
-                "created_at": job.get("created_at"),
-                "updated_at": job.get("updated_at"),
-                "progress_message": job.get("progress_message"),
-                "result": job.get("result"),
-                "error": job.get("error"),
-                "completed_at": job.get("completed_at"),
-            }
+        job, error = self._load_accessible_job(
+            request, job_id, get_publish_content_job, self._can_access_publish_job, "Async publish job"
+        )
+        if error:
+            return error
+
+        if params["wait"]:
+            job = wait_for_job_change(
+                job_id,
+                since=params.get("since"),
+                timeout=params["wait"],
+                job_type=OwlyAsyncJob.TYPE_PUBLISH_CONTENT,
+            ) or job
+
+        return success_response(self._job_status_data(job, self._PUBLISH_JOB_FIELDS))
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=r'content/publish/jobs/(?P<job_id>[^/.]+)/stream',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseStaff],
+        renderer_classes=[JSONRenderer, EventStreamRenderer],
+    )
+    def stream_publish_content_job(self, request, job_id=None):
+        """Stream status changes for an async content publish job as server-sent events."""
+        _job, error = self._load_accessible_job(
+            request, job_id, get_publish_content_job, self._can_access_publish_job, "Async publish job"
+        )
+        if error:
+            return error
+
+        return event_stream_response(
+            self._job_status_data(job, self._PUBLISH_JOB_FIELDS) if job else None
+            for job in iter_job_updates(job_id, job_type=OwlyAsyncJob.TYPE_PUBLISH_CONTENT)
+        )
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=r'content/publish/jobs/(?P<job_id>[^/.]+)/result',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseStaff],
+    )
+    def get_publish_content_job_result(self, request, job_id=None):
+        """
+        Return the full result of an async content publish job, one page at a time.
+
+        Accepts the same ``section``/``page``/``page_size`` parameters as the
+        course structure job result endpoint; ``section`` defaults to
+        ``published_items``.
+        """
+        return self._job_result_response(
+            request, job_id, get_publish_content_job, self._can_access_publish_job, "Async publish job"
         )
 
     @action(
@@ -753,7 +1014,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             return error
         result = delete_xblock_logic(
             block_id=data.get('block_id'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -790,7 +1051,47 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             user_identifier=data.get('user_identifier'),
             action=data.get('action'),
             role_type=data.get('role_type', 'staff'),
-            acting_user_identifier=request.user.username
+            acting_user_identifier=request.user
+        )
+        return logic_result_response(result)
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='staff/bulk_manage',
+        permission_classes=[IsAuthenticated, IsAdminUser],
+    )
+    def bulk_manage_course_staff(self, request):
+        """
+        Add or remove course staff roles for many users and courses at once.
+
+        Body parameters:
+            changes (list): Up to 1000 changes, each with the body parameters of
+                ``staff/manage``: ``course_id``, ``user_identifier``, ``action``
+                and ``role_type``
+
+        Example request body::
+
+            {
+                "changes": [
+                    {"course_id": "course-v1:TestX+CS101+2024", "user_identifier": "ana",
+                     "action": "add", "role_type": "staff"},
+                    {"course_id": "course-v1:TestX+CS102+2024", "user_identifier": "bob@example.com",
+                     "action": "remove", "role_type": "staff"}
+                ]
+            }
+
+        Returns:
+            Response: JSON response with one result per change and status counts
+        """
+        # pylint: disable=import-outside-toplevel
+        from openedx_owly_apis.operations.courses import bulk_manage_course_staff_logic
+        data, error = self._validated(BulkManageCourseStaffRequestSerializer, data=request.data)
+        if error:
+            return error
+        result = bulk_manage_course_staff_logic(
+            changes=data['changes'],
+            acting_user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -802,11 +1103,13 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
     )
     def list_course_staff(self, request):
         """
-        List users with course staff roles.
+        List users with course staff roles, one page at a time.
 
         Query parameters:
             course_id (str): Course identifier (e.g., course-v1:ORG+NUM+RUN)
             role_type (str, optional): Filter by role type - "staff", "course_creator", or omit for all
+            page (int, optional): Page number (default 1)
+            page_size (int, optional): Users per page, up to 500 (default 100)
 
         Examples:
             GET /api/v1/owly-courses/staff/list/?course_id=course-v1:TestX+CS101+2024
@@ -826,7 +1129,60 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = list_course_staff_logic(
             course_id=data.get('course_id'),
             role_type=data.get('role_type'),
-            acting_user_identifier=request.user.username
+            acting_user_identifier=request.user,
+            page=data['page'],
+            page_size=data['page_size'],
+        )
+        return logic_result_response(result)
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='staff/user_roles',
+        permission_classes=[IsAuthenticated, IsAdminUser],
+    )
+    def list_user_course_roles(self, request):
+        """
+        List the course, organization and global roles of one or more users.
+
+        Query parameters:
+            user_identifiers (str): Usernames, emails, or user ids, repeated or
+                comma-separated (up to 100)
+            page (int, optional): Page number (default 1)
+            page_size (int, optional): Roles per page, up to 500 (default 100)
+
+        Examples:
+            GET /api/v1/owly-courses/staff/user_roles/?user_identifiers=ana,bob@example.com
+
+        Returns:
+            Response: JSON response with the resolved users and a page of their roles,
+            including the display name of each course
+        """
+        # pylint: disable=import-outside-toplevel
+        from openedx_owly_apis.operations.courses import list_user_course_roles_logic
+
+        payload = {
+            key: request.query_params.get(key)
+            for key in ('page', 'page_size')
+            if request.query_params.get(key)
+        }
+        user_identifiers = [
+            identifier.strip()
+            for value in request.query_params.getlist('user_identifiers')
+            for identifier in value.split(',')
+            if identifier.strip()
+        ]
+        if user_identifiers:
+            payload['user_identifiers'] = user_identifiers
+        data, error = self._validated(UserCourseRolesQuerySerializer, data=payload)
+        if error:
+            return error
+
+        result = list_user_course_roles_logic(
+            user_identifiers=data['user_identifiers'],
+            page=data['page'],
+            page_size=data['page_size'],
+            acting_user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -869,7 +1225,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = add_ora_content_logic(
             vertical_id=data.get('vertical_id'),
             ora_config=data.get('ora_config'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -966,7 +1322,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             student_username=data.get('student_username'),
             submission_uuid=data.get('submission_uuid'),
             grade_data=grade_data,
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
         return logic_result_response(result)
 
@@ -1036,7 +1392,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
 
         result = get_ora_details_logic(
             ora_location=data.get('ora_location'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
 
         return logic_result_response(result)
@@ -1097,7 +1453,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
 
         result = list_ora_submissions_logic(
             ora_location=data.get('ora_location'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
 
         return logic_result_response(result)
@@ -1145,7 +1501,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             course_id=data.get('course_id'),
             cohort_name=data.get('cohort_name'),
             assignment_type=data.get('assignment_type', 'manual'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
 
         return logic_result_response(result)
@@ -1182,7 +1538,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
 
         result = list_cohorts_logic(
             course_id=data.get('course_id'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
 
         return logic_result_response(result)
@@ -1226,7 +1582,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             course_id=data.get('course_id'),
             cohort_id=data.get('cohort_id'),
             user_identifier_to_add=data.get('user_identifier'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
 
         return logic_result_response(result)
@@ -1270,11 +1626,186 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             course_id=data.get('course_id'),
             cohort_id=data.get('cohort_id'),
             user_identifier_to_remove=data.get('user_identifier'),
-            user_identifier=request.user.id
+            user_identifier=request.user
+        )
+
+        return logic_result_response(result)
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='cohorts/members/bulk_add',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseStaff],
+    )
+    def bulk_add_users_to_cohort(self, request):
+        """
+        Add many users to a cohort, from a list or a CSV roster.
+
+        Body parameters:
+            course_id (str): Course identifier (e.g., course-v1:ORG+NUM+RUN)
+            cohort_id (int): ID of the cohort to add users to
+            user_identifiers (list, optional): Usernames, emails, or user ids
+            csv (str, optional): CSV roster; a ``username``, ``email`` or
+                ``user_id`` header selects the column, otherwise the first
+                column is used
+            run_async (bool, optional): Always run as an async job
+
+        Example request body::
+
+            {
+                "course_id": "course-v1:TestX+CS101+2024",
+                "cohort_id": 1,
+                "user_identifiers": ["student1", "student2@example.com", "42"]
+            }
+
+        Returns:
+            JSON response with per-user ``results`` and status counts. Inputs
+            larger than ``OWLY_COHORT_BULK_SYNC_LIMIT`` users (or with
+            ``run_async``) are enqueued instead and return ``202`` with the
+            async job id.
+        """
+        # pylint: disable=import-outside-toplevel
+        from openedx_owly_apis.operations.courses import bulk_add_users_to_cohort_logic
+
+        data, error = self._validated(BulkCohortAssignmentRequestSerializer, data=request.data)
+        if error:
+            return error
+
+        course_id = data['course_id']
+        cohort_id = data['cohort_id']
+        user_identifiers = data['user_identifiers']
+        if not data['run_async'] and len(user_identifiers) <= get_cohort_bulk_sync_limit():
+            result = bulk_add_users_to_cohort_logic(
+                course_id=course_id,
+                cohort_id=cohort_id,
+                user_identifiers=user_identifiers,
+                user_identifier=request.user,
+            )
+            return logic_result_response(result)
+
+        route = route_cohort_assignment_job(len(user_identifiers))
+        job = create_cohort_assignment_job(
+            course_id=course_id,
+            cohort_id=cohort_id,
+            user_count=len(user_identifiers),
+            user_identifier=request.user.id,
+            route=route,
+        )
+        async_result = bulk_add_users_to_cohort_task.apply_async(
+            args=(job["job_id"], course_id, cohort_id, user_identifiers, request.user.id),
+            **apply_async_options(route),
+        )
+        update_cohort_assignment_job(job["job_id"], task_id=async_result.id)
+
+        return success_response(
+            {
+                "job_id": job["job_id"],
+                "status": "pending",
+                "course_id": course_id,
+                "cohort_id": cohort_id,
+                "user_count": len(user_identifiers),
+                "queue": route["lane"],
+            },
+            http_status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='cohorts/members/bulk_move',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseStaff],
+    )
+    def bulk_move_cohort_members(self, request):
+        """
+        Move many users from one cohort to another, or remove them from it.
+
+        Body parameters:
+            course_id (str): Course identifier (e.g., course-v1:ORG+NUM+RUN)
+            source_cohort_id (int): ID of the cohort the users are taken from
+            target_cohort_id (int, optional): ID of the cohort to move them to;
+                omit it (or send ``null``) to remove them from the source cohort
+            user_identifiers (list, optional): Usernames, emails, or user ids
+            csv (str, optional): CSV roster, as in ``cohorts/members/bulk_add``
+
+        Example request body::
+
+            {
+                "course_id": "course-v1:TestX+CS101+2024",
+                "source_cohort_id": 1,
+                "target_cohort_id": 2,
+                "user_identifiers": ["student1", "student2@example.com"]
+            }
+
+        Returns:
+            JSON response with per-user ``results``, status counts and the
+            ``skipped`` identifiers that were not in the source cohort
+        """
+        # pylint: disable=import-outside-toplevel
+        from openedx_owly_apis.operations.courses import bulk_move_cohort_members_logic
+
+        data, error = self._validated(BulkCohortMoveRequestSerializer, data=request.data)
+        if error:
+            return error
+        result = bulk_move_cohort_members_logic(
+            course_id=data['course_id'],
+            source_cohort_id=data['source_cohort_id'],
+            target_cohort_id=data['target_cohort_id'],
+            user_identifiers=data['user_identifiers'],
+            user_identifier=request.user,
         )
 
         return logic_result_response(result)
 
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=r'cohorts/jobs/(?P<job_id>[^/.]+)',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseStaff],
+    )
+    def get_cohort_assignment_job(self, request, job_id=None):
+        """
+        Return the current status for an async bulk cohort assignment job.
+
+        Supports the same ``wait``/``since`` long-poll parameters as the
+        course structure job endpoint.
+        """
+        params, error = self._validated(AsyncJobStatusQuerySerializer, data=request.query_params)
+        if error:
+            return error
+
+        job, error = self._load_accessible_job(
+            request, job_id, get_cohort_assignment_job, self._can_access_cohort_job, "Async cohort job"
+        )
+        if error:
+            return error
+
+        if params["wait"]:
+            job = wait_for_job_change(
+                job_id,
+                since=params.get("since"),
+                timeout=params["wait"],
+                job_type=OwlyAsyncJob.TYPE_COHORT_ASSIGNMENT,
+            ) or job
+
+        return success_response(self._job_status_data(job, self._COHORT_JOB_FIELDS))
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=r'cohorts/jobs/(?P<job_id>[^/.]+)/result',
+        permission_classes=[IsAuthenticated, IsAdminOrCourseStaff],
+    )
+    def get_cohort_assignment_job_result(self, request, job_id=None):
+        """
+        Return the per-user results of an async bulk cohort assignment job, one page at a time.
+
+        Accepts the same ``page``/``page_size`` parameters as the course
+        structure job result endpoint; the section is ``results``.
+        """
+        return self._job_result_response(
+            request, job_id, get_cohort_assignment_job, self._can_access_cohort_job, "Async cohort job"
+        )
+
     @action(
         detail=False,
         methods=['get'],
@@ -1283,21 +1814,24 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
     )
     def list_cohort_members(self, request):
         """
-        List all members of a specific cohort.
+        List the members of a specific cohort, one page at a time.
 
-        This endpoint retrieves detailed information about all users
-        currently assigned to a particular cohort.
+        This endpoint retrieves detailed information about the users
+        currently assigned to a particular cohort, ordered by user id.
 
         Query parameters:
             course_id (str): Course identifier (e.g., course-v1:ORG+NUM+RUN)
             cohort_id (int): ID of the cohort to list members for
+            cursor (int, optional): ``next_cursor`` of the previous page
+            page_size (int, optional): Members per page, up to 1000 (default 100)
 
         Example request::
 
             GET /api/v1/owly-courses/cohorts/members/list/?course_id=course-v1:TestX+CS101+2024&cohort_id=1
 
         Returns:
-            JSON response with list of cohort members and their details
+            JSON response with a page of cohort members and their details, plus
+            ``next_cursor`` (``null`` on the last page)
         """
         # pylint: disable=import-outside-toplevel
         from openedx_owly_apis.operations.courses import list_cohort_members_logic
@@ -1306,6 +1840,10 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             "course_id": request.query_params.get('course_id') or request.data.get('course_id'),
             "cohort_id": request.query_params.get('cohort_id') or request.data.get('cohort_id'),
         }
+        for key in ('cursor', 'page_size'):
+            value = request.query_params.get(key) or request.data.get(key)
+            if value is not None:
+                merged_data[key] = value
         data, error = self._validated(CohortMembersQuerySerializer, data=merged_data)
         if error:
             return error
@@ -1313,7 +1851,9 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = list_cohort_members_logic(
             course_id=data.get('course_id'),
             cohort_id=data.get('cohort_id'),
-            user_identifier=request.user.id
+            user_identifier=request.user,
+            cursor=data.get('cursor'),
+            page_size=data['page_size'],
         )
 
         return logic_result_response(result)
@@ -1359,7 +1899,7 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
         result = delete_cohort_logic(
             course_id=data.get('course_id'),
             cohort_id=data.get('cohort_id'),
-            user_identifier=request.user.id
+            user_identifier=request.user
         )
 
         return logic_result_response(result)
@@ -1398,6 +1938,6 @@ class OpenedXCourseViewSet(viewsets.ViewSet):
             schedule=data.get('schedule'),
             template_name=data.get('template_name'),
             from_addr=data.get('from_addr'),
-            user_identifier=request.user.id,
+            user_identifier=request.user,
         )
         return logic_result_response(result)
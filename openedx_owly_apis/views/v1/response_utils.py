@@ -1,6 +1,12 @@
 """Shared response helpers for v1 APIs."""
 
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
 from rest_framework import status
+from rest_framework.renderers import BaseRenderer
 from rest_framework.response import Response
 
 
@@ -73,3 +79,82 @@ def logic_result_response(result, *, success_status=status.HTTP_200_OK, error_st
         )
 
     return success_response(result, http_status=success_status)
+
+
+def format_sse_event(event, data):
+    """Format ``data`` as a server-sent event frame named ``event``."""
+    return "event: {}\ndata: {}\n\n".format(event, json.dumps(data, cls=DjangoJSONEncoder))
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Render regular (error) responses of server-sent event endpoints as an ``error`` event."""
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render ``data`` as a single ``error`` event."""
+        return format_sse_event("error", data).encode(self.charset)
+
+
+def event_stream_response(payloads, *, event="status"):
+    """
+    Stream ``payloads`` as server-sent events.
+
+    ``None`` items are sent as keep-alive comments so proxies do not close an
+    idle stream.
+    """
+    def _frames():
+        for payload in payloads:
+            if payload is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield format_sse_event(event, payload)
+
+    response = StreamingHttpResponse(_frames(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+class _Echo:
+    """File-like object whose ``write`` returns the value, for streaming ``csv.writer`` output."""
+
+    def write(self, value):
+        return value
+
+
+def _export_response(chunks, content_type, filename):
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response["Content-Disposition"] = 'attachment; filename="{}"'.format(filename)
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def csv_stream_response(rows, columns, filename):
+    """
+    Stream ``rows`` (dicts) as a CSV attachment with a ``columns`` header.
+
+    Nested values (dicts and lists) are written as JSON.
+    """
+    writer = csv.writer(_Echo())
+
+    def _lines():
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow([
+                json.dumps(value, cls=DjangoJSONEncoder)
+                if isinstance(value, (dict, list)) else
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in (row.get(column) for column in columns)
+            ])
+
+    return _export_response(_lines(), "text/csv; charset=utf-8", filename)
+
+
+def ndjson_stream_response(rows, filename):
+    """Stream ``rows`` as newline-delimited JSON, one object per line."""
+    lines = (json.dumps(row, cls=DjangoJSONEncoder) + "\n" for row in rows)
+    return _export_response(lines, "application/x-ndjson", filename)
@@ -6,11 +6,10 @@ requested course or organization context.
 
 Example:
 GET /owly-roles/me?course_id=course-v1:ORG+NUM+RUN&org=ORG
+GET /owly-roles/me?course_ids=course-v1:ORG+NUM+RUN,course-v1:ORG+NUM+RUN2
 """
 from typing import Optional
 
-from common.djangoapps.student.auth import CourseCreatorRole, OrgContentCreatorRole, user_has_role
-from common.djangoapps.student.roles import CourseInstructorRole, CourseLimitedStaffRole, CourseStaffRole
 from edx_rest_framework_extensions.auth.jwt.authentication import JwtAuthentication
 from opaque_keys.edx.keys import CourseKey
 from openedx.core.lib.api.authentication import BearerAuthentication
@@ -19,6 +18,7 @@ from rest_framework.authentication import SessionAuthentication
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 
+from openedx_owly_apis.permissions import COURSE_CREATOR, COURSE_TEAM, ORG_COURSE_CREATOR, get_course_roles
 from openedx_owly_apis.views.v1.response_utils import error_response, success_response
 from openedx_owly_apis.views.v1.serializers import RolesMeQuerySerializer
 
@@ -43,6 +43,23 @@ class OpenedXRolesViewSet(viewsets.ViewSet):
             )
         return serializer.validated_data, None
 
+    @staticmethod
+    def _query_data(query_params):
+        data = {
+            key: query_params.get(key)
+            for key in ("course_id", "org")
+            if query_params.get(key)
+        }
+        course_ids = [
+            course_id.strip()
+            for value in query_params.getlist("course_ids")
+            for course_id in value.split(",")
+            if course_id.strip()
+        ]
+        if course_ids:
+            data["course_ids"] = course_ids
+        return data
+
     @staticmethod
     def _parse_course_key(course_id: Optional[str]):
         if not course_id:
@@ -53,24 +70,28 @@ class OpenedXRolesViewSet(viewsets.ViewSet):
             return None, f"Invalid course_id: {exc}"
 
     @staticmethod
-    def _is_course_staff(user, course_key) -> bool:
-        if not course_key:
-            return False
+    def _role_checks(course_keys, orgs):
         # Considerar instructor, staff y limited_staff como "course staff".
+        checks = [(COURSE_TEAM, str(course_key)) for course_key in course_keys]
+        # Respeta settings: DISABLE_COURSE_CREATION y ENABLE_CREATOR_GROUP
+        checks.append((COURSE_CREATOR, ""))
+        checks.extend((ORG_COURSE_CREATOR, org) for org in orgs if org)
+        return checks
+
+    @staticmethod
+    def _effective_role(is_superadmin, is_course_staff, is_course_creator, is_authenticated):
+        # Determinar rol efectivo por prioridad
         return (
-            CourseInstructorRole(course_key).has_user(user) or
-            CourseStaffRole(course_key).has_user(user) or
-            CourseLimitedStaffRole(course_key).has_user(user)
+            "SuperAdmin" if is_superadmin else
+            "CourseStaff" if is_course_staff else
+            "CourseCreator" if is_course_creator else
+            "Authenticated" if is_authenticated else
+            "Anonymous"
         )
 
     @staticmethod
-    def _is_course_creator(user, org: Optional[str]) -> bool:
-        # Respeta settings: DISABLE_COURSE_CREATION y ENABLE_CREATOR_GROUP
-        if user_has_role(user, CourseCreatorRole()):
-            return True
-        if org:
-            return user_has_role(user, OrgContentCreatorRole(org=org))
-        return False
+    def _is_course_creator(roles, org: Optional[str]) -> bool:
+        return roles[(COURSE_CREATOR, "")] or bool(org and roles[(ORG_COURSE_CREATOR, org)])
 
     @action(detail=False, methods=["get"], url_path="me")
     def me(self, request):
@@ -80,8 +101,13 @@ class OpenedXRolesViewSet(viewsets.ViewSet):
         Optional query parameters:
         - ``course_id``: evaluate whether the user is course staff for that course
         - ``org``: evaluate whether the user is an organization-scoped course creator
+        - ``course_ids``: up to 100 courses (repeated or comma-separated) to
+          resolve in one go; each gets its own entry in ``courses``, with the
+          course organization used for the creator check
+
+        All roles are resolved with a single query over the user's access roles.
         """
-        data, error = self._validated(request.query_params)
+        data, error = self._validated(self._query_data(request.query_params))
         if error:
             return error
 
@@ -92,22 +118,22 @@ class OpenedXRolesViewSet(viewsets.ViewSet):
         course_key, course_err = self._parse_course_key(course_id)
         if course_err:
             return error_response(course_err, "invalid_course_id")
+        batch_keys = {}
+        for batch_course_id in data.get("course_ids", []):
+            batch_keys[batch_course_id], course_err = self._parse_course_key(batch_course_id)
+            if course_err:
+                return error_response(course_err, "invalid_course_id")
+
+        course_keys = [key for key in [course_key, *batch_keys.values()] if key is not None]
+        orgs = {org, *(getattr(key, "org", None) for key in batch_keys.values())}
+        roles = get_course_roles(user, self._role_checks(course_keys, orgs))
 
         is_authenticated = bool(user and user.is_authenticated)
         is_superadmin = bool(user and (user.is_superuser or user.is_staff))
-        is_course_staff = self._is_course_staff(user, course_key)
-        is_course_creator = self._is_course_creator(user, org)
-
-        # Determinar rol efectivo por prioridad
-        effective = (
-            "SuperAdmin" if is_superadmin else
-            "CourseStaff" if is_course_staff else
-            "CourseCreator" if is_course_creator else
-            "Authenticated" if is_authenticated else
-            "Anonymous"
-        )
+        is_course_staff = bool(course_key and roles[(COURSE_TEAM, str(course_key))])
+        is_course_creator = self._is_course_creator(roles, org)
 
-        return success_response({
+        payload = {
             "username": getattr(user, "username", None),
             "roles": {
                 "superadmin": is_superadmin,
@@ -115,9 +141,27 @@ class OpenedXRolesViewSet(viewsets.ViewSet):
                 "course_creator": is_course_creator,
                 "authenticated": is_authenticated,
             },
-            "effective_role": effective,
+            "effective_role": self._effective_role(
+                is_superadmin, is_course_staff, is_course_creator, is_authenticated
+            ),
             "context": {
                 "course_id": course_id,
                 "org": org,
             }
-        })
+        }
+        if batch_keys:
+            courses = []
+            for batch_course_id, batch_key in batch_keys.items():
+                course_staff = roles[(COURSE_TEAM, str(batch_key))]
+                course_creator = self._is_course_creator(roles, getattr(batch_key, "org", None))
+                courses.append({
+                    "course_id": batch_course_id,
+                    "course_staff": course_staff,
+                    "course_creator": course_creator,
+                    "effective_role": self._effective_role(
+                        is_superadmin, course_staff, course_creator, is_authenticated
+                    ),
+                })
+            payload["courses"] = courses
+
+        return success_response(payload)
@@ -1,11 +1,44 @@
 """Request/query serializers for v1 Open edX Owly APIs."""
 
+import csv
+import io
+
 from rest_framework import serializers
 
 from openedx_owly_apis.operations.course_structure_validation import validate_course_structure_payload
+from openedx_owly_apis.utils.distribution import DEFAULT_BINS
+from openedx_owly_apis.utils.timeseries import INTERVAL_DAY, INTERVALS, MAX_BUCKETS, bucket_count
 from openedx_owly_apis.views.v2.validators import validate_course_id, validate_unit_id
 
 
+BULK_COHORT_MAX_USERS = 20000
+# Moves run within the request
+BULK_COHORT_MOVE_MAX_USERS = 2000
+BULK_STAFF_MAX_CHANGES = 1000
+_CSV_IDENTIFIER_COLUMNS = ("user_identifier", "identifier", "username", "email", "user_id", "user")
+
+
+def parse_user_identifiers_csv(text):
+    """
+    Return the user identifiers listed in a CSV roster.
+
+    A header row naming a ``username``, ``email``, ``user_id`` (or similar)
+    column selects that column; without one, the first column is used.
+    Blank cells are skipped.
+    """
+    rows = [row for row in csv.reader(io.StringIO(text)) if any(cell.strip() for cell in row)]
+    if not rows:
+        return []
+
+    header = [cell.strip().lower() for cell in rows[0]]
+    column = next((header.index(name) for name in _CSV_IDENTIFIER_COLUMNS if name in header), None)
+    if column is None:
+        column = 0
+    else:
+        rows = rows[1:]
+    return [row[column].strip() for row in rows if len(row) > column and row[column].strip()]
+
+
 def _validate_usage_key(value: str) -> str:
     return validate_unit_id(value)
 
@@ -41,6 +74,28 @@ class UsageKeySerializerMixin:
         return _validate_usage_key(value)
 
 
+class AsyncJobListQuerySerializer(serializers.Serializer, CourseIdSerializerMixin):
+    course_id = serializers.CharField(required=False)
+    status = serializers.ChoiceField(choices=["pending", "running", "success", "failed"], required=False)
+    job_type = serializers.ChoiceField(
+        choices=["course_structure", "publish_content", "cohort_assignment"],
+        required=False,
+    )
+    page = serializers.IntegerField(required=False, default=1, min_value=1)
+    page_size = serializers.IntegerField(required=False, default=20, min_value=1, max_value=100)
+
+
+class AsyncJobStatusQuerySerializer(serializers.Serializer):
+    wait = serializers.IntegerField(required=False, default=0, min_value=0, max_value=30)
+    since = serializers.CharField(required=False)
+
+
+class AsyncJobResultQuerySerializer(serializers.Serializer):
+    section = serializers.ChoiceField(choices=["created_structure", "published_items", "results"], required=False)
+    page = serializers.IntegerField(required=False, default=1, min_value=1)
+    page_size = serializers.IntegerField(required=False, default=50, min_value=1, max_value=500)
+
+
 class CreateCourseRequestSerializer(serializers.Serializer):
     org = serializers.CharField(max_length=255)
     course_number = serializers.CharField(max_length=255)
@@ -209,12 +264,24 @@ class ManageCourseStaffRequestSerializer(serializers.Serializer, CourseIdSeriali
     role_type = serializers.ChoiceField(choices=["staff", "course_creator"], required=False, default="staff")
 
 
+class BulkManageCourseStaffRequestSerializer(serializers.Serializer):
+    changes = ManageCourseStaffRequestSerializer(many=True, allow_empty=False, max_length=BULK_STAFF_MAX_CHANGES)
+
+
 class ListCourseStaffQuerySerializer(serializers.Serializer, CourseIdSerializerMixin):
     course_id = serializers.CharField()
     role_type = serializers.ChoiceField(
         choices=["staff", "course_creator"],
         required=False,
     )
+    page = serializers.IntegerField(required=False, default=1, min_value=1)
+    page_size = serializers.IntegerField(required=False, default=100, min_value=1, max_value=500)
+
+
+class UserCourseRolesQuerySerializer(serializers.Serializer):
+    user_identifiers = serializers.ListField(child=serializers.CharField(), allow_empty=False, max_length=100)
+    page = serializers.IntegerField(required=False, default=1, min_value=1)
+    page_size = serializers.IntegerField(required=False, default=100, min_value=1, max_value=500)
 
 
 class OraContentRequestSerializer(serializers.Serializer, UsageKeySerializerMixin):
@@ -262,9 +329,57 @@ class CohortMemberActionRequestSerializer(serializers.Serializer, CourseIdSerial
     user_identifier = serializers.CharField()
 
 
+class UserRosterRequestSerializer(serializers.Serializer, CourseIdSerializerMixin):
+    """Base for bulk requests listing users as ``user_identifiers`` or a ``csv`` roster."""
+
+    max_users = BULK_COHORT_MAX_USERS
+
+    course_id = serializers.CharField()
+    user_identifiers = serializers.ListField(child=serializers.CharField(), required=False, allow_empty=False)
+    csv = serializers.CharField(required=False, trim_whitespace=False)
+
+    def validate_csv(self, value):
+        identifiers = parse_user_identifiers_csv(value)
+        if not identifiers:
+            raise serializers.ValidationError("The CSV does not list any user.")
+        return identifiers
+
+    def validate(self, attrs):
+        if bool(attrs.get("user_identifiers")) == bool(attrs.get("csv")):
+            raise serializers.ValidationError("Provide either user_identifiers or csv.")
+        attrs["user_identifiers"] = attrs.pop("csv", None) or attrs["user_identifiers"]
+        if len(attrs["user_identifiers"]) > self.max_users:
+            raise serializers.ValidationError(
+                {"user_identifiers": f"At most {self.max_users} users can be given in one request."}
+            )
+        return attrs
+
+
+class BulkCohortAssignmentRequestSerializer(UserRosterRequestSerializer):
+    cohort_id = serializers.IntegerField(min_value=1)
+    run_async = serializers.BooleanField(required=False, default=False)
+
+
+class BulkCohortMoveRequestSerializer(UserRosterRequestSerializer):
+    max_users = BULK_COHORT_MOVE_MAX_USERS
+
+    source_cohort_id = serializers.IntegerField(min_value=1)
+    target_cohort_id = serializers.IntegerField(min_value=1, required=False, allow_null=True, default=None)
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if attrs["target_cohort_id"] == attrs["source_cohort_id"]:
+            raise serializers.ValidationError(
+                {"target_cohort_id": "target_cohort_id must differ from source_cohort_id."}
+            )
+        return attrs
+
+
 class CohortMembersQuerySerializer(serializers.Serializer, CourseIdSerializerMixin):
     course_id = serializers.CharField()
     cohort_id = serializers.IntegerField(min_value=1)
+    cursor = serializers.IntegerField(required=False, min_value=0)
+    page_size = serializers.IntegerField(required=False, default=100, min_value=1, max_value=1000)
 
 
 class DeleteCohortQuerySerializer(serializers.Serializer, CourseIdSerializerMixin):
@@ -295,9 +410,86 @@ class CourseScopedAnalyticsQuerySerializer(serializers.Serializer, CourseIdSeria
     course_id = serializers.CharField()
 
 
+class SnapshotAnalyticsQuerySerializer(CourseScopedAnalyticsQuerySerializer):
+    fresh = serializers.BooleanField(required=False, default=False)
+
+
+class EnrollmentsAnalyticsQuerySerializer(SnapshotAnalyticsQuerySerializer):
+    include_attributes = serializers.BooleanField(required=False, default=True)
+
+
+class EnrollmentAttributesQuerySerializer(CourseScopedAnalyticsQuerySerializer):
+    namespace = serializers.CharField(required=False)
+    name = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, default=10, min_value=1, max_value=100)
+
+    def validate(self, attrs):
+        if attrs.get("name") and not attrs.get("namespace"):
+            raise serializers.ValidationError({"namespace": "namespace is required when name is given."})
+        return attrs
+
+
+class DetailedAnalyticsQuerySerializer(SnapshotAnalyticsQuerySerializer):
+    timing = serializers.BooleanField(required=False, default=False)
+
+
+class EnrollmentExportQuerySerializer(CourseScopedAnalyticsQuerySerializer):
+    # ``format`` is reserved by DRF for renderer selection.
+    export_format = serializers.ChoiceField(choices=["csv", "ndjson"], required=False, default="csv")
+
+
+class ProgressAnalyticsQuerySerializer(CourseScopedAnalyticsQuerySerializer):
+    bins = serializers.IntegerField(required=False, default=DEFAULT_BINS, min_value=1, max_value=100)
+
+
+class BatchAnalyticsQuerySerializer(serializers.Serializer):
+    course_ids = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        allow_empty=False,
+        max_length=500,
+    )
+    org = serializers.CharField(required=False)
+
+    def validate_course_ids(self, value):
+        return [validate_course_id(course_id) for course_id in value]
+
+    def validate(self, attrs):
+        if not attrs.get("course_ids") and not attrs.get("org"):
+            raise serializers.ValidationError("Either course_ids or org is required.")
+        return attrs
+
+
+class EnrollmentTimeseriesQuerySerializer(serializers.Serializer, CourseIdSerializerMixin):
+    course_id = serializers.CharField()
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    interval = serializers.ChoiceField(choices=list(INTERVALS), required=False, default=INTERVAL_DAY)
+
+    def validate(self, attrs):
+        start = attrs.get("start")
+        end = attrs.get("end")
+        if start and end and start > end:
+            raise serializers.ValidationError({"start": "start must be on or before end."})
+        if start and bucket_count(start, end, attrs["interval"]) > MAX_BUCKETS:
+            raise serializers.ValidationError(
+                {"start": f"The range spans more than {MAX_BUCKETS} {attrs['interval']} buckets."}
+            )
+        return attrs
+
+
 class RolesMeQuerySerializer(serializers.Serializer):
     course_id = serializers.CharField(required=False)
+    course_ids = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        allow_empty=False,
+        max_length=100,
+    )
     org = serializers.CharField(required=False)
 
     def validate_course_id(self, value):
         return validate_course_id(value)
+
+    def validate_course_ids(self, value):
+        return list(dict.fromkeys(validate_course_id(course_id) for course_id in value))
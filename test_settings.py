@@ -23,6 +23,14 @@ DATABASES = {
         'PASSWORD': '',
         'HOST': '',
         'PORT': '',
+        # A file-backed test database lets threaded tests wait on SQLite's
+        # write lock instead of failing on a shared in-memory table lock.
+        'OPTIONS': {
+            'timeout': 20,
+        },
+        'TEST': {
+            'NAME': root('test_default.db'),
+        },
     }
 }
 
@@ -34,6 +42,7 @@ INSTALLED_APPS = (
     'django.contrib.sessions',
     'rest_framework',
     'openedx_owly_apis',
+    'test_utils',
 )
 
 LOCALE_PATHS = [
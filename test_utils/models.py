@@ -0,0 +1,178 @@
+"""
+Minimal stand-ins for the Open edX platform models queried by the operations layer.
+
+They only carry the fields the operations read, so logic tests can run their
+queries against real rows without the platform installed. Course keys are
+stored as plain strings.
+"""
+from django.conf import settings
+from django.db import models
+
+
+class UsageKey(str):
+    """Usage key read back from a ``UsageKeyField``; only the parts the operations use."""
+
+    @property
+    def block_id(self):
+        return self.rsplit("@", 1)[-1]
+
+
+class UsageKeyField(models.CharField):
+    """Stand-in for ``opaque_keys``' ``UsageKeyField``: stored as a string, read as a ``UsageKey``."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("max_length", 255)
+        super().__init__(*args, **kwargs)
+
+    def from_db_value(self, value, expression, connection):
+        return None if value is None else UsageKey(value)
+
+
+class CourseOverview(models.Model):
+    """
+    Stand-in for ``course_overviews.CourseOverview``.
+
+    .. no_pii:
+    """
+
+    id = models.CharField(max_length=255, primary_key=True)
+    display_name = models.CharField(max_length=255, blank=True)
+    org = models.CharField(max_length=255, blank=True)
+    max_student_enrollments_allowed = models.IntegerField(null=True)
+    visible_to_staff_only = models.BooleanField(default=False)
+
+    @classmethod
+    def get_from_id(cls, course_key):
+        return cls.objects.get(id=course_key)
+
+    def has_started(self):
+        return True
+
+    def has_ended(self):
+        return False
+
+    def is_enrollment_open(self):
+        return True
+
+
+class CourseEnrollment(models.Model):
+    """
+    Stand-in for ``student.CourseEnrollment``.
+
+    .. no_pii:
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    course_id = models.CharField(max_length=255)
+    mode = models.CharField(max_length=100, default="audit")
+    is_active = models.BooleanField(default=True)
+
+
+class HistoricalCourseEnrollment(models.Model):
+    """
+    Stand-in for the ``simple_history`` table of ``CourseEnrollment``.
+
+    .. no_pii:
+    """
+
+    history_id = models.AutoField(primary_key=True)
+    id = models.IntegerField(db_index=True)
+    course_id = models.CharField(max_length=255)
+    mode = models.CharField(max_length=100)
+    is_active = models.BooleanField()
+    history_date = models.DateTimeField()
+    history_type = models.CharField(max_length=1)
+
+
+# ``simple_history`` exposes the history table as ``CourseEnrollment.history``.
+CourseEnrollment.history = HistoricalCourseEnrollment.objects
+
+
+class CourseAccessRole(models.Model):
+    """
+    Stand-in for ``student.CourseAccessRole``.
+
+    .. no_pii:
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    org = models.CharField(max_length=64, blank=True)
+    course_id = models.CharField(max_length=255, blank=True)
+    role = models.CharField(max_length=64)
+
+
+class DiscussionsConfiguration(models.Model):
+    """
+    Stand-in for ``discussions.DiscussionsConfiguration``.
+
+    .. no_pii:
+    """
+
+    context_key = models.CharField(max_length=255, primary_key=True)
+    enabled = models.BooleanField(default=True)
+    provider_type = models.CharField(max_length=100, default="legacy")
+    enable_in_context = models.BooleanField(default=True)
+    posting_restrictions = models.CharField(max_length=30, default="disabled")
+
+    @classmethod
+    def get(cls, context_key):
+        return cls.objects.get_or_create(context_key=context_key)[0]
+
+    def supports_lti(self):
+        return False
+
+
+class DiscussionTopicLink(models.Model):
+    """
+    Stand-in for ``discussions.DiscussionTopicLink``.
+
+    .. no_pii:
+    """
+
+    context_key = models.CharField(max_length=255, db_index=True)
+    usage_key = UsageKeyField(null=True, blank=True)
+    title = models.CharField(max_length=255)
+    external_id = models.CharField(max_length=255, blank=True)
+    enabled_in_context = models.BooleanField(default=True)
+    ordering = models.PositiveIntegerField(default=0)
+    context = models.JSONField(default=dict)
+
+
+class PersistentSubsectionGrade(models.Model):
+    """
+    Stand-in for ``grades.PersistentSubsectionGrade``.
+
+    .. no_pii:
+    """
+
+    user_id = models.IntegerField()
+    course_id = models.CharField(max_length=255)
+    usage_key = models.CharField(max_length=255)
+    earned_graded = models.FloatField()
+    possible_graded = models.FloatField()
+
+
+class CourseUserGroup(models.Model):
+    """
+    Stand-in for ``course_groups.CourseUserGroup``.
+
+    .. no_pii:
+    """
+
+    COHORT = "cohort"
+
+    name = models.CharField(max_length=255)
+    course_id = models.CharField(max_length=255, db_index=True)
+    group_type = models.CharField(max_length=20, default=COHORT)
+    users = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name="course_groups", blank=True)
+
+
+class CourseCohort(models.Model):
+    """
+    Stand-in for ``course_groups.CourseCohort``.
+
+    .. no_pii:
+    """
+
+    course_user_group = models.OneToOneField(CourseUserGroup, on_delete=models.CASCADE, related_name="cohort")
+    assignment_type = models.CharField(max_length=20, default="manual")
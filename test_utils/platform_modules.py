@@ -0,0 +1,49 @@
+"""
+Helpers to import code that depends on Open edX platform modules.
+
+``stub_modules`` installs fake platform modules for one test (backed by the
+``test_utils.models`` stand-ins where queries matter), and ``load_operations``
+imports a real ``openedx_owly_apis.operations`` module against them.
+"""
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import openedx_owly_apis
+
+
+def module(**attrs):
+    """Return a module object holding ``attrs``."""
+    stub = types.ModuleType("stub")
+    stub.__dict__.update(attrs)
+    return stub
+
+
+def stub_modules(monkeypatch, modules):
+    """Install ``modules`` (a dotted name to module mapping) in ``sys.modules`` for the current test."""
+    for name, stub in modules.items():
+        parts = name.split(".")
+        for depth in range(1, len(parts)):
+            parent = ".".join(parts[:depth])
+            if parent not in sys.modules:
+                monkeypatch.setitem(sys.modules, parent, types.ModuleType(parent))
+        monkeypatch.setitem(sys.modules, name, stub)
+
+
+def load_operations(monkeypatch, name, modules):
+    """
+    Import ``openedx_owly_apis.operations.<name>`` from its file with ``modules`` stubbed.
+
+    The view tests replace the operations modules with stubs in
+    ``sys.modules``, so the real module is loaded from its file and is not
+    registered there.
+    """
+    stub_modules(monkeypatch, modules)
+    spec = importlib.util.spec_from_file_location(
+        f"openedx_owly_apis.operations.{name}",
+        Path(openedx_owly_apis.__file__).parent / "operations" / f"{name}.py",
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    return loaded
@@ -22,6 +22,18 @@ def _ensure_module(path: str):
     return sys.modules[path]
 
 
+@pytest.fixture(autouse=True)
+def clear_role_cache():
+    """Start every test without cached role checks; test users share ids."""
+    from django.core.cache import cache  # pylint: disable=import-outside-toplevel
+    from edx_django_utils.cache import RequestCache  # pylint: disable=import-outside-toplevel
+
+    cache.clear()
+    RequestCache.clear_all_namespaces()
+    yield
+    RequestCache.clear_all_namespaces()
+
+
 @pytest.fixture(autouse=True)
 def stub_openedx_modules():  # pylint: disable=too-many-statements
     """
@@ -84,6 +96,13 @@ def stub_openedx_modules():  # pylint: disable=too-many-statements
                     self.course_key = _CourseKey("course-v1:" + course_part)
                 except Exception:  # pragma: no cover  # pylint: disable=broad-exception-caught
                     self.course_key = None
+            self.block_type = raw.split("+type@", 1)[1].split("+block@", 1)[0]
+
+        @classmethod
+        def from_string(cls, s):
+            if not (isinstance(s, str) and "+type@" in s):
+                raise ValueError(f"Invalid usage key: {s}")
+            return cls(s)
     mod.CourseKey = _CourseKey
     mod.UsageKey = _UsageKey
     stubs.append("opaque_keys.edx.keys")
@@ -147,6 +166,18 @@ def stub_openedx_modules():  # pylint: disable=too-many-statements
             and getattr(user, "is_course_staff", False)
         )
     )
+    perm_mod.COURSE_TEAM = "course_team"
+    perm_mod.COURSE_CREATOR = "course_creator"
+    perm_mod.ORG_COURSE_CREATOR = "org_course_creator"
+    perm_mod.get_course_roles = (
+        lambda user, checks: {  # pylint: disable=unnecessary-lambda-assignment
+            (kind, str(scope)): bool(
+                getattr(user, "is_authenticated", False)
+                and getattr(user, "is_course_staff" if kind == "course_team" else "is_course_creator", False)
+            )
+            for kind, scope in checks
+        }
+    )
     sys.modules["openedx_owly_apis.permissions"] = perm_mod
     stubs.append("openedx_owly_apis.permissions")
 
@@ -174,6 +205,8 @@ def stub_openedx_modules():  # pylint: disable=too-many-statements
     ops_courses.delete_xblock_logic = _simple_ret("delete_xblock_logic")
     ops_courses.manage_course_staff_logic = _simple_ret("manage_course_staff_logic")
     ops_courses.list_course_staff_logic = _simple_ret("list_course_staff_logic")
+    ops_courses.bulk_manage_course_staff_logic = _simple_ret("bulk_manage_course_staff_logic")
+    ops_courses.list_user_course_roles_logic = _simple_ret("list_user_course_roles_logic")
     ops_courses.toggle_certificate_simple_logic = _simple_ret("toggle_certificate_simple_logic")
     ops_courses.add_ora_content_logic = _simple_ret("add_ora_content_logic")
     ops_courses.grade_ora_content_logic = _simple_ret("grade_ora_content_logic")
@@ -185,6 +218,8 @@ def stub_openedx_modules():  # pylint: disable=too-many-statements
     ops_courses.remove_user_from_cohort_logic = _simple_ret("remove_user_from_cohort_logic")
     ops_courses.list_cohort_members_logic = _simple_ret("list_cohort_members_logic")
     ops_courses.delete_cohort_logic = _simple_ret("delete_cohort_logic")
+    ops_courses.bulk_add_users_to_cohort_logic = _simple_ret("bulk_add_users_to_cohort_logic")
+    ops_courses.bulk_move_cohort_members_logic = _simple_ret("bulk_move_cohort_members_logic")
     ops_courses.get_course_tree_logic = _simple_ret("get_course_tree_logic")
     ops_courses.get_vertical_contents_logic = _simple_ret("get_vertical_contents_logic")
     ops_courses.send_bulk_email_logic = _simple_ret("send_bulk_email_logic")
@@ -203,8 +238,13 @@ def stub_openedx_modules():  # pylint: disable=too-many-statements
         def delay(*args, **kwargs):  # pylint: disable=unused-argument
             return SimpleNamespace(id="stub-task-id")
 
+        @staticmethod
+        def apply_async(args=None, kwargs=None, **options):  # pylint: disable=unused-argument
+            return SimpleNamespace(id="stub-task-id")
+
     tasks_mod.create_course_structure_task = _AsyncTaskStub()
     tasks_mod.publish_content_task = _AsyncTaskStub()
+    tasks_mod.bulk_add_users_to_cohort_task = _AsyncTaskStub()
     sys.modules["openedx_owly_apis.tasks"] = tasks_mod
     stubs.append("openedx_owly_apis.tasks")
 
@@ -223,6 +263,11 @@ def stub_openedx_modules():  # pylint: disable=too-many-statements
         return _fn
     ops_analytics.get_overview_analytics_logic = _mk_analytics("get_overview_analytics_logic")
     ops_analytics.get_enrollments_analytics_logic = _mk_analytics("get_enrollments_analytics_logic")
+    ops_analytics.get_batch_overview_analytics_logic = _mk_analytics("get_batch_overview_analytics_logic")
+    ops_analytics.get_enrollment_export_logic = _mk_analytics("get_enrollment_export_logic")
+    ops_analytics.get_progress_distribution_logic = _mk_analytics("get_progress_distribution_logic")
+    ops_analytics.get_enrollment_attributes_analytics_logic = _mk_analytics("get_enrollment_attributes_analytics_logic")
+    ops_analytics.get_enrollment_timeseries_logic = _mk_analytics("get_enrollment_timeseries_logic")
     ops_analytics.get_discussions_analytics_logic = _mk_analytics("get_discussions_analytics_logic")
     ops_analytics.get_detailed_analytics_logic = _mk_analytics("get_detailed_analytics_logic")
     sys.modules["openedx_owly_apis.operations.analytics"] = ops_analytics
@@ -268,6 +313,8 @@ def stub_openedx_modules():  # pylint: disable=too-many-statements
     ops_courses.update_advanced_settings_logic = _mk_courses_stub("update_advanced_settings_logic")
     ops_courses.manage_course_staff_logic = _mk_courses_stub("manage_course_staff_logic")
     ops_courses.list_course_staff_logic = _mk_courses_stub("list_course_staff_logic")
+    ops_courses.bulk_manage_course_staff_logic = _mk_courses_stub("bulk_manage_course_staff_logic")
+    ops_courses.list_user_course_roles_logic = _mk_courses_stub("list_user_course_roles_logic")
     ops_courses.add_ora_content_logic = _mk_courses_stub("add_ora_content_logic")
     ops_courses.grade_ora_content_logic = _mk_courses_stub("grade_ora_content_logic")
     ops_courses.get_ora_details_logic = _mk_courses_stub("get_ora_details_logic")
@@ -278,6 +325,8 @@ def stub_openedx_modules():  # pylint: disable=too-many-statements
     ops_courses.remove_user_from_cohort_logic = _mk_courses_stub("remove_user_from_cohort_logic")
     ops_courses.list_cohort_members_logic = _mk_courses_stub("list_cohort_members_logic")
     ops_courses.delete_cohort_logic = _mk_courses_stub("delete_cohort_logic")
+    ops_courses.bulk_add_users_to_cohort_logic = _mk_courses_stub("bulk_add_users_to_cohort_logic")
+    ops_courses.bulk_move_cohort_members_logic = _mk_courses_stub("bulk_move_cohort_members_logic")
     ops_courses.create_openedx_problem_logic = _mk_courses_stub("create_openedx_problem_logic")
     ops_courses.publish_content_logic = _mk_courses_stub("publish_content_logic")
     ops_courses.delete_xblock_logic = _mk_courses_stub("delete_xblock_logic")
@@ -0,0 +1,99 @@
+"""
+Tests for the per-course analytics cache and its invalidation signals.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+
+from openedx_owly_apis import analytics_cache, signals
+
+COURSE_ID = "course-v1:ORG+NUM+RUN"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _counting_logic(kind="overview", result=None):
+    calls = []
+
+    @analytics_cache.cache_course_analytics(kind)
+    def logic(course_id=None, **kwargs):
+        calls.append((course_id, kwargs))
+        return dict(result or {"course_id": course_id, "calls": len(calls)})
+
+    return logic, calls
+
+
+def test_cached_result_is_reused_and_carries_cached_at():
+    logic, calls = _counting_logic()
+
+    first = logic(COURSE_ID)
+    second = logic(COURSE_ID)
+
+    assert len(calls) == 1
+    assert first == second
+    assert first["cached_at"]
+
+
+def test_results_without_course_or_with_errors_are_not_cached():
+    logic, calls = _counting_logic()
+    failing, failing_calls = _counting_logic("detailed", {"error": "boom"})
+
+    logic(None)
+    logic(None)
+    failing(COURSE_ID)
+    failing(COURSE_ID)
+
+    assert len(calls) == 2
+    assert len(failing_calls) == 2
+    assert "cached_at" not in failing(COURSE_ID)
+
+
+def test_keyword_arguments_are_part_of_the_key():
+    logic, calls = _counting_logic()
+
+    logic(COURSE_ID, interval="day")
+    logic(COURSE_ID, interval="week")
+    logic(COURSE_ID, interval="day")
+
+    assert len(calls) == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("send", [
+    lambda: signals.handle_enroll_status_change(sender=None, event="enroll", course_id=COURSE_ID),
+    lambda: signals.handle_course_enrollment_saved(sender=None, instance=SimpleNamespace(course_id=COURSE_ID)),
+    lambda: signals.handle_course_mode_saved(sender=None, instance=SimpleNamespace(course_id=COURSE_ID)),
+    lambda: signals.handle_discussions_configuration_saved(
+        sender=None, instance=SimpleNamespace(context_key=COURSE_ID)
+    ),
+])
+def test_signals_invalidate_cached_course_analytics(send):
+    logic, calls = _counting_logic()
+    other_course = "course-v1:ORG+OTHER+RUN"
+    logic(COURSE_ID)
+    logic(other_course)
+
+    send()
+    refreshed = logic(COURSE_ID)
+    logic(other_course)
+
+    assert refreshed["calls"] == 3
+    assert len(calls) == 3
+
+
+def test_invalidation_survives_evicted_version():
+    logic, calls = _counting_logic()
+    logic(COURSE_ID)
+
+    cache.delete(analytics_cache._version_key(COURSE_ID))  # pylint: disable=protected-access
+    analytics_cache.invalidate_course_analytics(COURSE_ID)
+    logic(COURSE_ID)
+
+    assert len(calls) == 2
@@ -0,0 +1,95 @@
+"""
+Tests for precomputed analytics snapshots.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from openedx_owly_apis import analytics_snapshots
+from openedx_owly_apis.analytics_cache import get_course_version, invalidate_course_analytics
+from openedx_owly_apis.models import OwlyAnalyticsSnapshot
+
+pytestmark = pytest.mark.django_db
+
+COURSE_ID = "course-v1:ORG+NUM+RUN"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _store(kind, payload):
+    analytics_snapshots.store_analytics_snapshot(COURSE_ID, kind, payload, get_course_version(COURSE_ID))
+
+
+def test_store_keeps_only_latest_snapshot_per_kind():
+    _store("detailed", {"version": 1})
+    _store("detailed", {"version": 2})
+
+    snapshot = analytics_snapshots.get_analytics_snapshot(COURSE_ID, "detailed")
+
+    assert OwlyAnalyticsSnapshot.objects.count() == 1
+    assert snapshot["version"] == 2
+    assert snapshot["snapshot_at"]
+    assert analytics_snapshots.get_analytics_snapshot(COURSE_ID, "enrollments") is None
+
+
+def test_expired_snapshots_are_not_served(settings):
+    settings.OWLY_ANALYTICS_SNAPSHOT_MAX_AGE = 60
+    _store("detailed", {"version": 1})
+    OwlyAnalyticsSnapshot.objects.update(computed_at=timezone.now() - timedelta(minutes=5))
+
+    assert analytics_snapshots.get_analytics_snapshot(COURSE_ID, "detailed") is None
+
+
+def test_snapshots_are_not_served_after_course_analytics_are_invalidated():
+    _store("detailed", {"version": 1})
+    assert analytics_snapshots.get_analytics_snapshot(COURSE_ID, "detailed")["version"] == 1
+
+    invalidate_course_analytics(COURSE_ID)
+
+    assert analytics_snapshots.get_analytics_snapshot(COURSE_ID, "detailed") is None
+
+
+def test_snapshot_computed_during_an_invalidation_is_not_served(monkeypatch):
+    def _build(course_id):
+        # A change lands while the payload is being computed.
+        invalidate_course_analytics(course_id)
+        return {"course_id": course_id}
+
+    monkeypatch.setattr(analytics_snapshots, "_snapshot_builders", lambda: {"detailed": _build})
+
+    assert analytics_snapshots.refresh_analytics_snapshots([COURSE_ID]) == {"stored": 1, "failed": []}
+    assert analytics_snapshots.get_analytics_snapshot(COURSE_ID, "detailed") is None
+
+
+def test_refresh_stores_every_kind_and_reports_failures(monkeypatch):
+    def _builder(kind):
+        def _build(course_id):
+            if course_id.endswith("BROKEN"):
+                return {"error": "boom"}
+            return {"course_id": course_id, "kind": kind}
+        return _build
+
+    monkeypatch.setattr(analytics_snapshots, "_snapshot_builders", lambda: {
+        "enrollments": _builder("enrollments"),
+        "detailed": _builder("detailed"),
+    })
+
+    summary = analytics_snapshots.refresh_analytics_snapshots([COURSE_ID, "course-v1:ORG+NUM+BROKEN"])
+
+    assert summary == {
+        "stored": 2,
+        "failed": ["course-v1:ORG+NUM+BROKEN:enrollments", "course-v1:ORG+NUM+BROKEN:detailed"],
+    }
+    assert analytics_snapshots.get_analytics_snapshot(COURSE_ID, "enrollments")["kind"] == "enrollments"
+
+
+def test_chunked_splits_course_ids():
+    assert analytics_snapshots.chunked(["a", "b", "c"], 2) == [["a", "b"], ["c"]]
@@ -0,0 +1,44 @@
+"""
+Tests for the concurrent analytics helper.
+"""
+
+import threading
+import time
+
+import pytest
+
+from openedx_owly_apis.utils.concurrency import run_concurrently
+
+
+def test_run_concurrently_overlaps_parts_and_reports_timings():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _part(value):
+        def _run():
+            # Both parts must be running at the same time to pass the barrier.
+            barrier.wait()
+            time.sleep(0.05)
+            return value
+        return _run
+
+    results, timings = run_concurrently({"first": _part(1), "second": _part(2)})
+
+    assert results == {"first": 1, "second": 2}
+    assert set(timings) == {"first", "second", "total"}
+    assert timings["total"] < timings["first"] + timings["second"]
+
+
+def test_run_concurrently_reraises_after_all_parts_finish():
+    finished = []
+
+    def _fail():
+        raise ValueError("boom")
+
+    def _slow():
+        time.sleep(0.05)
+        finished.append(True)
+
+    with pytest.raises(ValueError, match="boom"):
+        run_concurrently({"fail": _fail, "slow": _slow})
+
+    assert finished == [True]
@@ -0,0 +1,48 @@
+"""
+Tests for the score distribution helpers.
+"""
+
+import pytest
+
+from openedx_owly_apis.utils import distribution
+
+
+def test_quantile_interpolates_between_ranks():
+    values = [0.0, 0.25, 0.5, 1.0]
+
+    assert distribution.quantile(values, 0) == 0.0
+    assert distribution.quantile(values, 0.5) == pytest.approx(0.375)
+    assert distribution.quantile(values, 1) == 1.0
+
+
+def test_sample_stride_keeps_small_distributions_whole():
+    assert distribution.sample_stride(0, sample_size=100) == 1
+    assert distribution.sample_stride(100, sample_size=100) == 1
+    assert distribution.sample_stride(101, sample_size=100) == 2
+    assert distribution.sample_stride(1000, sample_size=100) == 10
+
+
+def test_bin_bounds_leave_first_and_last_bins_open():
+    assert distribution.bin_bounds(0, bins=10) == (None, 1)
+    assert distribution.bin_bounds(4, bins=10) == (4, 5)
+    assert distribution.bin_bounds(9, bins=10) == (9, None)
+    assert distribution.bin_bounds(0, bins=1) == (None, None)
+
+
+def test_summarize_distribution():
+    summary = distribution.summarize_distribution(4, 0.5, 0.0, 1.0, [1, 3], [1.0, 0.5, 0.0, 0.5])
+
+    assert summary["count"] == 4
+    assert summary["mean"] == 0.5
+    assert (summary["min"], summary["max"]) == (0.0, 1.0)
+    assert summary["quantiles"]["p50"] == 0.5
+    assert summary["quantiles"]["p90"] == pytest.approx(0.85)
+    assert summary["quantile_sample_size"] == 4
+    assert summary["histogram"] == [{"lower": 0.0, "count": 1}, {"lower": 0.5, "count": 3}]
+
+
+def test_summarize_distribution_empty():
+    summary = distribution.summarize_distribution(0, None, None, None, [0, 0], [])
+
+    assert summary["count"] == 0
+    assert summary["histogram"] == []
@@ -0,0 +1,212 @@
+"""
+Tests for the durable async job store.
+"""
+
+import pytest
+from django.core.cache import cache
+
+from openedx_owly_apis import job_store
+from openedx_owly_apis.models import OwlyAsyncJob, OwlyAsyncJobResult
+
+pytestmark = pytest.mark.django_db
+
+
+def test_create_job_persists_row_and_flattens_params():
+    payload = job_store.create_job(
+        OwlyAsyncJob.TYPE_PUBLISH_CONTENT,
+        course_id="course-v1:ORG+NUM+RUN",
+        user_identifier=7,
+        content_id="course-v1:ORG+NUM+RUN",
+        publish_type="course",
+    )
+
+    job = OwlyAsyncJob.objects.get(job_id=payload["job_id"])
+    assert job.status == "pending"
+    assert job.requested_by == "7"
+    assert payload["content_id"] == "course-v1:ORG+NUM+RUN"
+    assert payload["publish_type"] == "course"
+
+
+def test_get_job_falls_back_to_database_after_cache_eviction():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+    cache.delete(job_store._job_cache_key(payload["job_id"]))  # pylint: disable=protected-access
+
+    assert job_store.get_job(payload["job_id"])["job_id"] == payload["job_id"]
+    assert job_store.get_job(payload["job_id"], job_type=OwlyAsyncJob.TYPE_PUBLISH_CONTENT) is None
+
+
+def test_update_job_stamps_completion_for_terminal_status():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+
+    updated = job_store.update_job(payload["job_id"], status="failed", error="boom")
+
+    assert updated["status"] == "failed"
+    assert updated["error"] == "boom"
+    assert updated["completed_at"] is not None
+    assert job_store.update_job("missing-job", status="running") is None
+
+
+def test_list_jobs_paginates_newest_first():
+    ids = [
+        job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")["job_id"]
+        for _ in range(3)
+    ]
+
+    first_page = job_store.list_jobs(course_id="course-v1:ORG+NUM+RUN", page=1, page_size=2)
+    second_page = job_store.list_jobs(course_id="course-v1:ORG+NUM+RUN", page=2, page_size=2)
+
+    assert first_page["count"] == 3
+    assert first_page["num_pages"] == 2
+    listed = [job["job_id"] for job in first_page["jobs"] + second_page["jobs"]]
+    assert sorted(listed) == sorted(ids)
+
+
+def test_update_job_rejects_status_regression():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+    job_store.update_job(payload["job_id"], status="success", result={"success": True})
+
+    current = job_store.update_job(payload["job_id"], status="running", progress_message="Restarted")
+
+    assert current["status"] == "success"
+    assert current["progress_message"] is None
+    assert current["result_summary"] == {"success": True}
+
+
+def test_update_job_rejects_unknown_status():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+
+    with pytest.raises(ValueError):
+        job_store.update_job(payload["job_id"], status="exploded")
+
+
+def test_update_job_only_writes_given_columns():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+    job_store.update_job(payload["job_id"], status="running", progress_message="Creating course structure")
+
+    # A late task_id write from the view must not reset the worker's status.
+    updated = job_store.update_job(payload["job_id"], task_id="task-1")
+
+    assert updated["status"] == "running"
+    assert updated["progress_message"] == "Creating course structure"
+    assert updated["task_id"] == "task-1"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_updates_never_lose_fields_or_regress():
+    from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    from django.db import connection  # pylint: disable=import-outside-toplevel
+
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_PUBLISH_CONTENT, course_id="course-v1:ORG+NUM+RUN")
+    job_id = payload["job_id"]
+
+    def _worker(index):
+        try:
+            for step in range(20):
+                if index == 0 and step == 10:
+                    job_store.update_job(job_id, status="success")
+                elif index % 3 == 0:
+                    job_store.update_job(job_id, task_id=f"task-{index}")
+                elif index % 3 == 1:
+                    job_store.update_job(job_id, status="running", progress_message=f"{index}:{step}")
+                else:
+                    job_store.update_job(job_id, **{f"worker_{index}": step})
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(_worker, range(6)))
+
+    cache.clear()
+    final = job_store.get_job(job_id)
+    assert final["status"] == "success"
+    assert final["completed_at"] is not None
+    assert final["task_id"] in {"task-0", "task-3"}
+    assert final["worker_2"] == 19
+    assert final["worker_5"] == 19
+    assert final["progress_message"].split(":")[0] in {"1", "4"}
+
+
+def test_wait_for_job_change_returns_immediately_for_stale_version():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+
+    assert job_store.wait_for_job_change(payload["job_id"], since="older", timeout=30)["job_id"] == payload["job_id"]
+    assert job_store.wait_for_job_change("missing-job", since="older", timeout=30) is None
+
+
+def test_wait_for_job_change_times_out_without_change(monkeypatch):
+    monkeypatch.setattr(job_store, "LONG_POLL_INTERVAL_SECONDS", 0.01)
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+
+    unchanged = job_store.wait_for_job_change(payload["job_id"], since=payload["updated_at"], timeout=0.05)
+
+    assert unchanged["updated_at"] == payload["updated_at"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_wait_for_job_change_wakes_up_on_update(monkeypatch):
+    import threading  # pylint: disable=import-outside-toplevel
+
+    from django.db import connection  # pylint: disable=import-outside-toplevel
+
+    monkeypatch.setattr(job_store, "LONG_POLL_INTERVAL_SECONDS", 0.01)
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+
+    def _finish():
+        try:
+            job_store.update_job(payload["job_id"], status="success")
+        finally:
+            connection.close()
+
+    timer = threading.Timer(0.05, _finish)
+    timer.start()
+    changed = job_store.wait_for_job_change(payload["job_id"], since=payload["updated_at"], timeout=5)
+    timer.join()
+
+    assert changed["status"] == "success"
+
+
+def test_iter_job_updates_stops_after_terminal_status():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+    job_store.update_job(payload["job_id"], status="failed", error="boom")
+
+    updates = list(job_store.iter_job_updates(payload["job_id"], max_duration=5))
+
+    assert [update["status"] for update in updates] == ["failed"]
+
+
+def test_update_job_stores_result_compressed_outside_status_payload():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_COURSE_STRUCTURE, course_id="course-v1:ORG+NUM+RUN")
+    created = [{"type": "vertical", "display_name": f"Unit {index}"} for index in range(120)]
+
+    current = job_store.update_job(
+        payload["job_id"],
+        status="success",
+        result={"success": True, "course_id": "course-v1:ORG+NUM+RUN", "created_structure": created},
+    )
+
+    assert "result" not in current
+    assert current["result_summary"] == {
+        "success": True,
+        "course_id": "course-v1:ORG+NUM+RUN",
+        "created_structure_count": 120,
+    }
+    record = OwlyAsyncJobResult.objects.get(job_id=payload["job_id"])
+    assert len(bytes(record.data)) < record.size
+    assert job_store.get_job_result(payload["job_id"])["created_structure"] == created
+
+
+def test_get_job_result_page_paginates_result_section():
+    payload = job_store.create_job(OwlyAsyncJob.TYPE_PUBLISH_CONTENT, course_id="course-v1:ORG+NUM+RUN")
+    items = [{"block_id": f"block-{index}"} for index in range(5)]
+    job_store.update_job(payload["job_id"], status="success", result={"success": True, "published_items": items})
+
+    page = job_store.get_job_result_page(payload["job_id"], page=2, page_size=2)
+
+    assert page["section"] == "published_items"
+    assert page["sections"] == ["published_items"]
+    assert page["items"] == items[2:4]
+    assert page["count"] == 5
+    assert page["num_pages"] == 3
+    assert page["summary"] == {"success": True, "published_items_count": 5}
+    assert job_store.get_job_result_page("missing-job") is None
@@ -0,0 +1,302 @@
+"""
+Tests for the analytics operations, run against rows of the stand-in platform models.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth import get_user_model
+from edx_django_utils.cache import RequestCache
+
+from openedx_owly_apis.utils import concurrency
+from test_utils import models as platform
+from test_utils.platform_modules import load_operations, module
+
+pytestmark = pytest.mark.django_db
+
+COURSE = "course-v1:ORG+NUM+RUN"
+SUBSECTION = "block-v1:ORG+NUM+RUN+type@sequential+block@quiz1"
+
+
+@pytest.fixture()
+def analytics(monkeypatch):
+    """Load the real analytics operations with the platform imports backed by ``test_utils`` models."""
+    return load_operations(monkeypatch, "analytics", {
+        "common.djangoapps.course_modes.models": module(CourseMode=None),
+        "common.djangoapps.student.models": module(
+            CourseAccessRole=platform.CourseAccessRole,
+            CourseEnrollment=platform.CourseEnrollment,
+            CourseEnrollmentAttribute=None,
+        ),
+        "common.djangoapps.student.roles": module(
+            CourseInstructorRole=SimpleNamespace(ROLE="instructor"),
+            CourseStaffRole=SimpleNamespace(ROLE="staff"),
+        ),
+        "lms.djangoapps.grades.models": module(PersistentSubsectionGrade=platform.PersistentSubsectionGrade),
+        "opaque_keys.edx.keys": module(CourseKey=SimpleNamespace(from_string=str)),
+        "openedx.core.djangoapps.content.course_overviews.models": module(CourseOverview=platform.CourseOverview),
+        "openedx.core.djangoapps.discussions.models": module(
+            DiscussionsConfiguration=platform.DiscussionsConfiguration,
+            DiscussionTopicLink=platform.DiscussionTopicLink,
+            get_default_provider_type=lambda: "legacy",
+        ),
+        "openedx.core.djangoapps.enrollments.data": module(get_course_enrollment_info=None),
+        "xmodule.modulestore": module(ModuleStoreEnum=None),
+        "xmodule.modulestore.django": module(modulestore=lambda: SimpleNamespace(
+            get_items=lambda course_key, qualifiers: [
+                SimpleNamespace(location=f"{SUBSECTION}", display_name="Quiz 1"),
+            ],
+        )),
+        "xmodule.modulestore.exceptions": module(DuplicateCourseError=Exception),
+    })
+
+
+def _enroll(course_id, count, mode="audit", start=0):
+    users = [
+        get_user_model().objects.create(username=f"{course_id}-{mode}-{index}")
+        for index in range(start, start + count)
+    ]
+    platform.CourseEnrollment.objects.bulk_create(
+        platform.CourseEnrollment(user=user, course_id=course_id, mode=mode) for user in users
+    )
+    return users
+
+
+def test_batch_overview_counts_modes_and_caps_without_staff(analytics):
+    platform.CourseOverview.objects.create(id=COURSE, org="ORG", max_student_enrollments_allowed=3)
+    platform.CourseOverview.objects.create(id="course-v1:ORG+CLOSED+RUN", org="ORG", max_student_enrollments_allowed=0)
+    platform.CourseOverview.objects.create(id="course-v1:ORG+OPEN+RUN", org="ORG")
+    staff = _enroll(COURSE, 2, mode="audit")
+    _enroll(COURSE, 2, mode="verified")
+    for user in staff:
+        platform.CourseAccessRole.objects.create(user=user, course_id=COURSE, org="ORG", role="staff")
+    _enroll("course-v1:ORG+OPEN+RUN", 1)
+
+    result = analytics.get_batch_overview_analytics_logic(
+        course_ids=[COURSE, "course-v1:ORG+CLOSED+RUN", "course-v1:ORG+OPEN+RUN", "course-v1:ORG+GONE+RUN"],
+    )
+
+    stats = {course_id: course["enrollment_stats"] for course_id, course in result["courses"].items()}
+    assert stats[COURSE]["enrollment_by_mode"] == {"total": 4, "audit": 2, "verified": 2}
+    # Staff are not counted against the cap, so two learners do not fill three seats.
+    assert stats[COURSE]["is_course_full"] is False
+    # A cap of zero means no seats at all, as in the single-course overview.
+    assert stats["course-v1:ORG+CLOSED+RUN"]["is_course_full"] is True
+    assert stats["course-v1:ORG+OPEN+RUN"]["is_course_full"] is False
+    assert result["not_found"] == ["course-v1:ORG+GONE+RUN"]
+
+    _enroll(COURSE, 1, mode="verified", start=2)
+    refreshed = analytics.get_batch_overview_analytics_logic(org="ORG")
+    assert refreshed["courses"][COURSE]["enrollment_stats"]["is_course_full"] is True
+
+
+def _grade(usage_key, earned, possible, user_id=1, course_id=COURSE):
+    return platform.PersistentSubsectionGrade(
+        user_id=user_id, course_id=course_id, usage_key=usage_key, earned_graded=earned, possible_graded=possible,
+    )
+
+
+def test_progress_distribution_aggregates_scores_per_subsection(analytics):
+    platform.CourseOverview.objects.create(id=COURSE, display_name="Course")
+    other = "block-v1:ORG+NUM+RUN+type@sequential+block@quiz2"
+    platform.PersistentSubsectionGrade.objects.bulk_create([
+        _grade(SUBSECTION, 0, 4),
+        _grade(SUBSECTION, 1, 4),
+        _grade(SUBSECTION, 2, 4),
+        _grade(SUBSECTION, 4, 4),
+        _grade(other, 3, 10),
+        _grade(other, 5, 0),
+        _grade(SUBSECTION, 4, 4, course_id="course-v1:ORG+OTHER+RUN"),
+    ])
+
+    result = analytics.get_progress_distribution_logic.__wrapped__(COURSE, bins=4)
+
+    first, second = result["subsections"]
+    assert first["usage_key"] == SUBSECTION
+    assert first["display_name"] == "Quiz 1"
+    assert (first["count"], first["mean"], first["min"], first["max"]) == (4, 0.4375, 0.0, 1.0)
+    assert first["quantiles"]["p50"] == 0.375
+    assert first["quantile_sample_size"] == 4
+    # A perfect score lands in the last, closed bin.
+    assert [entry["count"] for entry in first["histogram"]] == [1, 1, 1, 1]
+    # Rows without possible points are left out.
+    assert (second["usage_key"], second["display_name"], second["count"]) == (other, None, 1)
+    assert [entry["count"] for entry in second["histogram"]] == [0, 1, 0, 0]
+
+
+def test_progress_distribution_samples_large_subsections_for_quantiles(analytics, monkeypatch):
+    monkeypatch.setattr(analytics, "sample_stride", lambda count: 1 if count < 10 else 5)
+    platform.CourseOverview.objects.create(id=COURSE, display_name="Course")
+    platform.PersistentSubsectionGrade.objects.bulk_create(
+        _grade(SUBSECTION, earned, 100, user_id=earned) for earned in range(100)
+    )
+
+    subsection = analytics.get_progress_distribution_logic.__wrapped__(COURSE)["subsections"][0]
+
+    # Count, mean and histogram stay exact; only the quantiles use the sample.
+    assert subsection["count"] == 100
+    assert subsection["mean"] == pytest.approx(0.495)
+    assert [entry["count"] for entry in subsection["histogram"]] == [10] * 10
+    assert subsection["quantile_sample_size"] == 20
+    assert subsection["quantiles"]["p50"] == pytest.approx(0.5, abs=0.05)
+
+
+def _history(enrollment_id, day, mode, is_active, history_type="~"):
+    return platform.HistoricalCourseEnrollment(
+        id=enrollment_id,
+        course_id=COURSE,
+        mode=mode,
+        is_active=is_active,
+        history_date=datetime(2026, 3, day, 12, tzinfo=timezone.utc),
+        history_type=history_type,
+    )
+
+
+def test_enrollment_timeseries_counts_activation_changes_only(analytics):
+    platform.HistoricalCourseEnrollment.objects.bulk_create([
+        # Created inactive and activated the same day, as the platform enrolls.
+        _history(1, 2, "audit", False, history_type="+"),
+        _history(1, 2, "audit", True),
+        # Unenrolled, then a mode change while inactive, then reactivated.
+        _history(1, 3, "audit", False),
+        _history(1, 4, "verified", False),
+        _history(1, 5, "verified", True),
+        # Created active; a later save that keeps it active is not an enrollment.
+        _history(2, 2, "verified", True, history_type="+"),
+        _history(2, 3, "verified", True),
+    ])
+
+    result = analytics.get_enrollment_timeseries_logic.__wrapped__(
+        COURSE, start=date(2026, 3, 1), end=date(2026, 3, 5),
+    )
+
+    assert result["enrollments"] == {"audit": [0, 1, 0, 0, 0], "verified": [0, 1, 0, 0, 1]}
+    assert result["unenrollments"] == {"audit": [0, 0, 1, 0, 0]}
+
+
+class _Enrollments:
+    """``CourseEnrollment.objects`` stand-in that records which counts are run."""
+
+    def __init__(self):
+        self.calls = []
+
+    def enrollment_counts(self, course_key):
+        self.calls.append("enrollment_counts")
+        return {"total": 2, "audit": 2}
+
+    def num_enrolled_in_exclude_admins(self, course_key):
+        self.calls.append("num_enrolled_in_exclude_admins")
+        return 2
+
+
+def _overview(max_enrollments):
+    return SimpleNamespace(
+        display_name="Course",
+        org="ORG",
+        display_number_with_default="NUM",
+        id=SimpleNamespace(run="RUN"),
+        start=None,
+        end=None,
+        self_paced=False,
+        max_student_enrollments_allowed=max_enrollments,
+        is_enrollment_open=lambda: True,
+        has_started=lambda: True,
+        has_ended=lambda: False,
+    )
+
+
+@pytest.fixture()
+def detailed(analytics, monkeypatch):
+    """Analytics operations with the detailed-analytics platform calls replaced by in-memory stand-ins."""
+    # A single pool thread, so every call reuses the same thread and its request cache.
+    monkeypatch.setattr(concurrency, "_executor", ThreadPoolExecutor(max_workers=1))
+    modes = {COURSE: ["audit"]}
+
+    def modes_for_course(course_key):
+        # Memoized in the request cache, like the platform's ``CourseMode.modes_for_course``.
+        cache = RequestCache("course_modes")
+        cached = cache.get_cached_response(course_key)
+        if cached.is_found:
+            return cached.value
+        value = [SimpleNamespace(slug=slug, min_price=0, currency="usd") for slug in modes[course_key]]
+        cache.set(course_key, value)
+        return value
+
+    enrollments = _Enrollments()
+    overview = {"max": None}
+    monkeypatch.setattr(analytics, "CourseMode", SimpleNamespace(modes_for_course=modes_for_course))
+    monkeypatch.setattr(analytics, "CourseEnrollment", SimpleNamespace(objects=enrollments))
+    monkeypatch.setattr(analytics, "CourseOverview", SimpleNamespace(
+        get_from_id=lambda course_key: _overview(overview["max"]),
+    ))
+    return SimpleNamespace(analytics=analytics, modes=modes, enrollments=enrollments, overview=overview)
+
+
+def test_detailed_analytics_does_not_reuse_request_cache_of_pool_threads(detailed):
+    first = detailed.analytics.get_detailed_analytics_logic(COURSE)
+    detailed.modes[COURSE] = ["audit", "verified"]
+    second = detailed.analytics.get_detailed_analytics_logic(COURSE)
+
+    assert [mode["slug"] for mode in first["comprehensive_summary"]["course_modes"]] == ["audit"]
+    assert [mode["slug"] for mode in second["comprehensive_summary"]["course_modes"]] == ["audit", "verified"]
+
+
+def test_detailed_analytics_counts_learners_only_for_capped_courses(detailed):
+    uncapped = detailed.analytics.get_detailed_analytics_logic(COURSE)
+
+    assert uncapped["comprehensive_summary"]["operational_status"]["is_full"] is False
+    assert "num_enrolled_in_exclude_admins" not in detailed.enrollments.calls
+
+    detailed.overview["max"] = 2
+    capped = detailed.analytics.get_detailed_analytics_logic(COURSE)
+
+    assert capped["comprehensive_summary"]["operational_status"]["is_full"] is True
+    assert "num_enrolled_in_exclude_admins" in detailed.enrollments.calls
+
+
+def _unit(block_id):
+    return f"block-v1:ORG+NUM+RUN+type@vertical+block@{block_id}"
+
+
+def test_discussions_analytics_counts_and_orders_topics(analytics, monkeypatch):
+    lookups = []
+
+    def get_items(course_key, qualifiers):
+        lookups.append(qualifiers)
+        units = {"unit1": "Unit one (renamed)", "unit2": "Unit two"}
+        return [
+            SimpleNamespace(location=_unit(block_id), display_name=name)
+            for block_id, name in units.items() if block_id in qualifiers["name"]
+        ]
+
+    monkeypatch.setattr(analytics, "modulestore", lambda: SimpleNamespace(get_items=get_items))
+    platform.CourseOverview.objects.create(id=COURSE, display_name="Course")
+    platform.DiscussionTopicLink.objects.bulk_create([
+        platform.DiscussionTopicLink(
+            context_key=COURSE, usage_key=_unit("unit2"), title="Unit two", ordering=2,
+            context={"section": "Week 1", "subsection": "Lesson 2"}, enabled_in_context=False,
+        ),
+        platform.DiscussionTopicLink(
+            context_key=COURSE, usage_key=_unit("unit1"), title="Unit one", ordering=1,
+            context={"section": "Week 1", "subsection": "Lesson 1"},
+        ),
+        platform.DiscussionTopicLink(context_key=COURSE, usage_key=_unit("gone"), title="Deleted unit", ordering=3),
+        platform.DiscussionTopicLink(context_key="course-v1:ORG+OTHER+RUN", usage_key=_unit("unit1"), title="Other"),
+    ])
+
+    result = analytics.get_discussions_analytics_logic.__wrapped__(COURSE)
+
+    assert result["topics_summary"] == {"total_topics": 3, "enabled_topics": 2, "disabled_topics": 1}
+    assert [
+        (topic["unit_name"], topic["section"], topic["enabled"], topic["in_course_structure"])
+        for topic in result["topics"]
+    ] == [
+        ("Unit one (renamed)", "Week 1", True, True),
+        ("Unit two", "Week 1", False, True),
+        # A unit missing from the course keeps the title stored with its link.
+        ("Deleted unit", None, True, False),
+    ]
+    # Only the linked units are loaded, with a single modulestore query.
+    assert lookups == [{"category": "vertical", "name": ["gone", "unit1", "unit2"]}]
@@ -0,0 +1,477 @@
+"""
+Tests for the course operations, run against rows of the stand-in platform models.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from test_utils import models as platform
+from test_utils.platform_modules import load_operations, module
+
+pytestmark = pytest.mark.django_db
+
+COURSE = "course-v1:ORG+NUM+RUN"
+
+
+class _CourseKey(str):
+    """Course key parsed from a string; only the parts the operations use."""
+
+    @property
+    def org(self):
+        return self.split(":", 1)[1].split("+")[0]
+
+
+class _AccessRole:
+    """Platform access role stand-in, backed by ``CourseAccessRole`` rows like ``student.roles``."""
+
+    ROLE = None
+
+    def __init__(self, course_key=None, org=""):
+        self.course_id = course_key or ""
+        self.org = course_key.org if course_key else org
+
+    def _rows(self):
+        return platform.CourseAccessRole.objects.filter(role=self.ROLE, org=self.org, course_id=self.course_id)
+
+    def has_user(self, user):
+        return self._rows().filter(user=user).exists()
+
+    def add_users(self, *users):
+        for user in users:
+            platform.CourseAccessRole.objects.get_or_create(
+                user=user, role=self.ROLE, org=self.org, course_id=self.course_id,
+            )
+
+    def remove_users(self, *users):
+        self._rows().filter(user__in=users).delete()
+
+
+class _CourseStaffRole(_AccessRole):
+    ROLE = "staff"
+
+
+class _CourseCreatorRole(_AccessRole):
+    ROLE = "course_creator_group"
+
+    def __init__(self):
+        super().__init__()
+
+
+class _OrgContentCreatorRole(_AccessRole):
+    ROLE = "org_course_creator_group"
+
+    def __init__(self, org):
+        super().__init__(org=org)
+
+
+@pytest.fixture()
+def cohort_settings():
+    """Course keys whose cohort settings were migrated; unknown courses raise like the platform."""
+    migrated = set()
+
+    def get_course_cohort_settings(course_key):
+        if not platform.CourseOverview.objects.filter(id=course_key).exists():
+            raise ValueError(f"Course not found: {course_key}")
+        migrated.add(course_key)
+
+    return SimpleNamespace(migrated=migrated, get=get_course_cohort_settings)
+
+
+def _get_cohort_by_id(course_key, cohort_id):
+    return platform.CourseUserGroup.objects.get(
+        course_id=course_key, id=cohort_id, group_type=platform.CourseUserGroup.COHORT,
+    )
+
+
+def _add_user_to_cohort(cohort, user):
+    """Like the platform's ``add_user_to_cohort``: a user is in at most one cohort per course."""
+    previous = user.course_groups.filter(course_id=cohort.course_id, group_type=cohort.group_type).first()
+    if previous == cohort:
+        raise ValueError(f"User {user.username} already present in cohort {cohort.name}")
+    if previous is not None:
+        previous.users.remove(user)
+    cohort.users.add(user)
+    return user, previous.name if previous else None, False
+
+
+def _remove_user_from_cohort(cohort, username):
+    user = get_user_model().objects.get(username=username)
+    if not cohort.users.filter(id=user.id).exists():
+        raise ValueError(f"User {username} was not present in cohort {cohort.name}")
+    cohort.users.remove(user)
+
+
+@pytest.fixture()
+def courses(monkeypatch, cohort_settings):
+    """Load the real course operations with the platform imports backed by ``test_utils`` models."""
+    return load_operations(monkeypatch, "courses", {
+        "common.djangoapps.course_modes.models": module(CourseMode=None),
+        "common.djangoapps.student.models": module(
+            CourseAccessRole=platform.CourseAccessRole,
+            CourseEnrollment=platform.CourseEnrollment,
+            CourseEnrollmentAttribute=None,
+        ),
+        "common.djangoapps.student.auth": module(
+            CourseCreatorRole=_CourseCreatorRole,
+            OrgContentCreatorRole=_OrgContentCreatorRole,
+        ),
+        "common.djangoapps.student.roles": module(CourseStaffRole=_CourseStaffRole),
+        "opaque_keys.edx.keys": module(CourseKey=SimpleNamespace(from_string=_CourseKey)),
+        "openedx.core.djangoapps.content.course_overviews.models": module(CourseOverview=platform.CourseOverview),
+        "openedx.core.djangoapps.course_groups.cohorts": module(
+            add_user_to_cohort=_add_user_to_cohort,
+            get_cohort_by_id=_get_cohort_by_id,
+            get_course_cohort_settings=cohort_settings.get,
+            remove_user_from_cohort=_remove_user_from_cohort,
+        ),
+        "openedx.core.djangoapps.course_groups.models": module(
+            CourseCohort=platform.CourseCohort,
+            CourseUserGroup=platform.CourseUserGroup,
+        ),
+        "openedx.core.djangoapps.discussions.models": module(
+            DiscussionsConfiguration=platform.DiscussionsConfiguration,
+            DiscussionTopicLink=platform.DiscussionTopicLink,
+        ),
+        "openedx.core.djangoapps.enrollments.data": module(get_course_enrollment_info=None),
+        "xmodule.modulestore": module(ModuleStoreEnum=None),
+        "xmodule.modulestore.exceptions": module(DuplicateCourseError=Exception),
+    })
+
+
+@pytest.fixture()
+def admin():
+    return get_user_model().objects.create(username="admin", email="admin@example.com", is_superuser=True)
+
+
+def _users(*usernames):
+    return [
+        get_user_model().objects.create(username=username, email=f"{username}@example.com")
+        for username in usernames
+    ]
+
+
+def _cohort(name, members=(), assignment_type="manual", course_id=COURSE):
+    cohort = platform.CourseUserGroup.objects.create(name=name, course_id=course_id)
+    cohort.users.add(*members)
+    if assignment_type:
+        platform.CourseCohort.objects.create(course_user_group=cohort, assignment_type=assignment_type)
+    return cohort
+
+
+def test_list_cohorts_counts_members_and_migrates_settings(courses, cohort_settings, admin):
+    platform.CourseOverview.objects.create(id=COURSE)
+    alice, bob, carol = _users("alice", "bob", "carol")
+    _cohort("Group A", [alice, bob], assignment_type="random")
+    _cohort("Group B", [carol], assignment_type=None)
+    _cohort("Empty")
+    _cohort("Other course", [alice], course_id="course-v1:ORG+OTHER+RUN")
+    platform.CourseUserGroup.objects.create(name="Partition group", course_id=COURSE, group_type="partition")
+
+    result = courses.list_cohorts_logic(COURSE, user_identifier=admin)
+
+    assert result["success"] is True
+    assert [
+        (cohort["name"], cohort["member_count"], cohort["assignment_type"]) for cohort in result["cohorts"]
+    ] == [
+        ("Group A", 2, "random"),
+        # Groups without a CourseCohort row are reported as manual cohorts.
+        ("Group B", 1, "manual"),
+        ("Empty", 0, "manual"),
+    ]
+    assert result["total_cohorts"] == 3
+    assert cohort_settings.migrated == {COURSE}
+
+
+def test_list_cohorts_reports_missing_course(courses, admin):
+    result = courses.list_cohorts_logic("course-v1:ORG+GONE+RUN", user_identifier=admin)
+
+    assert result["success"] is False
+    assert result["error"] == "course_not_found"
+
+
+def test_resolve_users_bulk_matches_ids_emails_and_usernames(courses, monkeypatch, django_assert_num_queries):
+    monkeypatch.setattr(courses, "EMAIL_LOOKUP_BATCH_SIZE", 1)
+    alice, bob, carol = _users("alice", "bob", "carol")
+    identifiers = [str(alice.id), "BOB@Example.com", "carol@example.com", "carol", "ghost", "nobody@example.com"]
+
+    # One query for the ids, one per email batch and one for the usernames.
+    with django_assert_num_queries(5):
+        resolved = courses._resolve_users_bulk(identifiers)  # pylint: disable=protected-access
+
+    assert {identifier: row["username"] for identifier, row in resolved.items()} == {
+        str(alice.id): "alice",
+        "BOB@Example.com": "bob",
+        "carol@example.com": "carol",
+        "carol": "carol",
+    }
+    assert resolved["BOB@Example.com"] == {"id": bob.id, "username": "bob", "email": "bob@example.com"}
+    assert resolved["carol"]["id"] == carol.id
+
+
+def test_apply_cohort_changes_commits_chunks_and_isolates_failures(courses, monkeypatch):
+    monkeypatch.setattr(courses, "COHORT_BULK_CHUNK_SIZE", 2)
+    cohort = _cohort("Group A")
+    users = _users("alice", "bob", "carol")
+    pending = [{"user_id": user.id} for user in users]
+    progress = []
+
+    def _add(user):
+        cohort.users.add(user)
+        if user.username == "bob":
+            raise ValueError("boom")
+        return {"status": "added"}
+
+    courses._apply_cohort_changes(  # pylint: disable=protected-access
+        pending, _add, lambda processed, total: progress.append((processed, total)),
+    )
+
+    assert [entry["status"] for entry in pending] == ["added", "failed", "added"]
+    assert pending[1]["error"] == "boom"
+    # The failing row is rolled back on its own; the rest of its chunk is kept.
+    assert set(cohort.users.values_list("username", flat=True)) == {"alice", "carol"}
+    assert progress == [(2, 3), (3, 3)]
+
+
+def test_bulk_add_users_to_cohort_reports_each_identifier(courses, admin):
+    alice, bob, carol, dave = _users("alice", "bob", "carol", "dave")
+    for user in (alice, carol, dave):
+        platform.CourseEnrollment.objects.create(user=user, course_id=COURSE)
+    target = _cohort("Group A", [carol])
+    _cohort("Group B", [dave])
+
+    result = courses.bulk_add_users_to_cohort_logic(
+        COURSE,
+        target.id,
+        ["alice", "ALICE@example.com", "bob", "carol", str(dave.id), "ghost", "alice"],
+        user_identifier=admin,
+    )
+
+    assert result["success"] is True
+    assert [(entry["identifier"], entry["status"]) for entry in result["results"]] == [
+        ("alice", "added"),
+        # The same user under a second identifier is reported, not added twice.
+        ("ALICE@example.com", "duplicate"),
+        ("bob", "not_enrolled"),
+        ("carol", "already_member"),
+        (str(dave.id), "moved"),
+        ("ghost", "not_found"),
+    ]
+    assert result["results"][4]["previous_cohort"] == "Group B"
+    assert (result["total"], result["added"], result["moved"], result["duplicate"]) == (6, 1, 1, 1)
+    assert set(target.users.values_list("username", flat=True)) == {"alice", "carol", "dave"}
+
+
+def test_bulk_move_cohort_members_moves_and_skips_non_members(courses, admin):
+    alice, bob, carol = _users("alice", "bob", "carol")
+    source = _cohort("Group A", [alice, bob])
+    target = _cohort("Group B", [carol])
+
+    result = courses.bulk_move_cohort_members_logic(
+        COURSE, source.id, ["alice", "bob@example.com", "carol", "ghost", str(alice.id)],
+        target_cohort_id=target.id, user_identifier=admin,
+    )
+
+    assert result["success"] is True
+    assert result["action"] == "bulk_move_cohort_members"
+    assert [(entry["identifier"], entry["status"]) for entry in result["results"]] == [
+        ("alice", "moved"),
+        ("bob@example.com", "moved"),
+        ("carol", "not_in_source"),
+        ("ghost", "not_found"),
+        (str(alice.id), "duplicate"),
+    ]
+    assert result["skipped"] == ["carol"]
+    assert (result["moved"], result["not_in_source"], result["duplicate"]) == (2, 1, 1)
+    assert not source.users.exists()
+    assert set(target.users.values_list("username", flat=True)) == {"alice", "bob", "carol"}
+
+
+def test_bulk_move_cohort_members_without_target_removes_them(courses, admin):
+    alice, bob = _users("alice", "bob")
+    source = _cohort("Group A", [alice, bob])
+
+    result = courses.bulk_move_cohort_members_logic(COURSE, source.id, ["alice"], user_identifier=admin)
+
+    assert result["action"] == "bulk_remove_cohort_members"
+    assert result["target_cohort"] is None
+    assert [entry["status"] for entry in result["results"]] == ["removed"]
+    assert list(source.users.values_list("username", flat=True)) == ["bob"]
+    assert not alice.course_groups.exists()
+
+
+def test_bulk_move_cohort_members_rejects_cohort_of_another_course(courses, admin):
+    alice, = _users("alice")
+    source = _cohort("Group A", [alice])
+    other = _cohort("Other course", course_id="course-v1:ORG+OTHER+RUN")
+
+    result = courses.bulk_move_cohort_members_logic(
+        COURSE, source.id, ["alice"], target_cohort_id=other.id, user_identifier=admin,
+    )
+
+    assert result["error"] == "cohort_not_found"
+    assert source.users.filter(id=alice.id).exists()
+
+
+def _grant(user, role, course_id="", org=""):
+    platform.CourseAccessRole.objects.create(user=user, role=role, course_id=course_id, org=org)
+
+
+@pytest.fixture()
+def staff_rows():
+    """Course staff and creators of ``COURSE``, with overlapping rows and roles that do not count."""
+    alice, bob, carol, dave, erin, frank = _users("alice", "bob", "carol", "dave", "erin", "frank")
+    _grant(alice, "staff", COURSE, "ORG")
+    _grant(alice, "course_creator_group")
+    _grant(bob, "org_course_creator_group", org="ORG")
+    _grant(carol, "course_creator_group")
+    _grant(carol, "org_course_creator_group", org="ORG")
+    # Staff of another course, a creator of another organization and an instructor.
+    _grant(dave, "staff", "course-v1:ORG+OTHER+RUN", "ORG")
+    _grant(erin, "org_course_creator_group", org="OTHER")
+    _grant(frank, "instructor", COURSE, "ORG")
+
+
+def _listed(result):
+    return [(user["username"], user["role"]) for user in result["users"]]
+
+
+def test_list_course_staff_lists_each_user_once_with_staff_first(courses, staff_rows, django_assert_num_queries):
+    # One query counts the users and one reads the page.
+    with django_assert_num_queries(2):
+        result = courses.list_course_staff_logic(COURSE)
+
+    assert result["success"] is True
+    assert result["total_users"] == 3
+    assert _listed(result) == [("alice", "staff"), ("bob", "course_creator"), ("carol", "course_creator")]
+
+
+def test_list_course_staff_pages_users(courses, staff_rows):
+    first = courses.list_course_staff_logic(COURSE, page=1, page_size=2)
+    second = courses.list_course_staff_logic(COURSE, page=2, page_size=2)
+    # Pages past the end return the last page.
+    beyond = courses.list_course_staff_logic(COURSE, page=9, page_size=2)
+
+    assert (first["num_pages"], first["total_users"]) == (2, 3)
+    assert _listed(first) == [("alice", "staff"), ("bob", "course_creator")]
+    assert _listed(second) == [("carol", "course_creator")]
+    assert (beyond["page"], _listed(beyond)) == (2, [("carol", "course_creator")])
+
+
+def test_list_course_staff_filters_by_role_type(courses, staff_rows):
+    staff = courses.list_course_staff_logic(COURSE, role_type="staff")
+    creators = courses.list_course_staff_logic(COURSE, role_type="course_creator")
+
+    assert _listed(staff) == [("alice", "staff")]
+    # Without the staff rows, a staff member who is also a creator is listed as creator.
+    assert _listed(creators) == [("alice", "course_creator"), ("bob", "course_creator"), ("carol", "course_creator")]
+    assert courses.list_course_staff_logic(COURSE, role_type="instructor")["error"] == "invalid_role_type"
+
+
+def _roles(user):
+    return set(platform.CourseAccessRole.objects.filter(user=user).values_list("role", "org", "course_id"))
+
+
+def test_bulk_manage_course_staff_reports_current_roles_duplicates_and_conflicts(courses, admin):
+    second_course = "course-v1:ORG+TWO+RUN"
+    platform.CourseOverview.objects.bulk_create([
+        platform.CourseOverview(id=COURSE, org="ORG"),
+        platform.CourseOverview(id=second_course, org="ORG"),
+    ])
+    alice, bob, carol, dave, erin, frank, gina = _users("alice", "bob", "carol", "dave", "erin", "frank", "gina")
+    _grant(bob, "staff", COURSE, "ORG")
+    _grant(erin, "course_creator_group")
+    _grant(frank, "course_creator_group")
+    _grant(frank, "org_course_creator_group", org="ORG")
+
+    def _change(user, action, role_type="staff", course_id=COURSE):
+        return {"course_id": course_id, "user_identifier": user, "action": action, "role_type": role_type}
+
+    result = courses.bulk_manage_course_staff_logic([
+        _change("alice", "add"),
+        _change("bob", "add"),
+        _change("carol", "remove"),
+        _change("dave", "add", "course_creator"),
+        # Creator roles are shared by the organization's courses.
+        _change("dave", "add", "course_creator", course_id=second_course),
+        _change("erin", "remove", "course_creator"),
+        _change("frank", "add", "course_creator", course_id=second_course),
+        _change("gina", "add"),
+        _change("gina", "remove"),
+        _change("ghost", "add"),
+        _change("alice", "add", course_id="course-v1:ORG+GONE+RUN"),
+    ], acting_user_identifier=admin)
+
+    assert result["success"] is True
+    assert [entry["status"] for entry in result["results"]] == [
+        "added",
+        "already_has_role",
+        "does_not_have_role",
+        "added",
+        "duplicate",
+        "removed",
+        "already_has_role",
+        "conflict",
+        "conflict",
+        "user_not_found",
+        "course_not_found",
+    ]
+    assert (result["added"], result["duplicate"], result["conflict"]) == (2, 1, 2)
+    assert _roles(alice) == {("staff", "ORG", COURSE)}
+    assert _roles(dave) == {("course_creator_group", "", ""), ("org_course_creator_group", "ORG", "")}
+    assert _roles(erin) == set()
+    assert _roles(gina) == set()
+
+
+def test_bulk_manage_course_staff_keeps_a_failed_course_out_of_the_others(courses, admin, monkeypatch):
+    second_course = "course-v1:ORG+TWO+RUN"
+    platform.CourseOverview.objects.bulk_create([
+        platform.CourseOverview(id=COURSE, org="ORG"),
+        platform.CourseOverview(id=second_course, org="ORG"),
+    ])
+    alice, bob = _users("alice", "bob")
+
+    def add_users(self, *users):
+        if self.course_id == second_course:
+            raise ValueError("boom")
+        _AccessRole.add_users(self, *users)
+
+    monkeypatch.setattr(_CourseStaffRole, "add_users", add_users)
+
+    result = courses.bulk_manage_course_staff_logic([
+        {"course_id": COURSE, "user_identifier": "alice", "action": "add", "role_type": "staff"},
+        {"course_id": second_course, "user_identifier": "bob", "action": "add", "role_type": "staff"},
+    ], acting_user_identifier=admin)
+
+    assert [(entry["status"], entry.get("error")) for entry in result["results"]] == [
+        ("added", None), ("failed", "boom"),
+    ]
+    assert _roles(alice) == {("staff", "ORG", COURSE)}
+    assert _roles(bob) == set()
+
+
+def test_list_user_course_roles_reports_every_scope(courses, django_assert_num_queries):
+    platform.CourseOverview.objects.create(id=COURSE, display_name="Course")
+    alice, bob = _users("alice", "bob")
+    _grant(alice, "staff", COURSE, "ORG")
+    # The course of this role has no overview row.
+    _grant(alice, "instructor", "course-v1:ORG+GONE+RUN", "ORG")
+    _grant(alice, "org_course_creator_group", org="ORG")
+    _grant(bob, "course_creator_group")
+
+    # One query per identifier kind (id, email, username), then the roles are counted and paged.
+    with django_assert_num_queries(5):
+        result = courses.list_user_course_roles_logic([str(bob.id), "alice@example.com", "ghost"])
+
+    assert result["success"] is True
+    assert [user["username"] for user in result["users"]] == ["bob", "alice"]
+    assert result["not_found"] == ["ghost"]
+    assert [(role["username"], role["scope"], role["role"], role["course_name"]) for role in result["roles"]] == [
+        ("alice", "org", "org_course_creator_group", None),
+        ("alice", "course", "instructor", None),
+        ("alice", "course", "staff", "Course"),
+        ("bob", "global", "course_creator_group", None),
+    ]
+    assert result["roles"][1]["course_id"] == "course-v1:ORG+GONE+RUN"
+    assert (result["roles"][3]["org"], result["roles"][3]["course_id"]) == (None, None)
@@ -90,7 +90,10 @@ mod.OrgContentCreatorRole = OrgContentCreatorRole
 mod.user_has_role = user_has_role
 
 
+_ensure_module("common.djangoapps.student.models")
+
 # Import real permissions module after stubbing dependencies
+from openedx_owly_apis import permissions as permissions_module  # noqa: E402  pylint: disable=wrong-import-position
 from openedx_owly_apis.permissions import IsAdminOrCourseCreator  # noqa: E402  pylint: disable=wrong-import-position
 
 
@@ -143,3 +146,125 @@ def test_is_admin_or_course_creator_denies_when_no_roles():
     perm = IsAdminOrCourseCreator()
     req = _Req(user=user)
     assert perm.has_permission(req, None) is False
+
+
+class _AccessRoles:
+    """Stands in for ``CourseAccessRole.objects``; counts queries."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    def filter(self, *_args, **_kwargs):
+        self.queries += 1
+        return self
+
+    def values_list(self, *_fields):
+        return self.rows
+
+
+@pytest.fixture()
+def access_roles(monkeypatch):
+    for name, role in (
+        ("CourseInstructorRole", "instructor"),
+        ("CourseStaffRole", "staff"),
+        ("CourseLimitedStaffRole", "limited_staff"),
+        ("CourseCreatorRole", "course_creator_group"),
+        ("OrgContentCreatorRole", "org_course_creator_group"),
+    ):
+        monkeypatch.setattr(permissions_module, name, SimpleNamespace(ROLE=role))
+    roles = _AccessRoles([
+        ("limited_staff", "ORG", "course-v1:ORG+A+RUN"),
+        ("org_course_creator_group", "ORG", None),
+        ("course_creator_group", "", None),
+    ])
+    monkeypatch.setattr(
+        sys.modules["common.djangoapps.student.models"],
+        "CourseAccessRole",
+        SimpleNamespace(objects=roles),
+        raising=False,
+    )
+    return roles
+
+
+_CHECKS = [
+    (permissions_module.COURSE_TEAM, "course-v1:ORG+A+RUN"),
+    (permissions_module.COURSE_TEAM, "course-v1:ORG+B+RUN"),
+    (permissions_module.COURSE_CREATOR, ""),
+    (permissions_module.ORG_COURSE_CREATOR, "ORG"),
+    (permissions_module.ORG_COURSE_CREATOR, "OTHER"),
+]
+
+
+def test_get_course_roles_resolves_all_checks_with_one_cached_query(access_roles, settings):
+    settings.FEATURES = {"ENABLE_CREATOR_GROUP": True}
+    user = SimpleNamespace(id=5, is_authenticated=True, is_active=True, is_staff=False)
+
+    roles = permissions_module.get_course_roles(user, _CHECKS)
+    again = permissions_module.get_course_roles(user, _CHECKS[:2])
+
+    assert [roles[check] for check in _CHECKS] == [True, False, True, True, False]
+    assert again == {check: roles[check] for check in _CHECKS[:2]}
+    assert access_roles.queries == 1
+
+
+@pytest.mark.parametrize(
+    "features,is_staff,expected",
+    [
+        ({"ENABLE_CREATOR_GROUP": False}, False, True),
+        ({"DISABLE_COURSE_CREATION": True}, False, False),
+        ({"DISABLE_COURSE_CREATION": True}, True, True),
+    ],
+)
+def test_get_course_roles_global_creator_follows_feature_flags(access_roles, settings, features, is_staff, expected):
+    settings.FEATURES = features
+    user = SimpleNamespace(id=6, is_authenticated=True, is_active=True, is_staff=is_staff)
+
+    roles = permissions_module.get_course_roles(user, [(permissions_module.COURSE_CREATOR, "")])
+
+    assert roles[(permissions_module.COURSE_CREATOR, "")] is expected
+    assert access_roles.queries == 0
+
+
+def test_get_course_roles_denies_inactive_users_without_querying(access_roles):
+    user = SimpleNamespace(id=7, is_authenticated=True, is_active=False, is_staff=False)
+
+    roles = permissions_module.get_course_roles(user, _CHECKS)
+
+    assert not any(roles.values())
+    assert access_roles.queries == 0
+
+
+def test_course_staff_checks_share_cached_answers(access_roles, monkeypatch):
+    class _StaffRole:
+        ROLE = "staff"
+
+        def __init__(self, course_key):
+            self.course_key = course_key
+
+        def has_user(self, user):
+            return True
+
+    monkeypatch.setattr(permissions_module, "CourseStaffRole", _StaffRole)
+    user = SimpleNamespace(id=8, is_authenticated=True, is_active=True, is_staff=False)
+    course_key = _CourseKey("course-v1:ORG+A+RUN")
+
+    assert permissions_module.is_course_staff_user(user, course_key) is True
+    roles = permissions_module.get_course_roles(user, [(permissions_module.COURSE_STAFF, course_key)])
+
+    # The batched check reuses the single check's answer instead of querying.
+    assert roles == {(permissions_module.COURSE_STAFF, "course-v1:ORG+A+RUN"): True}
+    assert access_roles.queries == 0
+
+
+def test_get_course_roles_course_staff_excludes_other_team_roles(access_roles):
+    user = SimpleNamespace(id=9, is_authenticated=True, is_active=True, is_staff=False)
+    checks = [
+        (permissions_module.COURSE_TEAM, "course-v1:ORG+A+RUN"),
+        (permissions_module.COURSE_STAFF, "course-v1:ORG+A+RUN"),
+    ]
+
+    roles = permissions_module.get_course_roles(user, checks)
+
+    # Only a limited staff row exists for the course.
+    assert [roles[check] for check in checks] == [True, False]
@@ -0,0 +1,69 @@
+"""
+Tests for the incrementally maintained platform counters.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from openedx_owly_apis import platform_counters, signals
+from openedx_owly_apis.models import OwlyPlatformCounter
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture()
+def source_counts(monkeypatch):
+    counts = {
+        platform_counters.TOTAL_COURSES: 3,
+        platform_counters.TOTAL_ACTIVE_ENROLLMENTS: 40,
+    }
+    monkeypatch.setattr(platform_counters, "compute_platform_counts", lambda: dict(counts))
+    return counts
+
+
+def test_first_read_seeds_counters_then_reads_rows(source_counts, django_assert_num_queries):
+    first = platform_counters.get_platform_counters()
+    source_counts[platform_counters.TOTAL_ACTIVE_ENROLLMENTS] = 1000
+
+    with django_assert_num_queries(1):
+        second = platform_counters.get_platform_counters()
+
+    assert first["counters"] == {"total_courses": 3, "total_active_enrollments": 40}
+    assert second["counters"] == first["counters"]
+    assert second["reconciled_at"]
+
+
+def test_signals_adjust_counters_incrementally(source_counts):  # pylint: disable=unused-argument
+    platform_counters.get_platform_counters()
+
+    signals.handle_enroll_status_change(sender=None, event="enroll", course_id="course-v1:ORG+NUM+RUN")
+    signals.handle_enroll_status_change(sender=None, event="enroll", course_id="course-v1:ORG+NUM+RUN")
+    signals.handle_enroll_status_change(sender=None, event="unenroll", course_id="course-v1:ORG+NUM+RUN")
+    signals.handle_enroll_status_change(sender=None, event="upgrade_complete", course_id="course-v1:ORG+NUM+RUN")
+    signals.handle_course_enrollment_deleted(sender=None, instance=SimpleNamespace(is_active=True, course_id=None))
+    signals.handle_course_enrollment_deleted(sender=None, instance=SimpleNamespace(is_active=False, course_id=None))
+    signals.handle_course_overview_saved(sender=None, instance=SimpleNamespace(), created=True)
+    signals.handle_course_overview_saved(sender=None, instance=SimpleNamespace(), created=False)
+    signals.handle_course_overview_deleted(sender=None, instance=SimpleNamespace())
+    signals.handle_course_overview_saved(sender=None, instance=SimpleNamespace(), created=True)
+
+    counters = platform_counters.get_platform_counters()["counters"]
+
+    assert counters == {"total_courses": 4, "total_active_enrollments": 40}
+
+
+def test_adjust_counter_ignores_unseeded_counters():
+    platform_counters.adjust_counter(platform_counters.TOTAL_COURSES, 1)
+
+    assert not OwlyPlatformCounter.objects.exists()
+
+
+def test_reconcile_corrects_drift(source_counts):
+    platform_counters.get_platform_counters()
+    platform_counters.adjust_counter(platform_counters.TOTAL_ACTIVE_ENROLLMENTS, 5)
+
+    drift = platform_counters.reconcile_platform_counters()
+
+    assert drift == {"total_courses": 0, "total_active_enrollments": -5}
+    assert platform_counters.get_platform_counters()["counters"]["total_active_enrollments"] == 40
@@ -0,0 +1,24 @@
+"""
+Tests for the plugin settings injected into the LMS and Studio.
+"""
+
+from types import SimpleNamespace
+
+from openedx_owly_apis.settings import common, lms
+
+
+def test_beat_schedule_is_only_registered_for_the_lms():
+    cms_settings = SimpleNamespace()
+    lms_settings = SimpleNamespace(CELERY_BEAT_SCHEDULE={"platform.task": {"task": "platform.task"}})
+
+    common.plugin_settings(cms_settings)
+    lms.plugin_settings(lms_settings)
+
+    assert not hasattr(cms_settings, "CELERY_BEAT_SCHEDULE")
+    assert set(lms_settings.CELERY_BEAT_SCHEDULE) == {
+        "platform.task",
+        "openedx_owly_apis.reconcile_platform_counters",
+        "openedx_owly_apis.schedule_analytics_snapshots",
+    }
+    # Both services still get the shared settings.
+    assert lms_settings.OWLY_TASK_ROUTING == cms_settings.OWLY_TASK_ROUTING
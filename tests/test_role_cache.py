@@ -0,0 +1,90 @@
+"""
+Tests for the course role check cache and its invalidation signals.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from edx_django_utils.cache import RequestCache
+
+from openedx_owly_apis import role_cache, signals
+
+USER = SimpleNamespace(id=7)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    cache.clear()
+    RequestCache.clear_all_namespaces()
+    yield
+    cache.clear()
+    RequestCache.clear_all_namespaces()
+
+
+def _counting_check(result=True):
+    calls = []
+
+    def check():
+        calls.append(1)
+        return result
+
+    return check, calls
+
+
+def _end_request():
+    RequestCache.clear_all_namespaces()
+
+
+def test_check_is_memoized_within_and_across_requests():
+    check, calls = _counting_check()
+
+    assert role_cache.cached_role_check(USER, "course_staff", "course-v1:ORG+NUM+RUN", check) is True
+    assert role_cache.cached_role_check(USER, "course_staff", "course-v1:ORG+NUM+RUN", check) is True
+    _end_request()
+    assert role_cache.cached_role_check(USER, "course_staff", "course-v1:ORG+NUM+RUN", check) is True
+
+    assert len(calls) == 1
+
+
+def test_negative_results_are_cached_and_scopes_are_separate():
+    check, calls = _counting_check(result=False)
+
+    assert role_cache.cached_role_check(USER, "org_course_creator", "ORG", check) is False
+    _end_request()
+    assert role_cache.cached_role_check(USER, "org_course_creator", "ORG", check) is False
+    assert role_cache.cached_role_check(USER, "org_course_creator", "OTHER ORG", check) is False
+
+    assert len(calls) == 2
+
+
+def test_users_without_id_are_not_cached():
+    check, calls = _counting_check()
+    anonymous = SimpleNamespace()
+
+    role_cache.cached_role_check(anonymous, "course_creator", "", check)
+    role_cache.cached_role_check(anonymous, "course_creator", "", check)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("changed_user_id, expected_calls", [(USER.id, 2), (USER.id + 1, 1)])
+def test_access_role_signal_invalidates_only_that_user(changed_user_id, expected_calls):
+    check, calls = _counting_check()
+
+    role_cache.cached_role_check(USER, "course_staff", "course-v1:ORG+NUM+RUN", check)
+    _end_request()
+    signals.handle_course_access_role_changed(sender=None, instance=SimpleNamespace(user_id=changed_user_id))
+    role_cache.cached_role_check(USER, "course_staff", "course-v1:ORG+NUM+RUN", check)
+
+    assert len(calls) == expected_calls
+
+
+def test_invalidation_clears_the_request_memo():
+    check, calls = _counting_check()
+
+    role_cache.cached_role_check(USER, "course_creator", "", check)
+    role_cache.invalidate_user_roles(USER.id)
+    role_cache.cached_role_check(USER, "course_creator", "", check)
+
+    assert len(calls) == 2
@@ -0,0 +1,162 @@
+"""
+Tests for async task queue routing.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from openedx_owly_apis import task_routing
+from test_utils.platform_modules import module, stub_modules
+
+
+def test_estimate_structure_blocks_counts_explicit_and_generated_blocks():
+    units_config = {
+        "units": [
+            {
+                "name": "Week 1",
+                "subsections_list": [
+                    {"name": "Intro", "verticals_list": [{"name": "A"}, {"name": "B"}]},
+                    {"name": "Quiz"},
+                ],
+            },
+            {"name": "Week 2", "subsections": 2, "verticals_per_subsection": 3},
+            {"name": "Week 3"},
+        ]
+    }
+
+    # Week 1: 1 + (1 + 2) + 1, Week 2: 1 + 2 * (1 + 3), Week 3: 1 + 1 * (1 + 2)
+    assert task_routing.estimate_structure_blocks(units_config) == 5 + 9 + 4
+
+
+def test_route_for_blocks_uses_threshold_and_configured_queues(settings):
+    settings.OWLY_TASK_ROUTING = {
+        "INTERACTIVE_QUEUE": "owly.high",
+        "BULK_QUEUE": "owly.low",
+        "BULK_BLOCK_THRESHOLD": 100,
+    }
+
+    assert task_routing.route_for_blocks(99) == {"lane": "interactive", "queue": "owly.high", "estimated_blocks": 99}
+    assert task_routing.route_for_blocks(100)["lane"] == "bulk"
+    assert task_routing.route_for_blocks(None) == {"lane": "bulk", "queue": "owly.low", "estimated_blocks": None}
+    assert task_routing.apply_async_options(task_routing.route_for_blocks(5)) == {"queue": "owly.high"}
+
+
+def test_route_cohort_assignment_job_uses_user_threshold(settings):
+    settings.OWLY_TASK_ROUTING = {"BULK_BLOCK_THRESHOLD": 10, "BULK_USER_THRESHOLD": 300}
+
+    assert task_routing.route_cohort_assignment_job(250)["lane"] == "interactive"
+    assert task_routing.route_cohort_assignment_job(300)["lane"] == "bulk"
+
+
+def test_apply_async_options_keeps_default_queue_when_unset(settings):
+    settings.OWLY_TASK_ROUTING = {}
+
+    assert task_routing.apply_async_options(task_routing.route_for_blocks(5)) == {}
+
+
+def test_route_publish_content_job_counts_course_for_course_publish(monkeypatch):
+    counted = []
+    monkeypatch.setattr(task_routing, "estimate_publish_blocks", lambda content_id: counted.append(content_id) or 10)
+
+    route = task_routing.route_publish_content_job(
+        "block-v1:ORG+NUM+RUN+type@vertical+block@unit",
+        publish_type="course",
+        course_id="course-v1:ORG+NUM+RUN",
+    )
+
+    assert counted == ["course-v1:ORG+NUM+RUN"]
+    assert route["lane"] == "interactive"
+
+
+class _Structure:
+    """Cached block structure holding a course with one section of two units."""
+
+    children = {
+        "course-v1:ORG+NUM+RUN": ["block-v1:ORG+NUM+RUN+type@chapter+block@week1"],
+        "block-v1:ORG+NUM+RUN+type@chapter+block@week1": [
+            "block-v1:ORG+NUM+RUN+type@vertical+block@unit1",
+            "block-v1:ORG+NUM+RUN+type@vertical+block@unit2",
+        ],
+    }
+
+    def __iter__(self):
+        return iter(["course-v1:ORG+NUM+RUN", *(child for kids in self.children.values() for child in kids)])
+
+    def __contains__(self, usage_key):
+        return str(usage_key) in set(self)
+
+    def get_children(self, usage_key):
+        return self.children.get(str(usage_key), [])
+
+
+@pytest.fixture()
+def block_structure(monkeypatch):
+    cached = {"structure": _Structure()}
+
+    def get_block_structure_manager(course_key):
+        return SimpleNamespace(
+            root_block_usage_key=course_key,
+            store=SimpleNamespace(get=lambda root_key: cached["structure"]),
+        )
+
+    stub_modules(monkeypatch, {
+        "openedx.core.djangoapps.content.block_structure.api": module(
+            get_block_structure_manager=get_block_structure_manager,
+        ),
+    })
+    return cached
+
+
+@pytest.mark.parametrize("content_id, expected", [
+    ("course-v1:ORG+NUM+RUN", 4),
+    ("block-v1:ORG+NUM+RUN+type@chapter+block@week1", 3),
+    ("block-v1:ORG+NUM+RUN+type@vertical+block@unit1", 1),
+    # Not published yet, so not in the cached structure.
+    ("block-v1:ORG+NUM+RUN+type@vertical+block@new", task_routing.PUBLISH_BLOCK_ESTIMATES["vertical"]),
+])
+def test_estimate_publish_blocks_counts_the_cached_block_structure(block_structure, content_id, expected):
+    assert task_routing.estimate_publish_blocks(content_id) == expected
+
+
+@pytest.mark.parametrize("content_id, expected", [
+    ("course-v1:ORG+NUM+RUN", None),
+    ("block-v1:ORG+NUM+RUN+type@chapter+block@week1", None),
+    ("block-v1:ORG+NUM+RUN+type@sequential+block@intro", task_routing.PUBLISH_BLOCK_ESTIMATES["sequential"]),
+    ("block-v1:ORG+NUM+RUN+type@problem+block@p1", 1),
+])
+def test_estimate_publish_blocks_falls_back_to_the_block_type(block_structure, content_id, expected):
+    block_structure["structure"] = None
+
+    assert task_routing.estimate_publish_blocks(content_id) == expected
+
+
+def test_lane_wait_expires_after_max_wait(settings):
+    settings.OWLY_TASK_ROUTING = {"CONCURRENCY_RETRY_SECONDS": 30, "CONCURRENCY_MAX_WAIT_SECONDS": 90}
+
+    assert task_routing.lane_wait_expired(0) is False
+    assert task_routing.lane_wait_expired(2) is False
+    assert task_routing.lane_wait_expired(3) is True
+
+
+def test_lane_slots_are_capped_and_released(settings):
+    settings.OWLY_TASK_ROUTING = {"CONCURRENCY": {"bulk": 2, "interactive": 0}}
+
+    assert task_routing.acquire_lane_slot("bulk") is True
+    assert task_routing.acquire_lane_slot("bulk") is True
+    assert task_routing.acquire_lane_slot("bulk") is False
+    task_routing.release_lane_slot("bulk")
+    assert task_routing.acquire_lane_slot("bulk") is True
+    # A lane without a cap always has room.
+    assert all(task_routing.acquire_lane_slot("interactive") for _ in range(5))
+
+
+def test_released_slots_never_go_below_zero(settings):
+    settings.OWLY_TASK_ROUTING = {"CONCURRENCY": {"bulk": 1}}
+
+    task_routing.acquire_lane_slot("bulk")
+    task_routing.release_lane_slot("bulk")
+    task_routing.release_lane_slot("bulk")
+
+    assert task_routing.acquire_lane_slot("bulk") is True
+    assert task_routing.acquire_lane_slot("bulk") is False
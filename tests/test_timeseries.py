@@ -0,0 +1,37 @@
+"""
+Tests for the analytics time series helpers.
+"""
+
+from datetime import date, datetime
+
+from django.utils import timezone
+
+from openedx_owly_apis.utils import timeseries
+
+
+def test_resolve_range_defaults_and_aligns_weeks(monkeypatch):
+    monkeypatch.setattr(timeseries.timezone, "localdate", lambda: date(2026, 3, 31))
+
+    assert timeseries.resolve_range() == (date(2026, 3, 2), date(2026, 3, 31))
+    # 2026-01-07 is a Wednesday; weekly buckets start on Monday.
+    assert timeseries.resolve_range(date(2026, 1, 7), date(2026, 2, 1), "week") == (date(2026, 1, 5), date(2026, 2, 1))
+
+
+def test_bucket_dates_and_count_match():
+    buckets = timeseries.bucket_dates(date(2026, 1, 7), date(2026, 2, 1), "week")
+
+    assert buckets == [date(2026, 1, 5), date(2026, 1, 12), date(2026, 1, 19), date(2026, 1, 26)]
+    assert timeseries.bucket_count(date(2026, 1, 7), date(2026, 2, 1), "week") == len(buckets)
+    assert timeseries.bucket_count(date(2026, 1, 1), date(2026, 1, 31)) == 31
+
+
+def test_series_by_key_zero_fills_each_mode():
+    buckets = timeseries.bucket_dates(date(2026, 1, 1), date(2026, 1, 3))
+    rows = [
+        {"bucket": timezone.make_aware(datetime(2026, 1, 1)), "mode": "audit", "count": 4},
+        {"bucket": timezone.make_aware(datetime(2026, 1, 3)), "mode": "audit", "count": 1},
+        {"bucket": timezone.make_aware(datetime(2026, 1, 2)), "mode": "verified", "count": 2},
+        {"bucket": timezone.make_aware(datetime(2025, 12, 31)), "mode": "verified", "count": 9},
+    ]
+
+    assert timeseries.series_by_key(buckets, rows) == {"audit": [4, 0, 1], "verified": [0, 2, 0]}
@@ -86,3 +86,25 @@ def test_create_problem_component_serializer_rejects_unknown_problem_shape():
     assert not serializer.is_valid()
     assert "problem_data" in serializer.errors
     assert "question" in serializer.errors["problem_data"]
+
+
+def test_parse_user_identifiers_csv_uses_header_column_or_first_column():
+    roster = "name,username\nAna,ana\n,\nBob, bob \n"
+    assert v1_serializers.parse_user_identifiers_csv(roster) == ["ana", "bob"]
+    assert v1_serializers.parse_user_identifiers_csv("ana@example.com\n42\n") == ["ana@example.com", "42"]
+    assert v1_serializers.parse_user_identifiers_csv("\n \n") == []
+
+
+def test_bulk_cohort_move_serializer_caps_the_roster():
+    def _validate(count):
+        return v1_serializers.BulkCohortMoveRequestSerializer(data={
+            "course_id": "course-v1:ORG+NUM+RUN",
+            "source_cohort_id": 1,
+            "target_cohort_id": 2,
+            "user_identifiers": [f"user{index}" for index in range(count)],
+        })
+
+    assert _validate(v1_serializers.BULK_COHORT_MOVE_MAX_USERS).is_valid()
+    serializer = _validate(v1_serializers.BULK_COHORT_MOVE_MAX_USERS + 1)
+    assert not serializer.is_valid()
+    assert "At most 2000 users" in str(serializer.errors["user_identifiers"])
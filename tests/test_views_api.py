@@ -49,6 +49,7 @@ class TestOpenedXCourseViewSet:
         assert body["called"] == "create_course_logic"
         # kwargs echo back from stubbed logic
         assert body["kwargs"]["org"] == "ORG"
+        assert body["kwargs"]["user_identifier"] is user
 
     def test_rerun_course_calls_logic_and_returns_payload(self, api_factory):
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
@@ -102,6 +103,7 @@ class TestOpenedXCourseViewSet:
         assert resp.status_code == 200
         assert resp.data["called"] == "create_course_structure_logic"
 
+    @pytest.mark.django_db
     def test_create_structure_async_enqueues_job(self, api_factory):
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
         view = OpenedXCourseViewSet.as_view({"post": "create_structure_async"})
@@ -123,6 +125,31 @@ class TestOpenedXCourseViewSet:
         assert resp.data["course_id"] == "course-v1:ORG+NUM+RUN"
         assert resp.data["edit_mode"] is True
         assert resp.data["job_id"]
+        assert resp.data["queue"] == "interactive"
+
+    @pytest.mark.django_db
+    def test_create_structure_async_routes_large_jobs_to_bulk_queue(self, api_factory, settings):
+        from openedx_owly_apis.course_structure_jobs import get_course_structure_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        settings.OWLY_TASK_ROUTING = {"BULK_BLOCK_THRESHOLD": 10}
+        view = OpenedXCourseViewSet.as_view({"post": "create_structure_async"})
+        req = api_factory.post(
+            "/owly-courses/structure/async/",
+            {
+                "course_id": "course-v1:ORG+NUM+RUN",
+                "units_config": {"units": [{"name": "Week 1", "subsections": 3, "verticals_per_subsection": 3}]},
+            },
+            format="json",
+        )
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+
+        assert resp.status_code == 202
+        assert resp.data["queue"] == "bulk"
+        job = get_course_structure_job(resp.data["job_id"])
+        assert job["queue"] == "bulk"
+        assert job["estimated_blocks"] == 13
 
     def test_create_structure_async_rejects_invalid_payload(self, api_factory):
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
@@ -143,6 +170,7 @@ class TestOpenedXCourseViewSet:
         assert resp.data["error_code"] == "validation_error"
         assert "units_config" in resp.data["error_detail"]["details"]
 
+    @pytest.mark.django_db
     def test_get_structure_job_returns_cached_job(self, api_factory):
         from openedx_owly_apis.course_structure_jobs import create_course_structure_job, update_course_structure_job
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
@@ -168,6 +196,7 @@ class TestOpenedXCourseViewSet:
         assert resp.data["status"] == "success"
         assert resp.data["success"] is True
 
+    @pytest.mark.django_db
     def test_get_structure_job_returns_404_for_missing_job(self, api_factory):
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
 
@@ -408,6 +437,71 @@ class TestOpenedXCourseViewSet:
         assert resp.data["called"] == "manage_course_staff_logic"
         assert resp.data["kwargs"]["user_identifier"] == "123"
 
+    def test_bulk_manage_course_staff_calls_logic(self, api_factory):
+        """Test applying staff role changes across courses in one request"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"post": "bulk_manage_course_staff"})
+        changes = [
+            {"course_id": "course-v1:TestX+CS101+2024", "user_identifier": "ana", "action": "add"},
+            {
+                "course_id": "course-v1:TestX+CS102+2024",
+                "user_identifier": "bob@example.com",
+                "action": "remove",
+                "role_type": "course_creator",
+            },
+        ]
+        req = api_factory.post("/owly-courses/staff/bulk_manage/", {"changes": changes}, format="json")
+        force_authenticate(req, user=_auth_user(is_superuser=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "bulk_manage_course_staff_logic"
+        sent = resp.data["kwargs"]["changes"]
+        assert [change["role_type"] for change in sent] == ["staff", "course_creator"]
+        assert sent[1]["action"] == "remove"
+
+    def test_bulk_manage_course_staff_validation_and_permissions(self, api_factory):
+        """Test that bulk staff changes are validated"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"post": "bulk_manage_course_staff"})
+        change = {"course_id": "course-v1:TestX+CS101+2024", "user_identifier": "ana", "action": "add"}
+        for payload in (
+            {"changes": []},
+            {"changes": [{**change, "action": "promote"}]},
+            {"changes": [change] * 1001},
+        ):
+            req = api_factory.post("/owly-courses/staff/bulk_manage/", payload, format="json")
+            force_authenticate(req, user=_auth_user(is_superuser=True))
+            assert view(req).status_code == 400
+
+    def test_list_user_course_roles_calls_logic(self, api_factory):
+        """Test looking up the roles of several users across courses"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"get": "list_user_course_roles"})
+        req = api_factory.get(
+            "/owly-courses/staff/user_roles/?user_identifiers=ana,bob@example.com&user_identifiers=42&page=2"
+        )
+        force_authenticate(req, user=_auth_user(is_superuser=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "list_user_course_roles_logic"
+        assert resp.data["kwargs"]["user_identifiers"] == ["ana", "bob@example.com", "42"]
+        assert resp.data["kwargs"]["page"] == 2
+        assert resp.data["kwargs"]["page_size"] == 100
+
+        req = api_factory.get("/owly-courses/staff/user_roles/")
+        force_authenticate(req, user=_auth_user(is_superuser=True))
+        assert view(req).status_code == 400
+
+        # At most 100 users, however they are split across parameters.
+        for count, status_code in ((100, 200), (101, 400)):
+            users = [f"user{index}" for index in range(count)]
+            req = api_factory.get(
+                "/owly-courses/staff/user_roles/",
+                {"user_identifiers": [",".join(users[:50]), ",".join(users[50:])]},
+            )
+            force_authenticate(req, user=_auth_user(is_superuser=True))
+            assert view(req).status_code == status_code
+
     def test_list_course_staff_all_roles_calls_logic(self, api_factory):
         """Test listing all users with course staff roles"""
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
@@ -423,6 +517,29 @@ class TestOpenedXCourseViewSet:
         assert resp.data["called"] == "list_course_staff_logic"
         assert resp.data["kwargs"]["course_id"] == "course-v1:TestX+CS101+2024"
         assert resp.data["kwargs"]["role_type"] is None  # No filter
+        assert resp.data["kwargs"]["page"] == 1
+        assert resp.data["kwargs"]["page_size"] == 100
+
+    def test_list_course_staff_passes_pagination(self, api_factory):
+        """Test that page parameters reach the logic and oversized pages are rejected"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"get": "list_course_staff"})
+        req = api_factory.get(
+            "/owly-courses/staff/list/",
+            {"course_id": "course-v1:TestX+CS101+2024", "role_type": "course_creator", "page": 3, "page_size": 25}
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["kwargs"]["page"] == 3
+        assert resp.data["kwargs"]["page_size"] == 25
+
+        req = api_factory.get(
+            "/owly-courses/staff/list/",
+            {"course_id": "course-v1:TestX+CS101+2024", "page_size": 501}
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        assert view(req).status_code == 400
 
     def test_list_course_staff_filter_by_staff_calls_logic(self, api_factory):
         """Test listing only course staff users"""
@@ -476,7 +593,8 @@ class TestOpenedXCourseViewSet:
         assert resp.status_code == 200
         assert resp.data["called"] == "list_course_staff_logic"
         assert resp.data["kwargs"]["course_id"] == "course-v1:Aulasneo+PYTHON101+2024"
-        assert resp.data["kwargs"]["acting_user_identifier"] == "tester"
+        # The view hands the authenticated user down instead of an identifier
+        assert resp.data["kwargs"]["acting_user_identifier"] is user
 
     def test_add_ora_content_calls_logic(self, api_factory):
         """Test ORA (Open Response Assessment) content creation endpoint"""
@@ -939,6 +1057,176 @@ class TestOpenedXCourseViewSet:
         assert resp.data["kwargs"]["course_id"] == "course-v1:TestX+CS101+2024"
         assert resp.data["kwargs"]["cohort_id"] == 1  # Should be converted to int
 
+    def test_bulk_add_users_to_cohort_runs_small_inputs_inline(self, api_factory):
+        """Test that small bulk cohort assignments run within the request"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"post": "bulk_add_users_to_cohort"})
+        req = api_factory.post(
+            "/owly-courses/cohorts/members/bulk_add/",
+            {
+                "course_id": "course-v1:TestX+CS101+2024",
+                "cohort_id": 1,
+                "csv": "email,name\nana@example.com,Ana\n\nbob@example.com,Bob\n"
+            },
+            format="json"
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "bulk_add_users_to_cohort_logic"
+        assert resp.data["kwargs"]["user_identifiers"] == ["ana@example.com", "bob@example.com"]
+
+    @pytest.mark.django_db
+    def test_bulk_add_users_to_cohort_enqueues_large_inputs(self, api_factory, settings):
+        """Test that bulk cohort assignments above the sync limit become async jobs"""
+        from openedx_owly_apis.cohort_jobs import get_cohort_assignment_job, update_cohort_assignment_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        settings.OWLY_COHORT_BULK_SYNC_LIMIT = 2
+        view = OpenedXCourseViewSet.as_view({"post": "bulk_add_users_to_cohort"})
+        req = api_factory.post(
+            "/owly-courses/cohorts/members/bulk_add/",
+            {
+                "course_id": "course-v1:TestX+CS101+2024",
+                "cohort_id": 3,
+                "user_identifiers": ["ana", "bob", "42"]
+            },
+            format="json"
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = view(req)
+        assert resp.status_code == 202
+        assert resp.data["user_count"] == 3
+        assert resp.data["queue"] == "interactive"
+
+        job = get_cohort_assignment_job(resp.data["job_id"])
+        assert job["cohort_id"] == 3
+        assert job["task_id"] == "stub-task-id"
+
+        update_cohort_assignment_job(
+            job["job_id"],
+            status="success",
+            result={"success": True, "added": 2, "results": [{"identifier": "ana"}, {"identifier": "bob"}]},
+        )
+        status_view = OpenedXCourseViewSet.as_view({"get": "get_cohort_assignment_job"})
+        req = api_factory.get(f"/owly-courses/cohorts/jobs/{job['job_id']}/")
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = status_view(req, job_id=job["job_id"])
+        assert resp.status_code == 200
+        assert resp.data["result_summary"] == {"success": True, "added": 2, "results_count": 2}
+
+        result_view = OpenedXCourseViewSet.as_view({"get": "get_cohort_assignment_job_result"})
+        req = api_factory.get(f"/owly-courses/cohorts/jobs/{job['job_id']}/result/", {"page_size": 1})
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = result_view(req, job_id=job["job_id"])
+        assert resp.status_code == 200
+        assert resp.data["section"] == "results"
+        assert resp.data["items"] == [{"identifier": "ana"}]
+
+    @pytest.mark.django_db
+    def test_cohort_job_is_hidden_from_org_course_creators(self, api_factory):
+        """Test that cohort job status and results need course staff, not just course creator"""
+        from openedx_owly_apis.cohort_jobs import create_cohort_assignment_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        job = create_cohort_assignment_job("course-v1:TestX+CS101+2024", 3, 250, user_identifier=99)
+        for action_name, suffix in (("get_cohort_assignment_job", ""), ("get_cohort_assignment_job_result", "result/")):
+            view = OpenedXCourseViewSet.as_view({"get": action_name})
+            req = api_factory.get(f"/owly-courses/cohorts/jobs/{job['job_id']}/{suffix}")
+            force_authenticate(req, user=_auth_user(is_course_creator=True))
+            assert view(req, job_id=job["job_id"]).status_code == 403
+
+        status_view = OpenedXCourseViewSet.as_view({"get": "get_cohort_assignment_job"})
+        req = api_factory.get(f"/owly-courses/cohorts/jobs/{job['job_id']}/")
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        assert status_view(req, job_id=job["job_id"]).status_code == 200
+
+    def test_bulk_add_users_to_cohort_requires_one_input(self, api_factory):
+        """Test that bulk cohort assignment needs exactly one of user_identifiers or csv"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"post": "bulk_add_users_to_cohort"})
+        req = api_factory.post(
+            "/owly-courses/cohorts/members/bulk_add/",
+            {"course_id": "course-v1:TestX+CS101+2024", "cohort_id": 1},
+            format="json"
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        assert view(req).status_code == 400
+
+    def test_bulk_move_cohort_members_calls_logic(self, api_factory):
+        """Test moving users between cohorts and removing them when no target is given"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"post": "bulk_move_cohort_members"})
+        req = api_factory.post(
+            "/owly-courses/cohorts/members/bulk_move/",
+            {
+                "course_id": "course-v1:TestX+CS101+2024",
+                "source_cohort_id": 1,
+                "target_cohort_id": 2,
+                "user_identifiers": ["ana", "bob"]
+            },
+            format="json"
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "bulk_move_cohort_members_logic"
+        assert resp.data["kwargs"]["source_cohort_id"] == 1
+        assert resp.data["kwargs"]["target_cohort_id"] == 2
+
+        req = api_factory.post(
+            "/owly-courses/cohorts/members/bulk_move/",
+            {"course_id": "course-v1:TestX+CS101+2024", "source_cohort_id": 1, "csv": "ana\n"},
+            format="json"
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["kwargs"]["target_cohort_id"] is None
+        assert resp.data["kwargs"]["user_identifiers"] == ["ana"]
+
+    def test_bulk_move_cohort_members_rejects_same_cohort_and_large_rosters(self, api_factory):
+        """Test that moves need distinct cohorts and stay within the per-request limit"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"post": "bulk_move_cohort_members"})
+        for payload in (
+            {"source_cohort_id": 1, "target_cohort_id": 1, "user_identifiers": ["ana"]},
+            {"source_cohort_id": 1, "user_identifiers": [f"user{index}" for index in range(2001)]},
+        ):
+            req = api_factory.post(
+                "/owly-courses/cohorts/members/bulk_move/",
+                {"course_id": "course-v1:TestX+CS101+2024", **payload},
+                format="json"
+            )
+            force_authenticate(req, user=_auth_user(is_course_staff=True))
+            assert view(req).status_code == 400
+
+    def test_list_cohort_members_passes_cursor_and_page_size(self, api_factory):
+        """Test that cohort member listing forwards cursor pagination parameters"""
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+        view = OpenedXCourseViewSet.as_view({"get": "list_cohort_members"})
+        req = api_factory.get(
+            "/owly-courses/cohorts/members/list/",
+            {
+                "course_id": "course-v1:TestX+CS101+2024",
+                "cohort_id": "1",
+                "cursor": "250",
+                "page_size": "50"
+            }
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["kwargs"]["cursor"] == 250
+        assert resp.data["kwargs"]["page_size"] == 50
+
+        req = api_factory.get(
+            "/owly-courses/cohorts/members/list/",
+            {"course_id": "course-v1:TestX+CS101+2024", "cohort_id": "1", "page_size": "5000"}
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        assert view(req).status_code == 400
+
     def test_list_cohort_members_missing_parameters_returns_error(self, api_factory):
         """Test that missing required parameters return 400 errors"""
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
@@ -1197,6 +1485,7 @@ class TestOpenedXCourseViewSet:
         assert resp.data["called"] == "publish_content_logic"
         assert resp.data["kwargs"]["content_id"] == "block-v1:ORG+NUM+RUN+type@vertical+block@unit1"
 
+    @pytest.mark.django_db
     def test_publish_content_async_enqueues_job(self, api_factory):
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
 
@@ -1241,6 +1530,7 @@ class TestOpenedXCourseViewSet:
         assert resp.data["called"] == "publish_content_logic"
         assert resp.data["kwargs"]["content_id"] == "course-v1:ORG+NUM+RUN"
 
+    @pytest.mark.django_db
     def test_get_publish_content_job_returns_cached_job(self, api_factory):
         from openedx_owly_apis.publish_jobs import create_publish_content_job, update_publish_content_job
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
@@ -1268,6 +1558,7 @@ class TestOpenedXCourseViewSet:
         assert resp.data["status"] == "success"
         assert resp.data["success"] is True
 
+    @pytest.mark.django_db
     def test_get_publish_content_job_returns_404_for_missing_job(self, api_factory):
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
 
@@ -1280,6 +1571,181 @@ class TestOpenedXCourseViewSet:
         assert resp.status_code == 404
         assert resp.data["error_code"] == "job_not_found"
 
+    @pytest.mark.django_db
+    def test_get_structure_job_long_poll_returns_newer_state(self, api_factory):
+        from openedx_owly_apis.course_structure_jobs import create_course_structure_job, update_course_structure_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        job = create_course_structure_job(course_id="course-v1:ORG+NUM+RUN", user_identifier=1)
+        update_course_structure_job(job["job_id"], status="running", progress_message="Creating course structure")
+
+        view = OpenedXCourseViewSet.as_view({"get": "get_structure_job"})
+        req = api_factory.get(
+            f"/owly-courses/structure/jobs/{job['job_id']}/",
+            {"wait": 30, "since": job["updated_at"]},
+        )
+        force_authenticate(req, user=_auth_user())
+        resp = view(req, job_id=job["job_id"])
+
+        assert resp.status_code == 200
+        assert resp.data["status"] == "running"
+        assert resp.data["updated_at"] != job["updated_at"]
+
+    def test_get_structure_job_rejects_excessive_wait(self, api_factory):
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        view = OpenedXCourseViewSet.as_view({"get": "get_structure_job"})
+        req = api_factory.get("/owly-courses/structure/jobs/any/", {"wait": 300})
+        force_authenticate(req, user=_auth_user())
+        resp = view(req, job_id="any")
+
+        assert resp.status_code == 400
+        assert "wait" in resp.data["error_detail"]["details"]
+
+    @pytest.mark.django_db
+    def test_stream_publish_content_job_sends_status_events(self, api_factory):
+        from openedx_owly_apis.publish_jobs import create_publish_content_job, update_publish_content_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        job = create_publish_content_job(
+            content_id="course-v1:ORG+NUM+RUN",
+            user_identifier=1,
+            course_id="course-v1:ORG+NUM+RUN",
+        )
+        update_publish_content_job(job["job_id"], status="success")
+
+        view = OpenedXCourseViewSet.as_view(
+            {"get": "stream_publish_content_job"}, **OpenedXCourseViewSet.stream_publish_content_job.kwargs
+        )
+        req = api_factory.get(
+            f"/owly-courses/content/publish/jobs/{job['job_id']}/stream/",
+            HTTP_ACCEPT="text/event-stream",
+        )
+        force_authenticate(req, user=_auth_user())
+        resp = view(req, job_id=job["job_id"])
+        body = b"".join(resp.streaming_content).decode()
+
+        assert resp.status_code == 200
+        assert resp["Content-Type"] == "text/event-stream"
+        assert body.startswith("event: status\n")
+        assert f'"job_id": "{job["job_id"]}"' in body
+        assert '"status": "success"' in body
+
+    @pytest.mark.django_db
+    def test_stream_structure_job_missing_job_renders_error_event(self, api_factory):
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        view = OpenedXCourseViewSet.as_view(
+            {"get": "stream_structure_job"}, **OpenedXCourseViewSet.stream_structure_job.kwargs
+        )
+        req = api_factory.get("/owly-courses/structure/jobs/missing/stream/", HTTP_ACCEPT="text/event-stream")
+        force_authenticate(req, user=_auth_user())
+        resp = view(req, job_id="missing")
+        resp.render()
+
+        assert resp.status_code == 404
+        assert resp.content.decode().startswith("event: error\n")
+
+    @pytest.mark.django_db
+    def test_get_structure_job_result_paginates_created_structure(self, api_factory, settings):
+        from openedx_owly_apis.course_structure_jobs import create_course_structure_job, update_course_structure_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        settings.ROOT_URLCONF = "openedx_owly_apis.urls"
+        job = create_course_structure_job(course_id="course-v1:ORG+NUM+RUN", user_identifier=1)
+        created = [{"type": "vertical", "display_name": f"Unit {index}"} for index in range(3)]
+        update_course_structure_job(
+            job["job_id"],
+            status="success",
+            result={"success": True, "created_structure": created},
+        )
+
+        status_view = OpenedXCourseViewSet.as_view({"get": "get_structure_job"}, basename="owly-courses")
+        req = api_factory.get(f"/owly-courses/structure/jobs/{job['job_id']}/")
+        force_authenticate(req, user=_auth_user())
+        resp = status_view(req, job_id=job["job_id"])
+
+        assert resp.status_code == 200
+        assert "result" not in resp.data
+        assert resp.data["result_summary"] == {"success": True, "created_structure_count": 3}
+        assert resp.data["result_url"].endswith(f"/owly-courses/structure/jobs/{job['job_id']}/result/")
+
+        result_view = OpenedXCourseViewSet.as_view({"get": "get_structure_job_result"})
+        req = api_factory.get(resp.data["result_url"], {"page": 2, "page_size": 2})
+        force_authenticate(req, user=_auth_user())
+        resp = result_view(req, job_id=job["job_id"])
+
+        assert resp.status_code == 200
+        assert resp.data["section"] == "created_structure"
+        assert resp.data["items"] == created[2:]
+        assert resp.data["count"] == 3
+        assert resp.data["num_pages"] == 2
+
+    @pytest.mark.django_db
+    def test_get_publish_content_job_result_returns_404_until_finished(self, api_factory):
+        from openedx_owly_apis.publish_jobs import create_publish_content_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        job = create_publish_content_job(
+            content_id="course-v1:ORG+NUM+RUN",
+            user_identifier=1,
+            course_id="course-v1:ORG+NUM+RUN",
+        )
+
+        view = OpenedXCourseViewSet.as_view({"get": "get_publish_content_job_result"})
+        req = api_factory.get(f"/owly-courses/content/publish/jobs/{job['job_id']}/result/")
+        force_authenticate(req, user=_auth_user())
+        resp = view(req, job_id=job["job_id"])
+
+        assert resp.status_code == 404
+        assert resp.data["error_code"] == "job_result_not_found"
+
+    @pytest.mark.django_db
+    def test_list_async_jobs_filters_by_course_and_status(self, api_factory):
+        from openedx_owly_apis.course_structure_jobs import create_course_structure_job, update_course_structure_job
+        from openedx_owly_apis.publish_jobs import create_publish_content_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        done = create_course_structure_job(course_id="course-v1:ORG+NUM+RUN", user_identifier=2)
+        update_course_structure_job(done["job_id"], status="success")
+        create_course_structure_job(course_id="course-v1:ORG+NUM+RUN", user_identifier=2)
+        create_publish_content_job(
+            content_id="course-v1:ORG+OTHER+RUN",
+            user_identifier=2,
+            course_id="course-v1:ORG+OTHER+RUN",
+        )
+
+        view = OpenedXCourseViewSet.as_view({"get": "list_async_jobs"})
+        req = api_factory.get(
+            "/owly-courses/jobs/",
+            {"course_id": "course-v1:ORG+NUM+RUN", "status": "success"},
+        )
+        force_authenticate(req, user=_auth_user(is_course_staff=True))
+        resp = view(req)
+
+        assert resp.status_code == 200
+        assert resp.data["count"] == 1
+        assert resp.data["jobs"][0]["job_id"] == done["job_id"]
+        assert resp.data["jobs"][0]["job_type"] == "course_structure"
+        assert "result" not in resp.data["jobs"][0]
+
+    @pytest.mark.django_db
+    def test_list_async_jobs_without_course_only_returns_own_jobs(self, api_factory):
+        from openedx_owly_apis.course_structure_jobs import create_course_structure_job
+        from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
+
+        own = create_course_structure_job(course_id="course-v1:ORG+NUM+RUN", user_identifier=1)
+        create_course_structure_job(course_id="course-v1:ORG+NUM+RUN", user_identifier=2)
+
+        view = OpenedXCourseViewSet.as_view({"get": "list_async_jobs"})
+        req = api_factory.get("/owly-courses/jobs/", {"page_size": 10})
+        force_authenticate(req, user=_auth_user(is_course_creator=True))
+        resp = view(req)
+
+        assert resp.status_code == 200
+        assert [job["job_id"] for job in resp.data["jobs"]] == [own["job_id"]]
+        assert resp.data["page_size"] == 10
+
     def test_delete_xblock_calls_logic(self, api_factory):
         """Test deleting an xblock component"""
         from openedx_owly_apis.views.v1.courses import OpenedXCourseViewSet
@@ -1406,6 +1872,7 @@ class TestOpenedXAnalyticsViewSet:
         assert resp.data["called"] == "get_overview_analytics_logic"
         assert resp.data["kwargs"]["course_id"] == "course-v1:ORG+NUM+RUN"
 
+    @pytest.mark.django_db
     def test_enrollments_calls_logic(self, api_factory):
         from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
         view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollments"})
@@ -1416,6 +1883,264 @@ class TestOpenedXAnalyticsViewSet:
         assert resp.status_code == 200
         assert resp.data["called"] == "get_enrollments_analytics_logic"
 
+    @pytest.mark.django_db
+    def test_enrollments_snapshot_can_skip_attributes(self, api_factory):
+        from openedx_owly_apis.analytics_cache import get_course_version
+        from openedx_owly_apis.analytics_snapshots import store_analytics_snapshot
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+
+        store_analytics_snapshot("course-v1:ORG+NUM+RUN", "enrollments", {
+            "course_id": "course-v1:ORG+NUM+RUN",
+            "enrollment_attributes": [{"namespace": "credit", "name": "provider_id", "count": 3}],
+        }, get_course_version("course-v1:ORG+NUM+RUN"))
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollments"})
+
+        req = api_factory.get("/owly-analytics/enrollments/", {"course_id": "course-v1:ORG+NUM+RUN"})
+        force_authenticate(req, user=_auth_user())
+        assert "enrollment_attributes" in view(req).data
+
+        req = api_factory.get(
+            "/owly-analytics/enrollments/",
+            {"course_id": "course-v1:ORG+NUM+RUN", "include_attributes": "false"},
+        )
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert "snapshot_at" in resp.data
+        assert "enrollment_attributes" not in resp.data
+
+        req = api_factory.get(
+            "/owly-analytics/enrollments/",
+            {"course_id": "course-v1:ORG+NUM+RUN", "include_attributes": "false", "fresh": "true"},
+        )
+        force_authenticate(req, user=_auth_user())
+        assert view(req).data["kwargs"]["include_attributes"] is False
+
+    def test_enrollment_attributes_calls_logic(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollment_attributes"})
+        req = api_factory.get(
+            "/owly-analytics/enrollments/attributes/",
+            {"course_id": "course-v1:ORG+NUM+RUN", "namespace": "credit", "name": "provider_id", "limit": "5"},
+        )
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "get_enrollment_attributes_analytics_logic"
+        assert resp.data["kwargs"]["namespace"] == "credit"
+        assert resp.data["kwargs"]["name"] == "provider_id"
+        assert resp.data["kwargs"]["limit"] == 5
+
+    def test_enrollment_attributes_name_requires_namespace(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollment_attributes"})
+        req = api_factory.get(
+            "/owly-analytics/enrollments/attributes/",
+            {"course_id": "course-v1:ORG+NUM+RUN", "name": "provider_id"},
+        )
+        force_authenticate(req, user=_auth_user())
+        assert view(req).status_code == 400
+
+    def test_detailed_passes_timing_flag(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_detailed"})
+        req = api_factory.get("/owly-analytics/detailed/", {"course_id": "course-v1:ORG+NUM+RUN", "timing": "true"})
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "get_detailed_analytics_logic"
+        assert resp.data["kwargs"]["include_timing"] is True
+
+    @pytest.mark.django_db
+    def test_detailed_serves_snapshot_unless_fresh(self, api_factory):
+        from openedx_owly_apis.analytics_cache import get_course_version
+        from openedx_owly_apis.analytics_snapshots import store_analytics_snapshot
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+
+        store_analytics_snapshot(
+            "course-v1:ORG+NUM+RUN", "detailed", {"course_id": "course-v1:ORG+NUM+RUN"},
+            get_course_version("course-v1:ORG+NUM+RUN"),
+        )
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_detailed"})
+
+        req = api_factory.get("/owly-analytics/detailed/", {"course_id": "course-v1:ORG+NUM+RUN"})
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert resp.status_code == 200
+        assert "called" not in resp.data
+        assert resp.data["snapshot_at"]
+
+        req = api_factory.get("/owly-analytics/detailed/", {"course_id": "course-v1:ORG+NUM+RUN", "fresh": "true"})
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "get_detailed_analytics_logic"
+
+    @pytest.mark.django_db
+    def test_fresh_analytics_bypass_the_analytics_cache(self, api_factory, monkeypatch):
+        from openedx_owly_apis.analytics_cache import cache_course_analytics
+        from openedx_owly_apis.views.v1 import analytics as analytics_views
+
+        calls = []
+
+        @cache_course_analytics("enrollments")
+        def enrollments_logic(course_id=None, include_attributes=True):  # pylint: disable=unused-argument
+            calls.append(course_id)
+            return {"course_id": course_id, "computed": len(calls)}
+
+        monkeypatch.setattr(analytics_views, "get_enrollments_analytics_logic", enrollments_logic)
+        view = analytics_views.OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollments"})
+
+        def _get(**params):
+            req = api_factory.get("/owly-analytics/enrollments/", {"course_id": "course-v1:ORG+NUM+RUN", **params})
+            force_authenticate(req, user=_auth_user())
+            return view(req).data
+
+        assert _get()["computed"] == 1
+        assert _get()["computed"] == 1
+        fresh = _get(fresh="true")
+        assert fresh["computed"] == 2
+        assert "cached_at" not in fresh
+
+    def test_overview_batch_accepts_comma_separated_course_ids(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_overview_batch"})
+        req = api_factory.get(
+            "/owly-analytics/overview/batch/",
+            {"course_ids": "course-v1:ORG+NUM+RUN,course-v1:ORG+NUM+RUN2"},
+        )
+        force_authenticate(req, user=_auth_user(is_staff=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "get_batch_overview_analytics_logic"
+        assert resp.data["kwargs"]["course_ids"] == ["course-v1:ORG+NUM+RUN", "course-v1:ORG+NUM+RUN2"]
+
+    def test_overview_batch_post_by_org(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+        view = OpenedXAnalyticsViewSet.as_view({"post": "analytics_overview_batch"})
+        req = api_factory.post("/owly-analytics/overview/batch/", {"org": "ORG"}, format="json")
+        force_authenticate(req, user=_auth_user(is_staff=True))
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["kwargs"] == {"course_ids": None, "org": "ORG"}
+
+    def test_overview_batch_requires_courses_or_org(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_overview_batch"})
+        req = api_factory.get("/owly-analytics/overview/batch/")
+        force_authenticate(req, user=_auth_user(is_staff=True))
+        resp = view(req)
+        assert resp.status_code == 400
+
+    @pytest.mark.parametrize("export_format, content_type", [
+        ("csv", "text/csv; charset=utf-8"),
+        ("ndjson", "application/x-ndjson"),
+    ])
+    def test_enrollments_export_streams_rows(self, api_factory, monkeypatch, export_format, content_type):
+        import datetime
+        import json
+
+        from openedx_owly_apis.views.v1 import analytics as analytics_views
+
+        def _rows():
+            yield {
+                "user_id": 7,
+                "username": "learner",
+                "mode": "verified",
+                "is_active": True,
+                "created": datetime.datetime(2026, 1, 2, 3, 4, 5),
+                "attributes": {"credit:provider_id": "asu"},
+            }
+
+        monkeypatch.setattr(analytics_views, "get_enrollment_export_logic", lambda course_id: {
+            "success": True,
+            "course_id": course_id,
+            "columns": ["user_id", "username", "mode", "is_active", "created", "attributes"],
+            "rows": _rows(),
+        })
+        view = analytics_views.OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollments_export"})
+        req = api_factory.get(
+            "/owly-analytics/enrollments/export/",
+            {"course_id": "course-v1:ORG+NUM+RUN", "export_format": export_format},
+        )
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        body = b"".join(resp.streaming_content).decode()
+
+        assert resp.status_code == 200
+        assert resp["Content-Type"] == content_type
+        assert f'filename="enrollments-course-v1_ORG_NUM_RUN.{export_format}"' in resp["Content-Disposition"]
+        if export_format == "csv":
+            assert body.splitlines() == [
+                "user_id,username,mode,is_active,created,attributes",
+                '7,learner,verified,True,2026-01-02T03:04:05,"{""credit:provider_id"": ""asu""}"',
+            ]
+        else:
+            assert json.loads(body.splitlines()[0])["attributes"] == {"credit:provider_id": "asu"}
+
+    def test_enrollments_export_returns_logic_errors(self, api_factory, monkeypatch):
+        from openedx_owly_apis.views.v1 import analytics as analytics_views
+
+        monkeypatch.setattr(analytics_views, "get_enrollment_export_logic", lambda course_id: {
+            "error": "course_not_found",
+            "message": "Course not found",
+        })
+        view = analytics_views.OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollments_export"})
+        req = api_factory.get("/owly-analytics/enrollments/export/", {"course_id": "course-v1:ORG+NUM+RUN"})
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+
+        assert resp.status_code == 400
+        assert resp.data["error_code"] == "course_not_found"
+
+    def test_progress_calls_logic_with_bins(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet as V
+        view = V.as_view({"get": "analytics_progress"})
+        req = api_factory.get("/owly-analytics/progress/", {"course_id": "course-v1:ORG+NUM+RUN", "bins": "5"})
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "get_progress_distribution_logic"
+        assert resp.data["kwargs"]["bins"] == 5
+
+    def test_progress_rejects_invalid_bins(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet as V
+        view = V.as_view({"get": "analytics_progress"})
+        req = api_factory.get("/owly-analytics/progress/", {"course_id": "course-v1:ORG+NUM+RUN", "bins": "0"})
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert resp.status_code == 400
+
+    def test_enrollments_timeseries_calls_logic(self, api_factory):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollments_timeseries"})
+        req = api_factory.get(
+            "/owly-analytics/enrollments/timeseries/",
+            {"course_id": "course-v1:ORG+NUM+RUN", "start": "2026-01-01", "end": "2026-03-31", "interval": "week"},
+        )
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert resp.status_code == 200
+        assert resp.data["called"] == "get_enrollment_timeseries_logic"
+        assert str(resp.data["kwargs"]["start"]) == "2026-01-01"
+        assert resp.data["kwargs"]["interval"] == "week"
+
+    @pytest.mark.parametrize("params, field", [
+        ({"start": "2026-03-01", "end": "2026-01-01"}, "start"),
+        ({"start": "2020-01-01", "end": "2026-01-01"}, "start"),
+        ({"interval": "month"}, "interval"),
+    ])
+    def test_enrollments_timeseries_rejects_invalid_range(self, api_factory, params, field):
+        from openedx_owly_apis.views.v1.analytics import OpenedXAnalyticsViewSet
+        view = OpenedXAnalyticsViewSet.as_view({"get": "analytics_enrollments_timeseries"})
+        req = api_factory.get(
+            "/owly-analytics/enrollments/timeseries/",
+            {"course_id": "course-v1:ORG+NUM+RUN", **params},
+        )
+        force_authenticate(req, user=_auth_user())
+        resp = view(req)
+        assert resp.status_code == 400
+        assert field in resp.data["error_detail"]["details"]
+
     def test_overview_returns_400_when_logic_reports_error(self, api_factory, monkeypatch):
         from openedx_owly_apis.views.v1 import analytics as analytics_views
 
@@ -1459,6 +2184,28 @@ class TestOpenedXRolesViewSet:
         assert resp2.status_code == 200
         assert resp2.data["effective_role"] == "SuperAdmin"
 
+    def test_me_resolves_many_courses(self, api_factory):
+        """Test /me with several course_ids returns an effective role per course"""
+        from openedx_owly_apis.views.v1.roles import OpenedXRolesViewSet
+        view = OpenedXRolesViewSet.as_view({"get": "me"})
+        user = _auth_user(is_course_staff=True)
+        req = api_factory.get(
+            "/owly-roles/me/",
+            {"course_ids": ["course-v1:ORG+A+RUN,course-v1:ORG+B+RUN", "course-v1:ORG+A+RUN"]},
+        )
+        force_authenticate(req, user=user)
+        resp = view(req)
+        assert resp.status_code == 200
+        assert [course["course_id"] for course in resp.data["courses"]] == [
+            "course-v1:ORG+A+RUN", "course-v1:ORG+B+RUN"
+        ]
+        assert all(course["effective_role"] == "CourseStaff" for course in resp.data["courses"])
+        assert resp.data["roles"]["course_staff"] is False
+
+        req = api_factory.get("/owly-roles/me/?course_ids=course-v1:ORG+A+RUN,invalid-format")
+        force_authenticate(req, user=user)
+        assert view(req).status_code == 400
+
     def test_me_invalid_course_id(self, api_factory):
         """Test /me endpoint with invalid course_id format"""
         from openedx_owly_apis.views.v1.roles import OpenedXRolesViewSet